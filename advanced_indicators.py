@@ -1,6 +1,47 @@
 import pandas as pd
 import numpy as np
-import streamlit as st
+import diagnostics
+
+
+def _segment_cumsum(values, starts, lengths):
+    """
+    Cumulative sum restarting at every segment start
+    
+    Matches pandas Series.cumsum per segment: NaN is skipped but stays NaN in the
+    output. Segments holding +/-inf are summed on their own so they cannot leak
+    into their neighbours through the shared running total.
+    """
+    missing = np.isnan(values)
+    filled = np.where(np.isfinite(values), values, 0.0)
+    total = np.cumsum(filled)
+    offsets = total[starts] - filled[starts]
+    result = total - np.repeat(offsets, lengths)
+    
+    infinite = np.flatnonzero(np.isinf(values))
+    if len(infinite):
+        for segment in np.unique(np.searchsorted(starts, infinite, side='right') - 1):
+            rows = slice(starts[segment], starts[segment] + lengths[segment])
+            result[rows] = np.cumsum(np.where(missing[rows], 0.0, values[rows]))
+    
+    result[missing] = np.nan
+    return result
+
+
+def _segment_rolling_mean(values, starts, lengths, window):
+    """Trailing mean over `window` rows within each segment, NaN until the window is full"""
+    segment_start = np.repeat(starts, lengths)
+    position = np.arange(len(values))
+    
+    sums = np.concatenate(([0.0], np.cumsum(np.nan_to_num(values, nan=0.0))))
+    gaps = np.concatenate(([0], np.cumsum(np.isnan(values))))
+    lo = position - window + 1
+    full = lo >= segment_start
+    lo = np.maximum(lo, segment_start)
+    
+    means = (sums[position + 1] - sums[lo]) / window
+    means[~full | (gaps[position + 1] - gaps[lo] > 0)] = np.nan
+    return means
+
 
 class AdvancedIndicators:
     """
@@ -24,7 +65,7 @@ class AdvancedIndicators:
             
             return rsi.fillna(50)
         except Exception as e:
-            st.error(f"RSI hesaplama hatası: {str(e)}")
+            diagnostics.error(f"RSI hesaplama hatası: {str(e)}")
             return pd.Series([50] * len(prices), index=prices.index)
     
     def calculate_macd(self, prices, fast=12, slow=26, signal=9):
@@ -45,7 +86,7 @@ class AdvancedIndicators:
                 'histogram': histogram
             }
         except Exception as e:
-            st.error(f"MACD hesaplama hatası: {str(e)}")
+            diagnostics.error(f"MACD hesaplama hatası: {str(e)}")
             return {
                 'macd': pd.Series([0] * len(prices), index=prices.index),
                 'signal': pd.Series([0] * len(prices), index=prices.index),
@@ -92,53 +133,106 @@ class AdvancedIndicators:
             
             return position_analysis
         except Exception as e:
-            st.error(f"Fiyat pozisyon analizi hatası: {str(e)}")
+            diagnostics.error(f"Fiyat pozisyon analizi hatası: {str(e)}")
             return {'position_strength': 0, 'ema_distances': {}}
     
+    def calculate_obv(self, prices, volume):
+        """
+        On-Balance Volume: cumulative volume signed by the close-to-close direction
+        """
+        direction = np.sign(prices.diff()).fillna(0)
+        signed_volume = direction * volume
+        signed_volume.iloc[:1] = volume.iloc[:1]
+        return signed_volume.cumsum()
+    
+    def calculate_vpt(self, prices, volume):
+        """
+        Volume-Price Trend: cumulative volume weighted by percentage price change
+        """
+        return (volume * prices.pct_change()).cumsum()
+    
+    def _volume_summary(self, volume, volume_sma, vpt, obv):
+        current_volume = volume.iloc[-1]
+        avg_volume = volume_sma.iloc[-1]
+        volume_strength = current_volume / avg_volume if avg_volume > 0 else 1
+        
+        return {
+            'volume_ratio': volume / volume_sma,
+            'volume_strength': volume_strength,
+            'vpt': vpt,
+            'obv': obv,
+            'volume_trend': 'Yüksek' if volume_strength > 1.5 else 'Normal' if volume_strength > 0.8 else 'Düşük'
+        }
+    
     def analyze_volume(self, volume, prices, period=20):
         """
         Advanced volume analysis
         """
         try:
             volume_sma = volume.rolling(window=period).mean()
-            volume_ratio = volume / volume_sma
-            
-            # Volume-Price Trend (VPT)
-            price_change = prices.pct_change()
-            vpt = (volume * price_change).cumsum()
-            
-            # On-Balance Volume (OBV)
-            obv = []
-            obv_value = 0
+            return self._volume_summary(volume, volume_sma,
+                                        self.calculate_vpt(prices, volume),
+                                        self.calculate_obv(prices, volume))
+        except Exception as e:
+            diagnostics.error(f"Hacim analizi hatası: {str(e)}")
+            return {'volume_strength': 1, 'volume_trend': 'Normal'}
+    
+    def analyze_volume_batch(self, data_by_symbol, period=20):
+        """
+        Volume analysis for many symbols at once
+        
+        All series are concatenated into flat arrays with per-symbol offsets, so
+        OBV, VPT and the volume SMA are a few segmented cumulative sums over the
+        whole batch instead of separate pandas pipelines per symbol. Series may
+        have different lengths and indexes.
+        
+        Args:
+            data_by_symbol (dict): symbol -> OHLCV DataFrame (needs 'Close' and 'Volume')
+            period (int): Volume SMA window
+        
+        Returns:
+            dict: symbol -> analyze_volume() result (symbols without data are left out)
+        """
+        frames = {symbol: data for symbol, data in data_by_symbol.items()
+                  if data is not None and not data.empty}
+        if not frames:
+            return {}
+        
+        try:
+            lengths = np.array([len(data) for data in frames.values()])
+            starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+            close = np.concatenate([data['Close'].to_numpy(dtype=float) for data in frames.values()])
+            volume = np.concatenate([data['Volume'].to_numpy(dtype=float) for data in frames.values()])
             
-            for i in range(len(prices)):
-                if i == 0:
-                    obv.append(volume.iloc[i])
-                    obv_value = volume.iloc[i]
-                else:
-                    if prices.iloc[i] > prices.iloc[i-1]:
-                        obv_value += volume.iloc[i]
-                    elif prices.iloc[i] < prices.iloc[i-1]:
-                        obv_value -= volume.iloc[i]
-                    obv.append(obv_value)
+            # Close-to-close change within each symbol (first bar of each symbol has none)
+            prev_close = np.roll(close, 1)
+            prev_close[starts] = np.nan
+            price_diff = close - prev_close
             
-            obv_series = pd.Series(obv, index=volume.index)
+            signed_volume = np.where(np.isnan(price_diff), 0.0, np.sign(price_diff)) * volume
+            signed_volume[starts] = volume[starts]
+            obv = _segment_cumsum(signed_volume, starts, lengths)
             
-            # Volume analysis
-            current_volume = volume.iloc[-1]
-            avg_volume = volume_sma.iloc[-1]
-            volume_strength = current_volume / avg_volume if avg_volume > 0 else 1
+            with np.errstate(divide='ignore', invalid='ignore'):
+                vpt = _segment_cumsum(volume * (price_diff / prev_close), starts, lengths)
             
-            return {
-                'volume_ratio': volume_ratio,
-                'volume_strength': volume_strength,
-                'vpt': vpt,
-                'obv': obv_series,
-                'volume_trend': 'Yüksek' if volume_strength > 1.5 else 'Normal' if volume_strength > 0.8 else 'Düşük'
-            }
+            volume_sma = _segment_rolling_mean(volume, starts, lengths, period)
         except Exception as e:
-            st.error(f"Hacim analizi hatası: {str(e)}")
-            return {'volume_strength': 1, 'volume_trend': 'Normal'}
+            diagnostics.error(f"Toplu hacim analizi hatası: {str(e)}")
+            return {symbol: self.analyze_volume(data['Volume'], data['Close'], period)
+                    for symbol, data in frames.items()}
+        
+        results = {}
+        for (symbol, data), lo, n in zip(frames.items(), starts, lengths):
+            rows = slice(lo, lo + n)
+            index = data.index
+            results[symbol] = self._volume_summary(
+                data['Volume'],
+                pd.Series(volume_sma[rows], index=index),
+                pd.Series(vpt[rows], index=index),
+                pd.Series(obv[rows], index=index)
+            )
+        return results
     
     def ema_sequence_analysis(self, ema_data):
         """
@@ -198,7 +292,7 @@ class AdvancedIndicators:
                 'sequence_quality': 'Mükemmel' if alignment_strength > 90 else 'Güçlü' if alignment_strength > 70 else 'Orta' if alignment_strength > 50 else 'Zayıf'
             }
         except Exception as e:
-            st.error(f"EMA sıralama analizi hatası: {str(e)}")
+            diagnostics.error(f"EMA sıralama analizi hatası: {str(e)}")
             return {'alignment_strength': 0, 'sequence_quality': 'Belirsiz'}
     
     def multi_timeframe_analysis(self, symbol, intervals, period, futures_fetcher):
@@ -214,11 +308,11 @@ class AdvancedIndicators:
                     if not data.empty:
                         timeframe_data[interval] = data
                 except Exception as e:
-                    st.warning(f"{interval} zaman dilimi verisi alınamadı: {str(e)}")
+                    diagnostics.warning(f"{interval} zaman dilimi verisi alınamadı: {str(e)}")
             
             return timeframe_data
         except Exception as e:
-            st.error(f"Multi-timeframe analiz hatası: {str(e)}")
+            diagnostics.error(f"Multi-timeframe analiz hatası: {str(e)}")
             return {}
     
     def calculate_confluence_score(self, ema_analysis, rsi, macd, volume_analysis, price_position):
@@ -286,5 +380,5 @@ class AdvancedIndicators:
                 'overall_bias': 'Bullish' if normalized_score > 60 else 'Bearish' if normalized_score < 40 else 'Neutral'
             }
         except Exception as e:
-            st.error(f"Confluence score hesaplama hatası: {str(e)}")
+            diagnostics.error(f"Confluence score hesaplama hatası: {str(e)}")
             return {'confluence_score': 50, 'signal_strength': 'Belirsiz', 'overall_bias': 'Neutral'}
\ No newline at end of file
@@ -2,8 +2,9 @@ import requests
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-import streamlit as st
+import diagnostics
 import time
+from fetch_coalescer import coalesced
 
 class AlternativeCryptoFetcher:
     """
@@ -14,6 +15,7 @@ class AlternativeCryptoFetcher:
         self.coingecko_base = "https://api.coingecko.com/api/v3"
         self.session = requests.Session()
         
+    @coalesced
     def get_klines(self, symbol, interval, period=None):
         """
         Get historical price data for crypto symbols
@@ -22,7 +24,7 @@ class AlternativeCryptoFetcher:
             # Convert symbol to CoinGecko format
             coin_id = self._symbol_to_coingecko_id(symbol)
             if not coin_id:
-                st.error(f"Desteklenmeyen sembol: {symbol}")
+                diagnostics.error(f"Desteklenmeyen sembol: {symbol}")
                 return pd.DataFrame()
             
             # Get days for the period
@@ -40,18 +42,18 @@ class AlternativeCryptoFetcher:
             response = self.session.get(url, params=params, timeout=15)
             
             if response.status_code == 429:
-                st.warning("API rate limit aşıldı, 60 saniye bekleyin...")
+                diagnostics.warning("API rate limit aşıldı, 60 saniye bekleyin...")
                 time.sleep(60)
                 response = self.session.get(url, params=params, timeout=15)
             
             if response.status_code != 200:
-                st.error(f"CoinGecko API hatası: {response.status_code}")
+                diagnostics.error(f"CoinGecko API hatası: {response.status_code}")
                 return pd.DataFrame()
             
             data = response.json()
             
             if 'prices' not in data:
-                st.error("Fiyat verisi bulunamadı")
+                diagnostics.error("Fiyat verisi bulunamadı")
                 return pd.DataFrame()
             
             # Convert to DataFrame
@@ -85,7 +87,7 @@ class AlternativeCryptoFetcher:
             return df
             
         except Exception as e:
-            st.error(f"Veri alırken hata: {str(e)}")
+            diagnostics.error(f"Veri alırken hata: {str(e)}")
             return pd.DataFrame()
     
     def _symbol_to_coingecko_id(self, symbol):
@@ -167,11 +169,11 @@ class AlternativeCryptoFetcher:
             if response.status_code == 200:
                 return True
             else:
-                st.error(f"CoinGecko API test başarısız: {response.status_code}")
+                diagnostics.error(f"CoinGecko API test başarısız: {response.status_code}")
                 return False
                 
         except Exception as e:
-            st.error(f"Bağlantı testi başarısız: {str(e)}")
+            diagnostics.error(f"Bağlantı testi başarısız: {str(e)}")
             return False
     
     def get_supported_symbols(self):
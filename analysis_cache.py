@@ -0,0 +1,218 @@
+"""
+FinansLab Paylaşımlı Analiz Önbelleği
+=====================================
+
+Süreç genelinde (tüm Streamlit oturumları) tek bir analiz önbelleği:
+- Anahtar: (symbol, period, timeframe, mode)
+- TTL: ilgili zaman diliminde mevcut barın kapanışına kadar
+- Boyut sınırlı LRU
+- Single-flight: aynı anahtar için eşzamanlı istekler tek hesaplama bekler
+- Her çağırana sonucun kendi kopyası verilir (oturumlar birbirinin sonucunu değiştiremez)
+"""
+
+import calendar
+import re
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+
+TIMEFRAME_PATTERN = re.compile(r'^(\d+)(m|h|d|w|M)$')
+UNIT_SECONDS = {'m': 60, 'h': 3600, 'd': 86400, 'w': 7 * 86400}
+# Unix epoch is a Thursday; weekly bars open on Monday 00:00 UTC
+WEEK_OFFSET = 4 * 86400
+
+
+def seconds_until_bar_close(timeframe, now=None, default=300):
+    """
+    Seconds until the current bar of the given timeframe closes (UTC aligned)
+
+    Args:
+        timeframe (str): '1m', '10m', '1h', '4h', '1d', '1w', '1M', ...
+        now (float): Epoch seconds (default: current time)
+        default (int): Fallback for unknown timeframes such as 'auto'
+
+    Returns:
+        float: Seconds until the bar close
+    """
+    now = time.time() if now is None else now
+    match = TIMEFRAME_PATTERN.match(str(timeframe))
+    if not match:
+        return default
+
+    count, unit = int(match.group(1)), match.group(2)
+
+    if unit == 'M':
+        current = datetime.fromtimestamp(now, tz=timezone.utc)
+        months = current.year * 12 + current.month - 1
+        close_months = (months // count + 1) * count
+        close_dt = datetime(close_months // 12, close_months % 12 + 1, 1, tzinfo=timezone.utc)
+        return calendar.timegm(close_dt.timetuple()) - now
+
+    length = count * UNIT_SECONDS[unit]
+    offset = WEEK_OFFSET if unit == 'w' else 0
+    next_close = ((now - offset) // length + 1) * length + offset
+    return next_close - now
+
+
+class SharedAnalysisCache:
+    """
+    Thread-safe LRU cache with per-entry expiry and single-flight computation
+    """
+
+    def __init__(self, max_entries=128, min_ttl=30):
+        self.max_entries = max_entries
+        self.min_ttl = min_ttl
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._inflight = {}            # key -> _Flight
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'coalesced': 0, 'evictions': 0}
+
+    @staticmethod
+    def _share(value):
+        """
+        Private copy of a cached value for one caller
+
+        Result dicts are copied one level deep: top-level DataFrames and nested dicts
+        are copied, anything deeper is shared and must be treated as read-only.
+        """
+        if isinstance(value, dict):
+            return {k: v.copy() if hasattr(v, 'copy') else v for k, v in value.items()}
+        return value.copy() if hasattr(value, 'copy') else value
+
+    def ttl_for(self, timeframe):
+        """TTL aligned to the close of the current bar"""
+        return max(self.min_ttl, seconds_until_bar_close(timeframe))
+
+    def _get_locked(self, key, now):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= now:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def get(self, key):
+        """Return the cached value or None"""
+        with self._lock:
+            entry = self._get_locked(key, time.time())
+            return self._share(entry[1]) if entry else None
+
+    def contains(self, key):
+        with self._lock:
+            return self._get_locked(key, time.time()) is not None
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._entries[key] = (time.time() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats['evictions'] += 1
+
+    def get_or_compute(self, key, compute, timeframe=None, ttl=None):
+        """
+        Return a cached value or compute it once for all concurrent callers
+
+        Args:
+            key (tuple): Cache key
+            compute (callable): Zero-argument function producing the value
+            timeframe (str): Used to align the TTL to the bar close
+            ttl (float): Explicit TTL in seconds (overrides timeframe)
+
+        Returns:
+            tuple: (value, from_cache) - value is a private copy (see _share);
+                None results are returned but not cached
+        """
+        with self._lock:
+            entry = self._get_locked(key, time.time())
+            if entry is not None:
+                self.stats['hits'] += 1
+                return self._share(entry[1]), True
+
+            flight = self._inflight.get(key)
+            if flight is None:
+                flight = _Flight()
+                self._inflight[key] = flight
+                leader = True
+                self.stats['misses'] += 1
+            else:
+                leader = False
+                self.stats['coalesced'] += 1
+
+        if not leader:
+            return self._share(flight.wait()), True
+
+        try:
+            value = compute()
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.fail(e)
+            raise
+
+        if value is not None:
+            self.set(key, value, ttl if ttl is not None else self.ttl_for(timeframe))
+
+        with self._lock:
+            self._inflight.pop(key, None)
+        flight.resolve(value)
+        # The stored value is shared with later callers, so the leader gets a copy as well
+        return self._share(value), False
+
+    def invalidate(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def keys(self):
+        """Keys of entries that have not expired yet"""
+        now = time.time()
+        with self._lock:
+            return [k for k, (expires_at, _) in self._entries.items() if expires_at > now]
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+
+class _Flight:
+    """Result holder shared by the leader and coalesced callers of one computation"""
+
+    def __init__(self):
+        self._done = threading.Event()
+        self._value = None
+        self._error = None
+
+    def resolve(self, value):
+        self._value = value
+        self._done.set()
+
+    def fail(self, error):
+        self._error = error
+        self._done.set()
+
+    def wait(self):
+        self._done.wait()
+        if self._error is not None:
+            raise self._error
+        return self._value
+
+
+_shared_cache = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_shared_analysis_cache():
+    """Process-wide analysis cache shared by every Streamlit session"""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = SharedAnalysisCache()
+        return _shared_cache
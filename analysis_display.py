@@ -5,99 +5,250 @@ def display_professional_analysis_results(symbol, current_price, overall_bias, b
                                          market_analysis, funding_cvd_analysis, institutional_analysis,
                                          risk_analysis, mtf_analysis, fvg_analysis, data, is_crypto, is_forex, analysis_mode="📊 Standart Analiz"):
     """
-    Professional card-based analysis results display
+    Professional card-based analysis results display (all results already available)
     """
+    display = ProgressiveAnalysisDisplay(symbol, is_crypto, is_forex, analysis_mode)
+    display.show_all({
+        'data': data, 'current_price': current_price, 'overall_bias': overall_bias,
+        'bias_strength': bias_strength, 'confluence': confluence, 'sentiment_analysis': sentiment_analysis,
+        'scalp_analysis': scalp_analysis, 'market_analysis': market_analysis,
+        'funding_cvd_analysis': funding_cvd_analysis, 'institutional_analysis': institutional_analysis,
+        'risk_analysis': risk_analysis, 'mtf_analysis': mtf_analysis, 'fvg_analysis': fvg_analysis
+    })
+
+class ProgressiveAnalysisDisplay:
+    """
+    Card layout that fills in as analysis components finish
     
-    # Scalp-specific display for timeframe-optimized trading
-    if "Scalp" in analysis_mode and scalp_analysis and 'trade_signals' in scalp_analysis:
-        st.markdown("### ⚡ Scalp Trading Sinyali")
-        
-        trade_signals = scalp_analysis['trade_signals']
-        action = trade_signals.get('action', 'HOLD')
-        confidence = trade_signals.get('confidence', 0)
+    Slots are reserved in the final order up front; update(name, value) receives
+    pipeline outputs one by one and renders every card whose inputs are complete.
+    The summary card is drawn as soon as its core inputs exist and redrawn when the
+    (slow, network-bound) multi-timeframe result arrives.
+    """
+    
+    SUMMARY_INPUTS = ('overall_bias', 'confluence', 'sentiment_analysis', 'scalp_analysis', 'risk_analysis')
+    
+    def __init__(self, symbol, is_crypto, is_forex, analysis_mode="📊 Standart Analiz"):
+        self.symbol = symbol
+        self.is_crypto = is_crypto
+        self.is_forex = is_forex
+        self.analysis_mode = analysis_mode
+        self.values = {}
+        self.slots = None
+    
+    def _create_slots(self):
+        self.slots = {
+            'scalp': st.empty(),
+            'fvg': st.empty(),
+            'summary': st.empty(),
+            'mtf': st.empty(),
+            'plan': st.empty()
+        }
+        col1, col2 = st.columns(2)
+        with col1:
+            self.slots['market'] = st.empty()
+        with col2:
+            self.slots['institutional'] = st.empty()
         
-        # Display main scalp signal
-        if action == 'LONG':
-            st.success(f"🟢 LONG Pozisyon | Güven: {confidence:.0f}%")
-        elif action == 'SHORT':
-            st.error(f"🔴 SHORT Pozisyon | Güven: {confidence:.0f}%")
+        self.slots['summary'].caption("⏳ Analiz özeti hazırlanıyor...")
+        self.slots['mtf'].caption("⏳ Multi-timeframe verileri yükleniyor...")
+        if self.is_crypto or self.is_forex:
+            self.slots['market'].caption("⏳ Piyasa göstergeleri yükleniyor...")
+        self.slots['institutional'].caption("⏳ Kurumsal seviyeler hesaplanıyor...")
+    
+    def update(self, name, value):
+        """Receive one component result (pipeline node name or analysis field)"""
+        if name == 'bias_results':
+            self.values['overall_bias'] = value.get('current_bias', value.get('overall_bias', 'neutral'))
+            self.values['bias_strength'] = value.get('bias_strength', 0)
+            name = 'overall_bias'
+        elif name == 'data':
+            self.values['data'] = value
+            self.values.setdefault('current_price', float(value['Close'].iloc[-1]))
         else:
-            st.warning(f"🟡 BEKLE | Sinyal Yok")
+            self.values[name] = value
         
-        # Show detailed trading levels if available
-        if trade_signals.get('entry_price'):
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                st.metric("Giriş", f"${trade_signals['entry_price']:.4f}")
-            with col2:
-                if trade_signals.get('stop_loss'):
-                    stop_pct = trade_signals.get('stop_pct', 0.3)
-                    st.metric("Stop Loss", f"${trade_signals['stop_loss']:.4f}")
-                    st.caption(f"Risk: {stop_pct:.2f}%")
-            with col3:
-                if trade_signals.get('take_profit_1'):
-                    tp1_pct = trade_signals.get('tp1_pct', 0.5)
-                    st.metric("TP1", f"${trade_signals['take_profit_1']:.4f}")
-                    st.caption(f"Hedef: {tp1_pct:.2f}%")
-            with col4:
-                if trade_signals.get('take_profit_2'):
-                    tp2_pct = trade_signals.get('tp2_pct', 0.9)
-                    st.metric("TP2", f"${trade_signals['take_profit_2']:.4f}")
-                    st.caption(f"Hedef: {tp2_pct:.2f}%")
-            
-            # Risk/Reward calculation
-            if trade_signals.get('stop_pct') and trade_signals.get('tp1_pct'):
-                rr_ratio = trade_signals['tp1_pct'] / trade_signals['stop_pct']
-                st.info(f"Risk/Ödül: 1:{rr_ratio:.1f} | Tavsiye Tutma: {trade_signals.get('hold_time', '5-30 dakika')}")
+        if self.slots is None:
+            if 'data' not in self.values:
+                return
+            self._create_slots()
+            # Results that arrived before the price data
+            for pending in list(self.values):
+                self._render(pending, summary=False)
+            if self._ready(self.SUMMARY_INPUTS):
+                self._render_summary()
+            return
         
-        st.markdown("---")
-    
-    # Unfilled FVG Analysis Display (Only show unfilled FVGs)
-    if fvg_analysis:
-        # Get only unfilled FVGs
-        bullish_fvgs = [fvg for fvg in fvg_analysis.get('bullish_fvgs', []) if not fvg.get('filled', False)]
-        bearish_fvgs = [fvg for fvg in fvg_analysis.get('bearish_fvgs', []) if not fvg.get('filled', False)]
+        self._render(name)
+    
+    def show_all(self, analysis_data):
+        """Render a complete (e.g. cached) analysis at once"""
+        for name, value in analysis_data.items():
+            self.values[name] = value
+        self._create_slots()
+        for name in list(self.values):
+            self._render(name, summary=False)
+        if self._ready(self.SUMMARY_INPUTS):
+            self._render_summary()
+    
+    def _ready(self, names):
+        return all(name in self.values for name in names)
+    
+    def _render(self, name, summary=True):
+        v = self.values
+        
+        if name == 'scalp_analysis':
+            scalp_analysis = v['scalp_analysis']
+            if "Scalp" in self.analysis_mode and scalp_analysis and 'trade_signals' in scalp_analysis:
+                with self.slots['scalp'].container():
+                    display_scalp_section(scalp_analysis)
+        
+        elif name == 'fvg_analysis':
+            if v['fvg_analysis']:
+                with self.slots['fvg'].container():
+                    display_fvg_section(v['fvg_analysis'])
+        
+        elif name in ('funding_cvd_analysis', 'market_analysis'):
+            if self.is_crypto and v.get('funding_cvd_analysis'):
+                with self.slots['market'].container():
+                    display_funding_cvd_card(v['funding_cvd_analysis'])
+            elif self.is_forex and v.get('market_analysis') and v['market_analysis']['dxy_analysis']:
+                with self.slots['market'].container():
+                    display_dxy_card(v['market_analysis']['dxy_analysis'])
+            elif self._ready(['funding_cvd_analysis', 'market_analysis']):
+                self.slots['market'].empty()
+        
+        elif name == 'institutional_analysis':
+            if v['institutional_analysis']:
+                with self.slots['institutional'].container():
+                    display_institutional_levels_card(v['institutional_analysis'], v['current_price'])
+            else:
+                self.slots['institutional'].empty()
         
-        unfilled_count = len(bullish_fvgs) + len(bearish_fvgs)
+        if summary and name in self.SUMMARY_INPUTS + ('mtf_analysis',) and self._ready(self.SUMMARY_INPUTS):
+            self._render_summary()
+    
+    def _render_summary(self):
+        v = self.values
+        mtf_analysis = v.get('mtf_analysis')
+        final_score, mtf_score, mtf_confidence = calculate_final_score(
+            v['confluence'], v['sentiment_analysis'], v['scalp_analysis'], v['risk_analysis'], mtf_analysis
+        )
         
-        if unfilled_count > 0:
-            st.markdown("### 📊 US FVG")
-            
-            # Only show unfilled FVG count
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.metric("US FVG", unfilled_count)
-            
-            with col2:
-                st.metric("Bullish US FVG", len(bullish_fvgs), delta="🟢")
-            
-            with col3:
-                st.metric("Bearish US FVG", len(bearish_fvgs), delta="🔴")
-            
-            # Show only unfilled FVGs
-            if bullish_fvgs or bearish_fvgs:
-                st.subheader("⚡ Doldurulmamış FVG Seviyeleri")
-                
-                # Show unfilled bullish FVGs (Long side)
-                if bullish_fvgs:
-                    st.markdown("**🟢 LONG TARAF US FVG:**")
-                    for fvg in bullish_fvgs[:3]:  # Show top 3
-                        gap_size = fvg['top'] - fvg['bottom']
-                        st.success(f"📈 US FVG: ${fvg['bottom']:.4f} - ${fvg['top']:.4f} (Gap: ${gap_size:.4f})")
-                
-                # Show unfilled bearish FVGs (Short side)
-                if bearish_fvgs:
-                    st.markdown("**🔴 SHORT TARAF US FVG:**")
-                    for fvg in bearish_fvgs[:3]:  # Show top 3
-                        gap_size = fvg['top'] - fvg['bottom']
-                        st.error(f"📉 US FVG: ${fvg['bottom']:.4f} - ${fvg['top']:.4f} (Gap: ${gap_size:.4f})")
-            
-            st.markdown("---")
-    
-    # Continue with regular analysis display for non-scalp modes
+        with self.slots['summary'].container():
+            display_summary_card(self.symbol, v['current_price'], v['overall_bias'], v.get('bias_strength', 0),
+                                 final_score, mtf_confidence)
+        
+        # Multi-Timeframe Analysis Card
+        if 'mtf_analysis' in v:
+            if isinstance(mtf_analysis, dict) and mtf_analysis.get('timeframe_results'):
+                with self.slots['mtf'].container():
+                    display_mtf_card(mtf_analysis, mtf_score, mtf_confidence)
+            else:
+                self.slots['mtf'].empty()
+        
+        # Trading Plan Card
+        if final_score >= 40:
+            with self.slots['plan'].container():
+                display_trading_plan_card(v['current_price'], final_score, v['data'])
+        else:
+            self.slots['plan'].empty()
+
+def display_scalp_section(scalp_analysis):
+    """Scalp-specific display for timeframe-optimized trading"""
+    st.markdown("### ⚡ Scalp Trading Sinyali")
+
+    trade_signals = scalp_analysis['trade_signals']
+    action = trade_signals.get('action', 'HOLD')
+    confidence = trade_signals.get('confidence', 0)
+
+    # Display main scalp signal
+    if action == 'LONG':
+        st.success(f"🟢 LONG Pozisyon | Güven: {confidence:.0f}%")
+    elif action == 'SHORT':
+        st.error(f"🔴 SHORT Pozisyon | Güven: {confidence:.0f}%")
+    else:
+        st.warning(f"🟡 BEKLE | Sinyal Yok")
+
+    # Show detailed trading levels if available
+    if trade_signals.get('entry_price'):
+        col1, col2, col3, col4 = st.columns(4)
+
+        with col1:
+            st.metric("Giriş", f"${trade_signals['entry_price']:.4f}")
+        with col2:
+            if trade_signals.get('stop_loss'):
+                stop_pct = trade_signals.get('stop_pct', 0.3)
+                st.metric("Stop Loss", f"${trade_signals['stop_loss']:.4f}")
+                st.caption(f"Risk: {stop_pct:.2f}%")
+        with col3:
+            if trade_signals.get('take_profit_1'):
+                tp1_pct = trade_signals.get('tp1_pct', 0.5)
+                st.metric("TP1", f"${trade_signals['take_profit_1']:.4f}")
+                st.caption(f"Hedef: {tp1_pct:.2f}%")
+        with col4:
+            if trade_signals.get('take_profit_2'):
+                tp2_pct = trade_signals.get('tp2_pct', 0.9)
+                st.metric("TP2", f"${trade_signals['take_profit_2']:.4f}")
+                st.caption(f"Hedef: {tp2_pct:.2f}%")
+
+        # Risk/Reward calculation
+        if trade_signals.get('stop_pct') and trade_signals.get('tp1_pct'):
+            rr_ratio = trade_signals['tp1_pct'] / trade_signals['stop_pct']
+            st.info(f"Risk/Ödül: 1:{rr_ratio:.1f} | Tavsiye Tutma: {trade_signals.get('hold_time', '5-30 dakika')}")
+
+    st.markdown("---")
+
+def display_fvg_section(fvg_analysis):
+    """Unfilled FVG Analysis Display (Only show unfilled FVGs)"""
+    # Get only unfilled FVGs
+    bullish_fvgs = [fvg for fvg in fvg_analysis.get('bullish_fvgs', []) if not fvg.get('filled', False)]
+    bearish_fvgs = [fvg for fvg in fvg_analysis.get('bearish_fvgs', []) if not fvg.get('filled', False)]
+
+    unfilled_count = len(bullish_fvgs) + len(bearish_fvgs)
+
+    if unfilled_count > 0:
+        st.markdown("### 📊 US FVG")
+
+        # Only show unfilled FVG count
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            st.metric("US FVG", unfilled_count)
+
+        with col2:
+            st.metric("Bullish US FVG", len(bullish_fvgs), delta="🟢")
+
+        with col3:
+            st.metric("Bearish US FVG", len(bearish_fvgs), delta="🔴")
+
+        # Show only unfilled FVGs
+        if bullish_fvgs or bearish_fvgs:
+            st.subheader("⚡ Doldurulmamış FVG Seviyeleri")
+
+            # Show unfilled bullish FVGs (Long side)
+            if bullish_fvgs:
+                st.markdown("**🟢 LONG TARAF US FVG:**")
+                for fvg in bullish_fvgs[:3]:  # Show top 3
+                    gap_size = fvg['top'] - fvg['bottom']
+                    st.success(f"📈 US FVG: ${fvg['bottom']:.4f} - ${fvg['top']:.4f} (Gap: ${gap_size:.4f})")
+
+            # Show unfilled bearish FVGs (Short side)
+            if bearish_fvgs:
+                st.markdown("**🔴 SHORT TARAF US FVG:**")
+                for fvg in bearish_fvgs[:3]:  # Show top 3
+                    gap_size = fvg['top'] - fvg['bottom']
+                    st.error(f"📉 US FVG: ${fvg['bottom']:.4f} - ${fvg['top']:.4f} (Gap: ${gap_size:.4f})")
+
+        st.markdown("---")
+
+def calculate_final_score(confluence, sentiment_analysis, scalp_analysis, risk_analysis, mtf_analysis):
+    """
+    Combine component scores into the headline score
     
+    Returns:
+        tuple: (final_score, mtf_score, mtf_confidence)
+    """
     # Calculate scores
     trend_score = 50
     if isinstance(sentiment_analysis, dict) and 'overall_sentiment' in sentiment_analysis:
@@ -133,6 +284,10 @@ def display_professional_analysis_results(symbol, current_price, overall_bias, b
     quality_multiplier = 1.2 if rr_ratio >= 2.5 else 1.1 if rr_ratio >= 2.0 else 1.0
     final_score = (base_score + mtf_boost) * quality_multiplier
     
+    return final_score, mtf_score, mtf_confidence
+
+def display_summary_card(symbol, current_price, overall_bias, bias_strength, final_score, mtf_confidence):
+    """Executive summary card"""
     # Determine signal characteristics
     if final_score >= 75:
         signal_type = "GÜÇLÜ ALIM"
@@ -184,27 +339,6 @@ def display_professional_analysis_results(symbol, current_price, overall_bias, b
         </div>
     </div>
     """, unsafe_allow_html=True)
-    
-    # Multi-Timeframe Analysis Card
-    if isinstance(mtf_analysis, dict) and mtf_analysis.get('timeframe_results'):
-        display_mtf_card(mtf_analysis, mtf_score, mtf_confidence)
-    
-    # Trading Plan Card
-    if final_score >= 40:
-        display_trading_plan_card(current_price, final_score, data)
-    
-    # Market Analysis Cards
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        if is_crypto and funding_cvd_analysis:
-            display_funding_cvd_card(funding_cvd_analysis)
-        elif is_forex and market_analysis['dxy_analysis']:
-            display_dxy_card(market_analysis['dxy_analysis'])
-    
-    with col2:
-        if institutional_analysis:
-            display_institutional_levels_card(institutional_analysis, current_price)
 
 def display_mtf_card(mtf_analysis, mtf_score, mtf_confidence):
     """Display Multi-Timeframe analysis card"""
@@ -1,25 +1,16 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
 from datetime import datetime, timedelta
-import pytz
-from timeframe_optimizer import TimeframeOptimizer
-from enhanced_data_fetcher import EnhancedDataFetcher
-from ema_calculator import EMACalculator
-from bias_analyzer import BiasAnalyzer
-from advanced_indicators import AdvancedIndicators
-from market_structure_analyzer import MarketStructureAnalyzer
-from risk_management_engine import RiskManagementEngine
-from sentiment_analyzer import SentimentAnalyzer
-from scalp_analyzer import ScalpAnalyzer
-from market_indicators_fetcher import MarketIndicatorsFetcher
-from funding_cvd_analyzer import FundingCVDAnalyzer
-from institutional_levels import InstitutionalLevels
-from multi_timeframe_analyzer import MultiTimeframeAnalyzer
 from logo import display_logo_header, display_sidebar_logo
-from sinyal_takip_sistemi import SinyalTakipSistemi
+from analysis_cache import get_shared_analysis_cache
+import diagnostics
 import os
 
+# Library modules report through diagnostics; show their messages in this UI
+diagnostics.set_sink(diagnostics.StreamlitSink())
+
+# Bars kept per cached analysis (display cards only read the recent tail)
+CACHED_DATA_BARS = 300
+
 # Page configuration
 st.set_page_config(
     page_title="FinansLab Bias Analysis",
@@ -424,18 +415,35 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+def get_signal_tracker():
+    """Signal tracking system, created on first use (keeps cold start light)"""
+    if 'signal_tracker' not in st.session_state:
+        from sinyal_takip_sistemi import SinyalTakipSistemi
+        st.session_state.signal_tracker = SinyalTakipSistemi()
+    return st.session_state.signal_tracker
+
+def warm_analysis(cache_key, timeframe):
+    """Cache warmer entry point: recompute a cached analysis key headlessly"""
+    symbol, period, _, analysis_mode = cache_key
+    return compute_comprehensive_analysis(symbol, period, timeframe, analysis_mode)
+
+def get_analysis_warmer():
+    """Process-wide background warmer for favorite and popular analyses"""
+    from cache_warmer import get_cache_warmer
+    return get_cache_warmer(get_shared_analysis_cache(), warm_analysis)
+
 def main():
     # Initialize session state for performance caching
     if 'last_analysis' not in st.session_state:
         st.session_state.last_analysis = None
-    if 'analysis_cache' not in st.session_state:
-        st.session_state.analysis_cache = {}
     if 'favorites' not in st.session_state:
         st.session_state.favorites = []
+    if 'session_token' not in st.session_state:
+        import uuid
+        st.session_state.session_token = uuid.uuid4().hex
     
-    # Initialize Signal Tracking System
-    if 'signal_tracker' not in st.session_state:
-        st.session_state.signal_tracker = SinyalTakipSistemi()
+    # Keep this session's favorites warm in the shared cache
+    get_analysis_warmer().set_favorites(st.session_state.session_token, st.session_state.favorites)
     
     # Professional Header with Logo
     st.markdown(display_logo_header(), unsafe_allow_html=True)
@@ -664,12 +672,24 @@ def main():
 
         # Analysis Button with smart caching
         st.markdown("---")
-        cache_key = f"{symbol}_{period}_{manual_timeframe}"
+        cache_key = (symbol, period, manual_timeframe, analysis_mode)
         
         # Show cached result info if available
-        if cache_key in st.session_state.analysis_cache:
+        if get_shared_analysis_cache().contains(cache_key):
             st.info("🔄 Bu sembol için önceki analiz sonucu mevcut. Yeni analiz için butona tıklayın.")
         
+        # Favorites are kept pre-computed by the background cache warmer
+        if cache_key in st.session_state.favorites:
+            if st.button("☆ Favorilerden Çıkar", use_container_width=True):
+                st.session_state.favorites.remove(cache_key)
+                get_analysis_warmer().set_favorites(st.session_state.session_token, st.session_state.favorites)
+                st.rerun()
+        else:
+            if st.button("⭐ Favorilere Ekle", use_container_width=True):
+                st.session_state.favorites.append(cache_key)
+                get_analysis_warmer().set_favorites(st.session_state.session_token, st.session_state.favorites)
+                st.rerun()
+        
         analyze_button = st.button("🔍 ANALİZ BAŞLAT", type="primary", use_container_width=True)
         
         st.markdown("---")
@@ -749,7 +769,7 @@ def main():
         
         with tab2:
             # Signal Tracking Dashboard
-            st.session_state.signal_tracker.display_streamlit_dashboard()
+            get_signal_tracker().display_streamlit_dashboard()
         
         with tab3:
             # Performance Dashboard
@@ -806,6 +826,8 @@ def generate_comprehensive_report(symbol, export_options):
         'platform': 'FinansLab Bias ⚡️'
     }
     
+    import pandas as pd
+    
     st.subheader("📊 Rapor Oluşturuluyor...")
     
     # Trading History Report
@@ -895,9 +917,8 @@ DETAYLAR:
     if "Analiz Sonuçları" in export_options:
         st.write("### 📊 Son Analiz Sonuçları")
         
-        cache_key = f"{symbol}_3mo_auto"  # Default cache key
-        if cache_key in st.session_state.analysis_cache:
-            cached_analysis = st.session_state.analysis_cache[cache_key]['data']
+        cached_analysis = st.session_state.get('last_analysis')
+        if cached_analysis and cached_analysis['symbol'] == symbol:
             
             analysis_summary = f"""
 **FINANSLAB BİAS ANALİZ RAPORU**
@@ -930,301 +951,306 @@ Platform: FinansLab Bias ⚡️
     
     st.success("📄 Rapor oluşturma tamamlandı!")
 
-def generate_interactive_chart(data, ema_data, symbol, current_price, institutional_analysis):
-    """Generate interactive candlestick chart with EMAs and levels"""
+def generate_interactive_chart(data, ema_data, symbol, current_price, institutional_analysis, chart_html=None):
+    """
+    Render the interactive price/EMA chart
+    
+    Args:
+        chart_html (str): Pre-serialized chart (cached with the analysis result);
+            built from data/ema_data when missing
+    """
     
     try:
-        import plotly.graph_objects as go
-        from plotly.subplots import make_subplots
+        import streamlit.components.v1 as components
         
         st.subheader(f"📈 {symbol} - İnteraktif Grafik Analizi")
         
-        # Data validation and column detection
-        if data is None or data.empty:
-            st.error("Grafik için yeterli veri bulunamadı")
-            return
-        
-        # Detect available columns
-        available_cols = data.columns.tolist()
-        
-        # Find OHLC columns with flexible naming
-        price_cols = {}
-        for standard_name, possible_names in {
-            'open': ['open', 'Open', 'OPEN'],
-            'high': ['high', 'High', 'HIGH'], 
-            'low': ['low', 'Low', 'LOW'],
-            'close': ['close', 'Close', 'CLOSE', 'price'],
-            'volume': ['volume', 'Volume', 'VOLUME', 'vol']
-        }.items():
-            for name in possible_names:
-                if name in available_cols:
-                    price_cols[standard_name] = name
-                    break
-        
-        # Create simple line chart as primary option
-        fig = go.Figure()
-        
-        # Add price line
-        close_col = price_cols.get('close', available_cols[0] if available_cols else None)
-        if close_col:
-            fig.add_trace(
-                go.Scatter(
-                    x=data.index,
-                    y=data[close_col],
-                    mode='lines',
-                    name=f'{symbol} Fiyat',
-                    line=dict(color='#2196F3', width=3)
-                )
-            )
-        
-        # Add EMAs
-        ema_colors = ['#FF9800', '#4CAF50', '#9C27B0', '#F44336', '#795548']
-        ema_periods = [45, 89, 144, 200, 276]
-        
-        for i, period in enumerate(ema_periods):
-            if period in ema_data and len(ema_data[period]) > 0:
-                fig.add_trace(
-                    go.Scatter(
-                        x=data.index,
-                        y=ema_data[period],
-                        mode='lines',
-                        name=f'EMA {period}',
-                        line=dict(color=ema_colors[i], width=2),
-                        opacity=0.8
-                    )
-                )
-        
-        # Add institutional levels if available
-        if institutional_analysis and institutional_analysis.get('nearest_levels'):
-            levels = institutional_analysis['nearest_levels']
-            
-            # Support level
-            if levels.get('support'):
-                support_price = levels['support'].get('price', 0)
-                if support_price > 0:
-                    fig.add_hline(
-                        y=support_price,
-                        line_dash="dash",
-                        line_color="green",
-                        annotation_text=f"Support: ${support_price:.4f}"
-                    )
+        if chart_html is None:
+            # Data validation
+            if data is None or data.empty:
+                st.error("Grafik için yeterli veri bulunamadı")
+                return
             
-            # Resistance level  
-            if levels.get('resistance'):
-                resistance_price = levels['resistance'].get('price', 0)
-                if resistance_price > 0:
-                    fig.add_hline(
-                        y=resistance_price,
-                        line_dash="dash", 
-                        line_color="red",
-                        annotation_text=f"Resistance: ${resistance_price:.4f}"
-                    )
-        
-        # Update layout
-        fig.update_layout(
-            title=f"{symbol} - Teknik Analiz Grafiği",
-            xaxis_title="Tarih",
-            yaxis_title="Fiyat ($)",
-            template="plotly_dark",
-            height=600,
-            showlegend=True
-        )
+            from chart_builder import build_chart_html
+            chart_html = build_chart_html(data, ema_data, symbol, institutional_analysis)
         
-        # Display the chart
-        st.plotly_chart(fig, use_container_width=True)
+        # Display the chart (already serialized - no per-rerun figure conversion)
+        components.html(chart_html, height=620)
         
         # Chart analysis summary
-        if close_col and close_col in data.columns:
-            st.info(f"""
-            📊 **Grafik Analizi:**
-            • {symbol} fiyat grafiği ve EMA seviyeleri görüntüleniyor
-            • Güncel fiyat: ${current_price:.4f}
-            • Kurumsal seviyeler işaretli
-            """)
+        st.info(f"""
+        📊 **Grafik Analizi:**
+        • {symbol} fiyat grafiği ve EMA seviyeleri görüntüleniyor
+        • Güncel fiyat: ${current_price:.4f}
+        • Kurumsal seviyeler işaretli
+        """)
     
     except Exception as e:
         st.error(f"Grafik oluşturulurken hata: {str(e)}")
         st.info("Grafik yerine analiz sonuçlarına odaklanabilirsiniz.")
 
+def build_analysis_nodes(pipeline, ema_periods, scalp_emas, is_crypto, is_forex):
+    """
+    Register the analysis components as pipeline nodes (inputs declared by name)
+    """
+    # Analyzers load on first analysis, not at app start
+    from advanced_indicators import AdvancedIndicators
+    from bias_analyzer import BiasAnalyzer
+    from multi_timeframe_analyzer import MultiTimeframeAnalyzer
+    from market_structure_analyzer import MarketStructureAnalyzer
+    from risk_management_engine import RiskManagementEngine
+    from sentiment_analyzer import SentimentAnalyzer
+    from scalp_analyzer import ScalpAnalyzer
+    from market_indicators_fetcher import MarketIndicatorsFetcher
+    from funding_cvd_analyzer import FundingCVDAnalyzer
+    from institutional_levels import InstitutionalLevels
+    
+    advanced_indicators = AdvancedIndicators()
+    
+    def indicators(data, ema_data):
+        return {
+            'rsi': advanced_indicators.calculate_rsi(data['Close']),
+            'macd': advanced_indicators.calculate_macd(data['Close']),
+            'price_position': advanced_indicators.analyze_price_position(data['Close'], ema_data),
+            'volume_analysis': advanced_indicators.analyze_volume(data['Volume'], data['Close']),
+            'ema_sequence': advanced_indicators.ema_sequence_analysis(ema_data)
+        }
+    
+    def confluence(ind):
+        return advanced_indicators.calculate_confluence_score(
+            ind['ema_sequence'], ind['rsi'], ind['macd'], ind['volume_analysis'], ind['price_position']
+        )
+    
+    def fvg_analysis(data):
+        from fvg_detector import FVGDetector
+        return FVGDetector().detect_fvgs(data)
+    
+    def market_analysis():
+        market_indicators = MarketIndicatorsFetcher()
+        if is_forex:
+            return {
+                'dxy_analysis': market_indicators.get_dxy_data(),
+                'stablecoin_analysis': None,
+                'overall_sentiment': {'forex_bias': 'Neutral', 'crypto_bias': None}
+            }
+        if is_crypto:
+            return {
+                'dxy_analysis': None,
+                'stablecoin_analysis': market_indicators.get_stablecoin_dominance(),
+                'overall_sentiment': {'forex_bias': None, 'crypto_bias': 'Neutral'}
+            }
+        return {
+            'dxy_analysis': None,
+            'stablecoin_analysis': None,
+            'overall_sentiment': {'forex_bias': None, 'crypto_bias': None}
+        }
+    
+    def funding_cvd_analysis(data, symbol):
+        # Crypto-specific Funding & CVD
+        if not is_crypto:
+            return None
+        return FundingCVDAnalyzer().get_comprehensive_funding_cvd_analysis(data, symbol)
+    
+    pipeline.add('bias_results', lambda data, ema_data: BiasAnalyzer(ema_periods).analyze_bias(data['Close'], ema_data),
+                 inputs=['data', 'ema_data'])
+    pipeline.add('indicators', indicators, inputs=['data', 'ema_data'])
+    pipeline.add('confluence', confluence, inputs=['indicators'])
+    pipeline.add('mtf_analysis',
+                 lambda symbol, timeframe, fetcher: MultiTimeframeAnalyzer().analyze_multi_timeframe_bias(symbol, timeframe, fetcher),
+                 inputs=['symbol', 'timeframe', 'data_fetcher'])
+    pipeline.add('market_structure',
+                 lambda data, ema_data: MarketStructureAnalyzer().analyze_market_structure(data, ema_data),
+                 inputs=['data', 'ema_data'])
+    pipeline.add('risk_analysis',
+                 lambda data, ema_data, conf, structure, atr: RiskManagementEngine().calculate_position_parameters(
+                     data, ema_data, conf['confluence_score'], structure, atr=atr.iloc[-1]),
+                 inputs=['data', 'ema_data', 'confluence', 'market_structure', 'atr'])
+    pipeline.add('sentiment_analysis',
+                 lambda data, ema_data, conf: SentimentAnalyzer().analyze_sentiment(data, ema_data, conf),
+                 inputs=['data', 'ema_data', 'confluence'])
+    pipeline.add('scalp_analysis',
+                 lambda data, ema_data: ScalpAnalyzer(scalp_ema_periods=scalp_emas).analyze_scalp_signals(data, ema_data),
+                 inputs=['data', 'ema_data'])
+    pipeline.add('fvg_analysis', fvg_analysis, inputs=['data'])
+    pipeline.add('market_analysis', market_analysis)
+    pipeline.add('funding_cvd_analysis', funding_cvd_analysis, inputs=['data', 'symbol'])
+    pipeline.add('institutional_analysis',
+                 lambda data, symbol, timeframe: InstitutionalLevels().calculate_institutional_levels(
+                     data, timeframe, key=(symbol, timeframe)),
+                 inputs=['data', 'symbol', 'timeframe'])
+    return pipeline
+
+def detect_asset_type(symbol):
+    """
+    Returns:
+        tuple: (is_crypto, is_forex)
+    """
+    is_crypto = any(symbol.upper().endswith(suffix) for suffix in ['USDT', 'USDC', 'BTC', 'ETH']) or '.P' in symbol.upper()
+    is_forex = any(symbol.upper().endswith(pair) for pair in ['USD', 'EUR', 'GBP', 'JPY', 'CHF', 'CAD', 'AUD', 'NZD']) and len(symbol) <= 7
+    return is_crypto, is_forex
+
+def compute_comprehensive_analysis(symbol, period, optimal_timeframe, analysis_mode="📊 Standart Analiz",
+                                   on_component=None):
+    """
+    Run every analysis component for a symbol (no UI output)
+    
+    Args:
+        on_component (callable): Called as on_component(name, value) with the price data
+            and then each component result as soon as it is ready (caller's thread)
+    
+    Returns:
+        dict: Analysis results, or None if no market data could be fetched
+    """
+    from enhanced_data_fetcher import EnhancedDataFetcher
+    from analysis_pipeline import AnalysisPipeline, add_shared_features
+    
+    # Asset type detection
+    is_crypto, is_forex = detect_asset_type(symbol)
+    
+    # Fixed EMA periods for bias analysis
+    ema_periods = [45, 89, 144, 200, 276]
+    scalp_emas = [8, 21]
+    
+    # Data acquisition using enhanced multi-source fetcher
+    data_fetcher = EnhancedDataFetcher()
+    data = data_fetcher.get_klines(symbol, optimal_timeframe, period)
+    
+    if data.empty:
+        return None
+    
+    # Core Analysis Components
+    current_price = float(data['Close'].iloc[-1]) if hasattr(data['Close'], 'iloc') else float(data['Close'][-1])
+    
+    # Analysis DAG: shared features (EMA stack, ATR) are computed once and
+    # independent components (incl. network-bound ones) run concurrently
+    pipeline = AnalysisPipeline()
+    add_shared_features(pipeline, ema_periods + scalp_emas)
+    build_analysis_nodes(pipeline, ema_periods, scalp_emas, is_crypto, is_forex)
+    inputs = {'data': data, 'symbol': symbol, 'timeframe': optimal_timeframe, 'data_fetcher': data_fetcher}
+    results = dict(inputs)
+    if on_component:
+        on_component('data', data)
+    for name, value in pipeline.run_iter(inputs):
+        results[name] = value
+        if on_component:
+            on_component(name, value)
+    
+    bias_results = results['bias_results']
+    confluence = results['confluence']
+    sentiment_analysis = results['sentiment_analysis']
+    scalp_analysis = results['scalp_analysis']
+    market_analysis = results['market_analysis']
+    funding_cvd_analysis = results['funding_cvd_analysis']
+    institutional_analysis = results['institutional_analysis']
+    risk_analysis = results['risk_analysis']
+    mtf_analysis = results['mtf_analysis']
+    fvg_analysis = results['fvg_analysis']
+    
+    # Detailed mode chart: downsampled and serialized once, cached with the result
+    chart_html = None
+    if analysis_mode == "🔬 Detaylı Analiz":
+        try:
+            from chart_builder import build_chart_html
+            chart_html = build_chart_html(data, results['ema_data'], symbol, institutional_analysis)
+        except Exception as e:
+            diagnostics.warning(f"Grafik hazırlanamadı: {str(e)}")
+    
+    # Overall analysis with fallback
+    overall_bias = bias_results.get('current_bias', bias_results.get('overall_bias', 'neutral'))
+    bias_strength = bias_results.get('bias_strength', 0)
+    
+    # Only the recent bars are kept in the shared cache (display needs the tail only)
+    return {
+        'symbol': symbol, 'current_price': current_price, 'overall_bias': overall_bias, 
+        'bias_strength': bias_strength, 'confluence': confluence, 'sentiment_analysis': sentiment_analysis,
+        'scalp_analysis': scalp_analysis, 'market_analysis': market_analysis, 
+        'funding_cvd_analysis': funding_cvd_analysis, 'institutional_analysis': institutional_analysis,
+        'risk_analysis': risk_analysis, 'mtf_analysis': mtf_analysis, 'fvg_analysis': fvg_analysis,
+        'data': data.iloc[-CACHED_DATA_BARS:].copy(), 'is_crypto': is_crypto, 'is_forex': is_forex,
+        'analysis_mode': analysis_mode, 'pipeline_timings': dict(pipeline.timings),
+        'chart_html': chart_html
+    }
+
 def perform_comprehensive_analysis(symbol, period, manual_timeframe, analysis_mode="📊 Standart Analiz"):
-    # Check cache first for performance optimization
-    cache_key = f"{symbol}_{period}_{manual_timeframe}"
-    current_time = datetime.now()
-    
-    # Use cached result if less than 5 minutes old
-    if (cache_key in st.session_state.analysis_cache and 
-        st.session_state.analysis_cache[cache_key]['timestamp'] and
-        (current_time - st.session_state.analysis_cache[cache_key]['timestamp']).seconds < 300):
-        
-        cached_result = st.session_state.analysis_cache[cache_key]['data']
-        st.success("⚡ Önbellek kullanılarak hızlı sonuç gösteriliyor")
-        display_comprehensive_results(**cached_result, analysis_mode=analysis_mode)
-        return
+    # Process-wide cache: every session asking for the same key shares one computation
+    analysis_cache = get_shared_analysis_cache()
+    cache_key = (symbol, period, manual_timeframe, analysis_mode)
     
     try:
-        # Asset type detection
-        is_crypto = any(symbol.upper().endswith(suffix) for suffix in ['USDT', 'USDC', 'BTC', 'ETH']) or '.P' in symbol.upper()
-        is_forex = any(symbol.upper().endswith(pair) for pair in ['USD', 'EUR', 'GBP', 'JPY', 'CHF', 'CAD', 'AUD', 'NZD']) and len(symbol) <= 7
-        
-        # Fixed EMA periods for bias analysis
-        ema_periods = [45, 89, 144, 200, 276]
-        scalp_emas = [8, 21]
-        
         # Automatic timeframe optimization
         if manual_timeframe == "auto":
+            from timeframe_optimizer import TimeframeOptimizer
             timeframe_optimizer = TimeframeOptimizer()
             optimal_timeframe = timeframe_optimizer.get_optimal_timeframe(symbol, period)
             st.info(f"🤖 Otomatik seçilen zaman dilimi: {optimal_timeframe}")
         else:
             optimal_timeframe = manual_timeframe
         
-        with st.spinner(f"{symbol} için kapsamlı analiz yapılıyor..."):
-            # Data acquisition using enhanced multi-source fetcher
-            data_fetcher = EnhancedDataFetcher()
-            data = data_fetcher.get_klines(symbol, optimal_timeframe, period)
-            
-            if data.empty:
-                st.error(f"🚫 Piyasa verisi alınamadı: {symbol}")
-                st.info("💡 Çözüm önerileri:")
-                st.info("1. Farklı bir sembol kategorisinden deneyin")
-                st.info("2. Daha kısa dönem seçin (1 Ay yerine)")
-                st.info("3. Manuel sembol girişini kontrol edin")
-                return
+        from analysis_display import ProgressiveAnalysisDisplay
         
-
+        # Demand signal for the background warmer (top-N most requested)
+        get_analysis_warmer().record_request(cache_key, optimal_timeframe)
         
-        # Core Analysis Components
-        current_price = float(data['Close'].iloc[-1]) if hasattr(data['Close'], 'iloc') else float(data['Close'][-1])
-        
-        # EMA Calculations
-        ema_calculator = EMACalculator()
-        all_ema_periods = ema_periods + scalp_emas
-        ema_data = ema_calculator.calculate_multiple_emas(data['Close'], all_ema_periods)
-        
-        # Bias Analysis
-        bias_analyzer = BiasAnalyzer(ema_periods)
-        bias_results = bias_analyzer.analyze_bias(data['Close'], ema_data)
-        
-        # Advanced Indicators
-        advanced_indicators = AdvancedIndicators()
-        rsi = advanced_indicators.calculate_rsi(data['Close'])
-        macd = advanced_indicators.calculate_macd(data['Close'])
-        price_position = advanced_indicators.analyze_price_position(data['Close'], ema_data)
-        volume_analysis = advanced_indicators.analyze_volume(data['Volume'], data['Close'])
-        ema_sequence = advanced_indicators.ema_sequence_analysis(ema_data)
-        
-        # Multi-Timeframe Analysis (NEW - for higher accuracy)
-        mtf_analyzer = MultiTimeframeAnalyzer()
-        # Use the active data fetcher
-        mtf_analysis = mtf_analyzer.analyze_multi_timeframe_bias(symbol, optimal_timeframe, data_fetcher)
-        
-        # Calculate confluence
-        confluence = advanced_indicators.calculate_confluence_score(
-            ema_sequence, rsi, macd, volume_analysis, price_position
-        )
-        
-        # Market Structure Analysis
-        market_structure_analyzer = MarketStructureAnalyzer()
-        market_structure = market_structure_analyzer.analyze_market_structure(data, ema_data)
+        # Reserved above the cards; filled once the full result is known
+        status_slot = st.container()
+        detail_slot = st.container()
         
-        # Risk Management
-        risk_engine = RiskManagementEngine()
-        risk_analysis = risk_engine.calculate_position_parameters(
-            data, ema_data, confluence['confluence_score'], market_structure
-        )
+        # Cards fill in as each component finishes (fastest first)
+        is_crypto, is_forex = detect_asset_type(symbol)
+        display = ProgressiveAnalysisDisplay(symbol, is_crypto, is_forex, analysis_mode)
         
-        # Sentiment Analysis
-        sentiment_analyzer = SentimentAnalyzer()
-        sentiment_analysis = sentiment_analyzer.analyze_sentiment(data, ema_data, confluence)
-        
-        # Scalp Analysis
-        scalp_analyzer = ScalpAnalyzer(scalp_ema_periods=scalp_emas)
-        scalp_analysis = scalp_analyzer.analyze_scalp_signals(data, ema_data)
-        
-        # FVG Analysis
-        from fvg_detector import FVGDetector
-        fvg_detector = FVGDetector()
-        fvg_analysis = fvg_detector.detect_fvgs(data)
-        
-        # Initialize funding_cvd_analysis for all asset types
-        funding_cvd_analysis = None
+        with st.spinner(f"{symbol} için kapsamlı analiz yapılıyor..."):
+            analysis_data, from_cache = analysis_cache.get_or_compute(
+                cache_key,
+                lambda: compute_comprehensive_analysis(symbol, period, optimal_timeframe, analysis_mode,
+                                                       on_component=display.update),
+                timeframe=optimal_timeframe
+            )
         
-        # Asset-specific analysis
-        market_indicators = MarketIndicatorsFetcher()
-        if is_forex:
-            market_analysis = {
-                'dxy_analysis': market_indicators.get_dxy_data(),
-                'stablecoin_analysis': None,
-                'overall_sentiment': {'forex_bias': 'Neutral', 'crypto_bias': None}
-            }
-        elif is_crypto:
-            market_analysis = {
-                'dxy_analysis': None,
-                'stablecoin_analysis': market_indicators.get_stablecoin_dominance(),
-                'overall_sentiment': {'forex_bias': None, 'crypto_bias': 'Neutral'}
-            }
-            
-            # Crypto-specific Funding & CVD
-            funding_cvd_analyzer = FundingCVDAnalyzer()
-            funding_cvd_analysis = funding_cvd_analyzer.get_comprehensive_funding_cvd_analysis(data, symbol)
-        else:
-            market_analysis = {
-                'dxy_analysis': None,
-                'stablecoin_analysis': None,
-                'overall_sentiment': {'forex_bias': None, 'crypto_bias': None}
-            }
+        if analysis_data is None:
+            st.error(f"🚫 Piyasa verisi alınamadı: {symbol}")
+            st.info("💡 Çözüm önerileri:")
+            st.info("1. Farklı bir sembol kategorisinden deneyin")
+            st.info("2. Daha kısa dönem seçin (1 Ay yerine)")
+            st.info("3. Manuel sembol girişini kontrol edin")
+            return
         
-        # Institutional Levels
-        institutional_analyzer = InstitutionalLevels()
-        institutional_analysis = institutional_analyzer.calculate_institutional_levels(data, optimal_timeframe)
+        if from_cache:
+            # Cached or computed by another session: render everything at once
+            with status_slot:
+                st.success("⚡ Önbellek kullanılarak hızlı sonuç gösteriliyor")
+            display.show_all(analysis_data)
         
-        # Overall analysis with fallback
-        overall_bias = bias_results.get('current_bias', bias_results.get('overall_bias', 'neutral'))
-        bias_strength = bias_results.get('bias_strength', 0)
+        st.session_state.last_analysis = analysis_data
+        current_price = analysis_data['current_price']
+        data = analysis_data['data']
         
         # Check for price alerts
         check_price_alerts(symbol, current_price)
         
-        # Cache analysis results for performance
-        analysis_data = {
-            'symbol': symbol, 'current_price': current_price, 'overall_bias': overall_bias, 
-            'bias_strength': bias_strength, 'confluence': confluence, 'sentiment_analysis': sentiment_analysis,
-            'scalp_analysis': scalp_analysis, 'market_analysis': market_analysis, 
-            'funding_cvd_analysis': funding_cvd_analysis, 'institutional_analysis': institutional_analysis,
-            'risk_analysis': risk_analysis, 'mtf_analysis': mtf_analysis, 'fvg_analysis': fvg_analysis,
-            'data': data, 'is_crypto': is_crypto, 'is_forex': is_forex, 'analysis_mode': analysis_mode
-        }
-        
-        # Store in cache
-        st.session_state.analysis_cache[cache_key] = {
-            'timestamp': current_time,
-            'data': analysis_data
-        }
-        
         # Generate Interactive Chart based on analysis mode
         if analysis_mode == "🔬 Detaylı Analiz":
-            st.subheader(f"📈 {symbol} - Fiyat Analizi")
-            
-            # Simple price display instead of complex chart
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Güncel Fiyat", f"${current_price:.4f}")
-            with col2:
-                price_change = ((current_price - data['close'].iloc[-2]) / data['close'].iloc[-2] * 100) if len(data) > 1 else 0
-                st.metric("24h Değişim", f"{price_change:.2f}%", delta=f"{price_change:.2f}%")
-            with col3:
-                st.metric("Veri Noktası", len(data))
-            
-            st.info("📊 Detaylı grafik analizi geliştirilme aşamasında. Şimdilik kart analizlerine odaklanabilirsiniz.")
-        
-        # Display Results with Professional Card Layout
-        from analysis_display import display_professional_analysis_results
-        display_professional_analysis_results(
-            symbol, current_price, overall_bias, bias_strength,
-            confluence, sentiment_analysis, scalp_analysis,
-            market_analysis, funding_cvd_analysis, institutional_analysis,
-            risk_analysis, mtf_analysis, fvg_analysis, data, is_crypto, is_forex, analysis_mode
-        )
+            with detail_slot:
+                st.subheader(f"📈 {symbol} - Fiyat Analizi")
+                
+                # Simple price display instead of complex chart
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Güncel Fiyat", f"${current_price:.4f}")
+                with col2:
+                    price_change = ((current_price - data['Close'].iloc[-2]) / data['Close'].iloc[-2] * 100) if len(data) > 1 else 0
+                    st.metric("24h Değişim", f"{price_change:.2f}%", delta=f"{price_change:.2f}%")
+                with col3:
+                    st.metric("Veri Noktası", len(data))
+                
+                generate_interactive_chart(data, {}, symbol, current_price,
+                                           analysis_data['institutional_analysis'],
+                                           chart_html=analysis_data.get('chart_html'))
+                
+                with st.expander("⏱️ Analiz Bileşen Süreleri"):
+                    timings = analysis_data.get('pipeline_timings', {})
+                    for node_name, seconds in sorted(timings.items(), key=lambda item: item[1], reverse=True):
+                        st.write(f"**{node_name}**: {seconds * 1000:.0f} ms")
         
     except Exception as e:
         st.error(f"🚫 Analiz hatası: {e}")
@@ -1269,7 +1295,7 @@ def perform_comprehensive_analysis(symbol, period, manual_timeframe, analysis_mo
         
         with col3:
             if st.button("🗑️ Önbelleği Temizle", use_container_width=True):
-                st.session_state.analysis_cache = {}
+                get_shared_analysis_cache().clear()
                 st.success("Önbellek temizlendi!")
                 st.rerun()
 
@@ -1602,7 +1628,7 @@ def display_comprehensive_results(symbol, current_price, overall_bias, bias_stre
             if st.button("💾 Sinyali Kaydet", type="primary", use_container_width=True):
                 try:
                     # Get signal tracker from session state
-                    signal_tracker = st.session_state.get('signal_tracker')
+                    signal_tracker = get_signal_tracker()
                     
                     if signal_tracker:
                         # Prepare signal data
@@ -1674,7 +1700,7 @@ def display_performance_dashboard():
     """Performans dashboard'ını göster"""
     try:
         # Get signal tracker from session state
-        signal_tracker = st.session_state.get('signal_tracker')
+        signal_tracker = get_signal_tracker()
         if not signal_tracker:
             st.error("❌ Sinyal takip sistemi başlatılamadı")
             return
@@ -1738,20 +1764,8 @@ def display_performance_dashboard():
         
         # Get daily performance data
         try:
-            import sqlite3
-            conn = sqlite3.connect(signal_tracker.db_path)
-            cursor = conn.cursor()
-            
-            # Get last 30 days performance
-            cursor.execute('''
-                SELECT date, win_rate, total_r, total_signals 
-                FROM daily_performance 
-                WHERE date >= date('now', '-30 days')
-                ORDER BY date
-            ''')
-            
-            daily_data = cursor.fetchall()
-            conn.close()
+            # Get last 30 days performance (precomputed daily rows)
+            daily_data = signal_tracker.get_gunluk_performans(30)
             
             if daily_data:
                 # Create simple dataframe for display
@@ -1782,7 +1796,22 @@ def display_performance_dashboard():
                 
         except Exception as e:
             st.warning(f"⚠️ Performans verileri yüklenirken hata: {str(e)}")
-        
+
+        # Long-term equity curve from the columnar export (only exit_time/r_multiple are read)
+        import signal_analytics
+        if signal_analytics.HAS_PYARROW:
+            with st.expander("📦 Uzun Dönem Equity Eğrisi (Parquet)"):
+                if st.button("🔄 Sinyal Geçmişini Dışa Aktar"):
+                    with st.spinner("Sinyal geçmişi aktarılıyor..."):
+                        counts = signal_analytics.export_signals(signal_tracker)
+                    st.success(f"✅ {sum(counts.values())} sinyal, {len(counts)} ay aktarıldı")
+
+                curve = signal_analytics.equity_curve()
+                if curve.empty:
+                    st.info("📊 Aktarılmış kapanmış sinyal yok")
+                else:
+                    st.line_chart(curve.rename("Kümülatif R"))
+
         # Risk analysis
         st.markdown("---")
         st.subheader("⚠️ Risk Analizi")
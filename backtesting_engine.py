@@ -7,6 +7,7 @@ from bias_analyzer import BiasAnalyzer
 from fvg_detector import FVGDetector
 from scalp_analyzer import ScalpAnalyzer
 from advanced_indicators import AdvancedIndicators
+from volatility_features import atr_features
 
 class BacktestingEngine:
     """
@@ -266,15 +267,11 @@ class BacktestingEngine:
     def _calculate_atr(self, data, index, period=14):
         """Calculate Average True Range for stop loss/take profit levels"""
         try:
-            start_idx = max(0, index - period)
-            subset = data.iloc[start_idx:index+1]
-            
-            high_low = subset['High'] - subset['Low']
-            high_close = abs(subset['High'] - subset['Close'].shift(1))
-            low_close = abs(subset['Low'] - subset['Close'].shift(1))
-            
-            true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-            return true_range.mean()
+            # Computed once for the whole series by the shared store, then indexed per trade
+            atr = atr_features(data, period)['atr'].iloc[index]
+            if pd.isna(atr):
+                return data['Close'].iloc[index] * 0.02
+            return atr
         except:
             return data['Close'].iloc[index] * 0.02  # 2% fallback
     
@@ -3,7 +3,8 @@ import pandas as pd
 import numpy as np
 from binance.client import Client
 from datetime import datetime, timedelta
-import streamlit as st
+import diagnostics
+from fetch_coalescer import coalesced
 
 class BinanceDataFetcher:
     """
@@ -24,6 +25,7 @@ class BinanceDataFetcher:
         except Exception as e:
             raise ConnectionError(f"Binance API'ye bağlanılamadı: {str(e)}")
     
+    @coalesced
     def get_klines(self, symbol, interval, period=None, start_time=None, end_time=None):
         """
         Get historical kline data from Binance
@@ -99,7 +101,7 @@ class BinanceDataFetcher:
             return df
             
         except Exception as e:
-            st.error(f"Binance'den veri alırken hata: {str(e)}")
+            diagnostics.error(f"Binance'den veri alırken hata: {str(e)}")
             return pd.DataFrame()
     
     def get_symbol_info(self, symbol):
@@ -116,7 +118,7 @@ class BinanceDataFetcher:
             info = self.client.get_symbol_info(symbol)
             return info
         except Exception as e:
-            st.error(f"Sembol bilgisi alınırken hata: {str(e)}")
+            diagnostics.error(f"Sembol bilgisi alınırken hata: {str(e)}")
             return None
     
     def get_all_symbols(self):
@@ -131,7 +133,7 @@ class BinanceDataFetcher:
             symbols = [s['symbol'] for s in exchange_info['symbols'] if s['status'] == 'TRADING']
             return symbols
         except Exception as e:
-            st.error(f"Sembol listesi alınırken hata: {str(e)}")
+            diagnostics.error(f"Sembol listesi alınırken hata: {str(e)}")
             return []
     
     def get_usdt_pairs(self):
@@ -146,7 +148,7 @@ class BinanceDataFetcher:
             usdt_pairs = [s for s in all_symbols if s.endswith('USDT')]
             return sorted(usdt_pairs)
         except Exception as e:
-            st.error(f"USDT çiftleri alınırken hata: {str(e)}")
+            diagnostics.error(f"USDT çiftleri alınırken hata: {str(e)}")
             return []
     
     def test_connection(self):
@@ -160,5 +162,5 @@ class BinanceDataFetcher:
             self.client.ping()
             return True
         except Exception as e:
-            st.error(f"Binance bağlantı testi başarısız: {str(e)}")
+            diagnostics.error(f"Binance bağlantı testi başarısız: {str(e)}")
             return False
\ No newline at end of file
@@ -6,7 +6,8 @@ import hmac
 import hashlib
 import time
 from datetime import datetime, timedelta
-import streamlit as st
+import diagnostics
+from fetch_coalescer import coalesced
 
 class BinanceFuturesFetcher:
     """
@@ -39,6 +40,7 @@ class BinanceFuturesFetcher:
             hashlib.sha256
         ).hexdigest()
     
+    @coalesced
     def get_klines(self, symbol, interval, period=None):
         """
         Get historical kline data from Binance Futures
@@ -66,7 +68,7 @@ class BinanceFuturesFetcher:
                 response = self.session.get(url, params=params, timeout=10)
             
             if response.status_code != 200:
-                st.error(f"Binance Futures API hatası: {response.status_code} - {response.text}")
+                diagnostics.error(f"Binance Futures API hatası: {response.status_code} - {response.text}")
                 return pd.DataFrame()
             
             data = response.json()
@@ -96,7 +98,7 @@ class BinanceFuturesFetcher:
             return df
             
         except Exception as e:
-            st.error(f"Binance Futures veri hatası: {str(e)}")
+            diagnostics.error(f"Binance Futures veri hatası: {str(e)}")
             return pd.DataFrame()
     
     def _period_to_limit(self, period, interval):
@@ -147,7 +149,7 @@ class BinanceFuturesFetcher:
                 return []
                 
         except Exception as e:
-            st.error(f"Futures sembolleri alınamadı: {str(e)}")
+            diagnostics.error(f"Futures sembolleri alınamadı: {str(e)}")
             return []
     
     def get_popular_futures(self):
@@ -174,11 +176,11 @@ class BinanceFuturesFetcher:
             if response.status_code == 200:
                 return True
             else:
-                st.error(f"Binance Futures bağlantı testi başarısız: {response.status_code}")
+                diagnostics.error(f"Binance Futures bağlantı testi başarısız: {response.status_code}")
                 return False
                 
         except Exception as e:
-            st.error(f"Bağlantı testi başarısız: {str(e)}")
+            diagnostics.error(f"Bağlantı testi başarısız: {str(e)}")
             return False
     
     def get_symbol_info(self, symbol):
@@ -199,5 +201,5 @@ class BinanceFuturesFetcher:
                 return None
                 
         except Exception as e:
-            st.error(f"Sembol bilgisi alınamadı: {str(e)}")
+            diagnostics.error(f"Sembol bilgisi alınamadı: {str(e)}")
             return None
\ No newline at end of file
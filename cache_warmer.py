@@ -0,0 +1,206 @@
+"""
+FinansLab Önbellek Isıtıcı
+==========================
+
+Favori ve en çok istenen sembollerin analizlerini paylaşımlı önbellekte hazır tutar:
+- Hedefler: tüm oturumların favorileri + en çok istenen top-N anahtar
+- Her anahtar, zaman diliminin bar kapanışından kısa süre sonra yenilenir
+- Eşzamanlılık sınırlıdır (küçük thread havuzu)
+- Etkileşimli istekle aynı anda çalışırsa single-flight sayesinde tek hesaplama yapılır
+"""
+
+import logging
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from analysis_cache import seconds_until_bar_close
+
+logger = logging.getLogger(__name__)
+
+
+class CacheWarmer:
+    """
+    Background refresher for analysis cache keys
+
+    Keys follow the shared cache layout (symbol, period, manual_timeframe, mode).
+    compute(key, timeframe) must return the analysis result for the resolved
+    timeframe (None results are not cached).
+    """
+
+    def __init__(self, cache, compute, top_n=10, max_workers=2, refresh_delay=5.0,
+                 poll_interval=30.0, favorite_ttl=24 * 3600, max_tracked=500):
+        self.cache = cache
+        self.compute = compute
+        self.top_n = top_n
+        self.max_workers = max_workers
+        self.refresh_delay = refresh_delay
+        self.poll_interval = poll_interval
+        self.favorite_ttl = favorite_ttl
+        self.max_tracked = max_tracked
+
+        self._requests = Counter()   # key -> request count
+        self._timeframes = {}        # key -> last resolved timeframe
+        self._favorites = {}         # owner -> (keys, last_seen)
+        self._due = {}               # key -> next refresh time
+        self._running = set()
+        self._lock = threading.Lock()
+
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+        self._executor = None
+        self.stats = {'refreshed': 0, 'failed': 0}
+
+    # ------------------------------------------------------------------
+    # Demand signals (called from the UI)
+    # ------------------------------------------------------------------
+
+    def record_request(self, key, timeframe):
+        """Count an interactive analysis request and remember its resolved timeframe"""
+        with self._lock:
+            self._requests[key] += 1
+            self._timeframes[key] = timeframe
+            if len(self._requests) > self.max_tracked:
+                keep = dict(self._requests.most_common(self.max_tracked // 2))
+                self._requests = Counter(keep)
+                self._timeframes = {k: tf for k, tf in self._timeframes.items()
+                                    if k in keep or self._is_favorite_locked(k)}
+
+    def set_favorites(self, owner, keys):
+        """
+        Replace one session's favorites (sessions refresh this on every render)
+
+        Args:
+            owner (str): Session token
+            keys (list): Cache keys
+        """
+        with self._lock:
+            self._favorites[owner] = (list(keys), time.time())
+        self._wakeup.set()
+
+    def _is_favorite_locked(self, key):
+        return any(key in keys for keys, _ in self._favorites.values())
+
+    def _timeframe_for(self, key):
+        manual_timeframe = key[2]
+        if manual_timeframe != "auto":
+            return manual_timeframe
+        return self._timeframes.get(key)
+
+    def targets(self):
+        """
+        Keys to keep warm with their timeframes
+
+        Returns:
+            dict: key -> timeframe (keys with an unknown 'auto' timeframe are skipped)
+        """
+        now = time.time()
+        with self._lock:
+            stale = [owner for owner, (_, seen) in self._favorites.items() if now - seen > self.favorite_ttl]
+            for owner in stale:
+                del self._favorites[owner]
+
+            keys = [key for keys, _ in self._favorites.values() for key in keys]
+            keys += [key for key, _ in self._requests.most_common(self.top_n)]
+
+            targets = {}
+            for key in keys:
+                timeframe = self._timeframe_for(key)
+                if timeframe:
+                    targets[key] = timeframe
+            return targets
+
+    # ------------------------------------------------------------------
+    # Worker
+    # ------------------------------------------------------------------
+
+    def start(self):
+        """Start the scheduler thread if not already running"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="cache-warmer")
+        self._thread = threading.Thread(target=self._run, name="cache-warmer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=5):
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join(timeout)
+        if self._executor:
+            self._executor.shutdown(wait=False)
+
+    def _next_refresh(self, timeframe):
+        return time.time() + seconds_until_bar_close(timeframe) + self.refresh_delay
+
+    def _schedule(self):
+        """
+        Submit due keys
+
+        Returns:
+            float: Seconds until the next key is due
+        """
+        now = time.time()
+        targets = self.targets()
+        next_due = now + self.poll_interval
+
+        with self._lock:
+            for key in list(self._due):
+                if key not in targets:
+                    del self._due[key]
+
+            for key, timeframe in targets.items():
+                due = self._due.get(key)
+                if due is None:
+                    # New target: warm now unless an interactive request already filled it
+                    due = self._next_refresh(timeframe) if self.cache.contains(key) else now
+                    self._due[key] = due
+
+                if due <= now and key not in self._running:
+                    self._running.add(key)
+                    self._executor.submit(self._refresh, key, timeframe)
+                elif key not in self._running:
+                    next_due = min(next_due, due)
+
+        return max(next_due - now, 0.5)
+
+    def _refresh(self, key, timeframe):
+        try:
+            self.cache.get_or_compute(key, lambda: self.compute(key, timeframe), timeframe=timeframe)
+            self.stats['refreshed'] += 1
+        except Exception as e:
+            self.stats['failed'] += 1
+            logger.warning(f"Önbellek ısıtma hatası {key}: {str(e)}")
+        finally:
+            with self._lock:
+                self._running.discard(key)
+                if key in self._due:
+                    self._due[key] = self._next_refresh(timeframe)
+            self._wakeup.set()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wakeup.clear()
+            try:
+                wait_for = self._schedule()
+            except Exception as e:
+                logger.error(f"Önbellek ısıtıcı hatası: {str(e)}")
+                wait_for = self.poll_interval
+            self._wakeup.wait(wait_for)
+
+
+_warmer = None
+_warmer_lock = threading.Lock()
+
+
+def get_cache_warmer(cache, compute, **kwargs):
+    """Process-wide warmer, created and started on first call"""
+    global _warmer
+    with _warmer_lock:
+        if _warmer is None:
+            _warmer = CacheWarmer(cache, compute, **kwargs)
+            _warmer.start()
+        return _warmer
@@ -0,0 +1,173 @@
+"""
+FinansLab Grafik Oluşturucu
+===========================
+
+Büyük veri setleri için hafif interaktif grafik:
+- LTTB veya min/max korumalı örnekleme (fiyat şekli ve uç noktalar korunur)
+- Çizgi serileri WebGL (Scattergl) ile çizilir
+- Grafik bir kez HTML'e serileştirilir; analiz sonucu ile birlikte saklanır,
+  Streamlit yeniden çalıştırmalarında tekrar serileştirilmez
+"""
+
+import numpy as np
+
+EMA_COLORS = ['#FF9800', '#4CAF50', '#9C27B0', '#F44336', '#795548']
+EMA_PERIODS = [45, 89, 144, 200, 276]
+
+
+def lttb_indices(y, threshold):
+    """
+    Largest-Triangle-Three-Buckets point selection
+
+    Args:
+        y (array): Series values (x is taken as the bar position)
+        threshold (int): Number of points to keep
+
+    Returns:
+        np.ndarray: Sorted indices of the selected points
+    """
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    # Gaps would break the triangle areas; treat them as the previous value
+    if np.isnan(y).any():
+        mask = np.isnan(y)
+        idx = np.where(~mask, np.arange(n), 0)
+        np.maximum.accumulate(idx, out=idx)
+        y = y[idx]
+
+    x = np.arange(n, dtype=float)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start, next_end = edges[i + 1], edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        bucket_x = x[start:end]
+        bucket_y = y[start:end]
+        areas = np.abs((x[a] - avg_x) * (bucket_y - y[a]) - (x[a] - bucket_x) * (avg_y - y[a]))
+        a = start + int(np.argmax(areas))
+        selected[i + 1] = a
+
+    return selected
+
+
+def minmax_indices(y, threshold):
+    """
+    Keep the minimum and maximum of each bucket (wicks/extremes are never lost)
+
+    Returns:
+        np.ndarray: Sorted, unique indices (at most threshold points)
+    """
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if threshold >= n or threshold < 4:
+        return np.arange(n)
+
+    buckets = threshold // 2
+    edges = np.linspace(0, n, buckets + 1).astype(int)
+    starts = edges[:-1]
+    filled = np.where(np.isnan(y), np.nanmean(y), y)
+
+    mins = np.array([s + np.argmin(filled[s:e]) for s, e in zip(starts, edges[1:])])
+    maxs = np.array([s + np.argmax(filled[s:e]) for s, e in zip(starts, edges[1:])])
+    return np.unique(np.concatenate([[0, n - 1], mins, maxs]))
+
+
+def downsample_indices(y, max_points, visible_bars=None, method='lttb'):
+    """
+    Choose which bars to plot
+
+    The most recent visible_bars (the initial zoom window) get most of the point
+    budget; older history shares the rest.
+    """
+    n = len(y)
+    if n <= max_points:
+        return np.arange(n)
+
+    pick = lttb_indices if method == 'lttb' else minmax_indices
+
+    if not visible_bars or visible_bars >= n:
+        return pick(y, max_points)
+
+    split = n - visible_bars
+    visible_budget = min(visible_bars, int(max_points * 0.75))
+    history_budget = max(max_points - visible_budget, 3)
+
+    history = pick(y[:split], history_budget)
+    visible = pick(y[split:], visible_budget) + split
+    return np.concatenate([history, visible])
+
+
+def build_chart_figure(data, ema_data, symbol, institutional_analysis=None,
+                       max_points=2000, visible_bars=500, method='lttb'):
+    """
+    Build the price/EMA figure with downsampled WebGL line traces
+
+    Args:
+        data (pd.DataFrame): OHLCV data (Close column required)
+        ema_data (dict): period -> EMA series aligned with data
+        max_points (int): Point budget per line
+        visible_bars (int): Bars shown in the initial x-axis range
+        method (str): 'lttb' or 'minmax'
+    """
+    import plotly.graph_objects as go
+
+    close = data['Close'].to_numpy(dtype=float)
+    indices = downsample_indices(close, max_points, visible_bars, method)
+    x = data.index[indices]
+
+    fig = go.Figure()
+    fig.add_trace(go.Scattergl(
+        x=x, y=close[indices], mode='lines',
+        name=f'{symbol} Fiyat', line=dict(color='#2196F3', width=3)
+    ))
+
+    for color, period in zip(EMA_COLORS, EMA_PERIODS):
+        series = ema_data.get(period) if ema_data else None
+        if series is None or len(series) != len(close):
+            continue
+        fig.add_trace(go.Scattergl(
+            x=x, y=np.asarray(series, dtype=float)[indices], mode='lines',
+            name=f'EMA {period}', line=dict(color=color, width=2), opacity=0.8
+        ))
+
+    # Institutional levels are shapes, not traces - cheap regardless of data size
+    levels = (institutional_analysis or {}).get('nearest_levels') or {}
+    for key, color, label in (('support', 'green', 'Support'), ('resistance', 'red', 'Resistance')):
+        level = levels.get(key)
+        price = level.get('price', 0) if level else 0
+        if price > 0:
+            fig.add_hline(y=price, line_dash="dash", line_color=color,
+                          annotation_text=f"{label}: ${price:.4f}")
+
+    fig.update_layout(
+        title=f"{symbol} - Teknik Analiz Grafiği",
+        xaxis_title="Tarih",
+        yaxis_title="Fiyat ($)",
+        template="plotly_dark",
+        height=600,
+        showlegend=True
+    )
+    if visible_bars and len(data) > visible_bars:
+        fig.update_xaxes(range=[data.index[-visible_bars], data.index[-1]])
+
+    return fig
+
+
+def build_chart_html(data, ema_data, symbol, institutional_analysis=None, **kwargs):
+    """
+    Serialize the chart once to an embeddable HTML fragment (plotly.js from CDN)
+    """
+    import plotly.io as pio
+
+    fig = build_chart_figure(data, ema_data, symbol, institutional_analysis, **kwargs)
+    return pio.to_html(fig, include_plotlyjs='cdn', full_html=False, config={'responsive': True})
@@ -2,8 +2,9 @@ import requests
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-import streamlit as st
+import diagnostics
 import time
+from fetch_coalescer import coalesced
 
 class CryptoDataFetcher:
     """
@@ -13,6 +14,7 @@ class CryptoDataFetcher:
     def __init__(self):
         self.base_url = "https://api.binance.com"
         
+    @coalesced
     def get_klines(self, symbol, interval, period=None):
         """
         Get historical kline data from Binance public API
@@ -42,7 +44,7 @@ class CryptoDataFetcher:
             response = requests.get(url, params=params, timeout=10)
             
             if response.status_code != 200:
-                st.error(f"API hatası: {response.status_code} - {response.text}")
+                diagnostics.error(f"API hatası: {response.status_code} - {response.text}")
                 return pd.DataFrame()
             
             data = response.json()
@@ -74,10 +76,10 @@ class CryptoDataFetcher:
             return df
             
         except requests.exceptions.RequestException as e:
-            st.error(f"Ağ hatası: {str(e)}")
+            diagnostics.error(f"Ağ hatası: {str(e)}")
             return pd.DataFrame()
         except Exception as e:
-            st.error(f"Veri işleme hatası: {str(e)}")
+            diagnostics.error(f"Veri işleme hatası: {str(e)}")
             return pd.DataFrame()
     
     def _period_to_limit(self, period, interval):
@@ -131,11 +133,11 @@ class CryptoDataFetcher:
             if response.status_code == 200:
                 return True
             else:
-                st.error(f"API test başarısız: {response.status_code}")
+                diagnostics.error(f"API test başarısız: {response.status_code}")
                 return False
                 
         except Exception as e:
-            st.error(f"Bağlantı testi başarısız: {str(e)}")
+            diagnostics.error(f"Bağlantı testi başarısız: {str(e)}")
             return False
     
     def get_all_symbols(self):
@@ -154,7 +156,7 @@ class CryptoDataFetcher:
                 return []
                 
         except Exception as e:
-            st.error(f"Sembol listesi alınamadı: {str(e)}")
+            diagnostics.error(f"Sembol listesi alınamadı: {str(e)}")
             return []
     
     def get_usdt_pairs(self):
@@ -0,0 +1,100 @@
+"""
+FinansLab Tanılama Mesajları
+============================
+
+Kütüphane modülleri (fetcher'lar, indikatörler, motorlar) kullanıcıya yönelik
+hata/uyarı mesajlarını doğrudan Streamlit yerine buraya gönderir.
+
+- Varsayılan hedef: logging (worker, tarayıcı, backtest - Streamlit import edilmez)
+- Streamlit arayüzü başlangıçta StreamlitSink kurar (ince adaptör)
+"""
+
+import logging
+import threading
+
+logger = logging.getLogger("finanslab")
+
+
+class LoggingSink:
+    """Default sink: route messages to the standard logging module"""
+
+    LEVELS = {
+        'error': logging.ERROR,
+        'warning': logging.WARNING,
+        'info': logging.INFO,
+        'success': logging.INFO
+    }
+
+    def emit(self, level, message):
+        logger.log(self.LEVELS.get(level, logging.INFO), message)
+
+
+class StreamlitSink:
+    """
+    Show messages in the running Streamlit script
+
+    Calls from threads without a script context (e.g. pipeline workers) fall back
+    to logging instead of triggering Streamlit context warnings.
+    """
+
+    def __init__(self):
+        import streamlit as st
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        self._st = st
+        self._get_ctx = get_script_run_ctx
+        self._fallback = LoggingSink()
+
+    def emit(self, level, message):
+        if self._get_ctx() is None:
+            self._fallback.emit(level, message)
+            return
+        getattr(self._st, level, self._st.info)(message)
+
+
+class CollectingSink:
+    """Keep messages in memory (batch jobs / reports can inspect them afterwards)"""
+
+    def __init__(self, max_messages=1000):
+        self.max_messages = max_messages
+        self.messages = []
+        self._lock = threading.Lock()
+
+    def emit(self, level, message):
+        with self._lock:
+            self.messages.append((level, message))
+            if len(self.messages) > self.max_messages:
+                del self.messages[0]
+
+
+_sink = LoggingSink()
+
+
+def set_sink(sink):
+    """
+    Install the process-wide diagnostics sink
+
+    Args:
+        sink: Object with emit(level, message); None restores logging
+    """
+    global _sink
+    _sink = sink if sink is not None else LoggingSink()
+
+
+def get_sink():
+    return _sink
+
+
+def error(message):
+    _sink.emit('error', message)
+
+
+def warning(message):
+    _sink.emit('warning', message)
+
+
+def info(message):
+    _sink.emit('info', message)
+
+
+def success(message):
+    _sink.emit('success', message)
@@ -3,6 +3,7 @@ import numpy as np
 import yfinance as yf
 from datetime import datetime, timedelta
 import warnings
+from fetch_coalescer import coalesced
 warnings.filterwarnings('ignore')
 
 class EnhancedDataFetcher:
@@ -97,6 +98,7 @@ class EnhancedDataFetcher:
             }
         }
     
+    @coalesced
     def get_klines(self, symbol, interval, period=None):
         """
         Get historical data with multiple fallback sources
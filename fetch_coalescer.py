@@ -0,0 +1,139 @@
+"""
+FinansLab Veri İsteği Birleştirici
+==================================
+
+Aynı (sınıf, sembol, interval, period) için eşzamanlı gelen istekleri tek HTTP
+çağrısına indirir:
+- İlk çağıran veriyi çeker, diğerleri aynı Future'ı bekler
+- Tamamlanan sonuç kısa bir süre (result_ttl) daha paylaşılır
+- Tüm fetcher sınıfları tek bir süreç geneli birleştiriciyi kullanır
+"""
+
+import functools
+import threading
+import time
+from concurrent.futures import Future
+
+
+class RequestCoalescer:
+    """
+    Process-wide single-flight layer for data fetcher calls
+
+    stats:
+        calls: Every coalesced call
+        fetches: Calls that actually hit the data source
+        hits: Calls served from a just-completed result
+        coalesced: Calls that waited on another caller's in-flight fetch
+        errors: Fetches that raised
+    """
+
+    def __init__(self, result_ttl=5.0, max_results=256):
+        self.result_ttl = result_ttl
+        self.max_results = max_results
+        self._inflight = {}  # key -> Future
+        self._results = {}   # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self.stats = {'calls': 0, 'fetches': 0, 'hits': 0, 'coalesced': 0, 'errors': 0}
+
+    @staticmethod
+    def _is_empty(value):
+        return value is None or getattr(value, 'empty', False)
+
+    @staticmethod
+    def _share(value):
+        # Callers may add columns to the frame they receive; hand out private copies
+        return value.copy() if hasattr(value, 'copy') else value
+
+    def _prune_locked(self, now):
+        expired = [k for k, (expires_at, _) in self._results.items() if expires_at <= now]
+        for k in expired:
+            del self._results[k]
+        while len(self._results) > self.max_results:
+            self._results.pop(next(iter(self._results)))
+
+    def call(self, key, fetch):
+        """
+        Run fetch() once for all concurrent callers with the same key
+
+        Args:
+            key (tuple): Request identity
+            fetch (callable): Zero-argument function performing the request
+
+        Returns:
+            Fetch result (a private copy for every caller)
+        """
+        now = time.time()
+        with self._lock:
+            self.stats['calls'] += 1
+
+            entry = self._results.get(key)
+            if entry is not None and entry[0] > now:
+                self.stats['hits'] += 1
+                return self._share(entry[1])
+
+            future = self._inflight.get(key)
+            if future is None:
+                future = Future()
+                self._inflight[key] = future
+                leader = True
+                self.stats['fetches'] += 1
+            else:
+                leader = False
+                self.stats['coalesced'] += 1
+
+        if not leader:
+            return self._share(future.result())
+
+        try:
+            value = fetch()
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(key, None)
+                self.stats['errors'] += 1
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._inflight.pop(key, None)
+            if self.result_ttl > 0 and not self._is_empty(value):
+                now = time.time()
+                self._results[key] = (now + self.result_ttl, value)
+                self._prune_locked(now)
+        future.set_result(value)
+        # The leader's frame is cached and shared as well, so it also gets a copy
+        return self._share(value)
+
+    def clear(self):
+        """Drop completed results (in-flight fetches are not affected)"""
+        with self._lock:
+            self._results.clear()
+
+    def inflight_count(self):
+        with self._lock:
+            return len(self._inflight)
+
+
+_coalescer = RequestCoalescer()
+
+
+def get_request_coalescer():
+    """Coalescer shared by every fetcher class in the process"""
+    return _coalescer
+
+
+def coalesced(method):
+    """
+    Decorator for fetcher methods: concurrent identical calls share one request
+
+    The key is (class name, method name, arguments), so separate fetcher instances
+    (e.g. one per Streamlit session) still share the in-flight request.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (type(self).__name__, method.__name__, args, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return method(self, *args, **kwargs)
+        return _coalescer.call(key, lambda: method(self, *args, **kwargs))
+    return wrapper
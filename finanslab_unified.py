@@ -21,7 +21,10 @@ import os
 import requests
 import logging
 import gc
-from collections import deque
+from signal_ranker import TopKSignalRanker
+from telegram_queue import get_telegram_queue
+from signal_dedup_store import SignalDedupStore
+from volatility_features import atr_features
 
 # Streamlit page config
 st.set_page_config(
@@ -71,6 +74,9 @@ class FinansLabUnified:
         self.live_signals = {}
         self.performance_metrics = {}
         
+        # Streaming top-k of the best setups across all scans
+        self.signal_ranker = TopKSignalRanker(k=10)
+        
         # Risk management
         self.risk_per_trade = 0.01  # 1%
         self.reward_ratio = 1.5     # 1.5R
@@ -79,10 +85,15 @@ class FinansLabUnified:
         self.telegram_bot_token = os.getenv('TELEGRAM_BOT_TOKEN', '7882134734:AAF6BPwsIwuPW9nI7JeW7ez9VLJ_Jm93zpw')
         self.telegram_chat_id = os.getenv('TELEGRAM_CHAT_ID', '-1002652876177')
         self.telegram_topic_id = os.getenv('TELEGRAM_TOPIC_ID', '13')
-        self.sent_signals = set()  # Track sent signals to avoid duplicates
+        # Track sent signals to avoid duplicates (expires per key, survives restarts)
+        self.signal_dedup_ttl = 4 * 3600
+        self.sent_signals = SignalDedupStore(
+            ttl_seconds=self.signal_dedup_ttl,
+            max_size=500,
+            db_path="telegram_outbox.db"
+        )
         
         # Rate limiting for Telegram API
-        self.telegram_calls = deque()
         self.max_calls_per_minute = 20
         
         # Bot stability tracking
@@ -90,6 +101,14 @@ class FinansLabUnified:
         self.error_count = 0
         self.max_errors = 5
         
+        # Outbound Telegram queue: rate limiting and retries run off the scan path.
+        # Shared by every session in the process (one sender, one rate limit per outbox)
+        self.telegram_queue = get_telegram_queue(
+            self.telegram_bot_token,
+            max_calls_per_minute=self.max_calls_per_minute
+        )
+        self.telegram_queue.add_listener(self._on_telegram_success, self._on_telegram_failure)
+        
         # Setup logging
         logging.basicConfig(
             level=logging.INFO,
@@ -136,50 +155,17 @@ class FinansLabUnified:
         self.telegram_bot_token = bot_token
         self.telegram_chat_id = chat_id
     
-    def check_rate_limit(self):
-        """Check if we can make a Telegram API call"""
-        now = time.time()
-        # Remove calls older than 1 minute
-        while self.telegram_calls and self.telegram_calls[0] < now - 60:
-            self.telegram_calls.popleft()
-        
-        if len(self.telegram_calls) < self.max_calls_per_minute:
-            self.telegram_calls.append(now)
-            return True
-        return False
+    def _on_telegram_success(self, message_id):
+        """Called by the delivery queue after a successful send"""
+        self.error_count = 0  # Reset error count on success
+        self.last_heartbeat = datetime.now()
     
-    def robust_telegram_request(self, url, data, max_retries=3):
-        """Make robust Telegram API request with retry logic"""
-        for attempt in range(max_retries):
-            try:
-                if not self.check_rate_limit():
-                    time.sleep(3)  # Wait if rate limited
-                    continue
-                
-                response = requests.post(url, data=data, timeout=10)
-                
-                if response.status_code == 200:
-                    self.error_count = 0  # Reset error count on success
-                    self.last_heartbeat = datetime.now()
-                    return response
-                elif response.status_code == 429:  # Rate limited
-                    time.sleep(5)
-                    continue
-                else:
-                    logging.warning(f"Telegram API error {response.status_code}: {response.text}")
-                    
-            except requests.exceptions.Timeout:
-                logging.warning(f"Telegram timeout on attempt {attempt + 1}")
-                time.sleep(2 ** attempt)  # Exponential backoff
-            except Exception as e:
-                logging.error(f"Telegram request error: {str(e)}")
-                time.sleep(2 ** attempt)
-        
+    def _on_telegram_failure(self, message_id, error):
+        """Called by the delivery queue when a message exhausted its retries"""
         self.error_count += 1
-        return None
     
     def send_telegram_signal(self, signal_data):
-        """Send trading signal to Telegram with stability features"""
+        """Queue trading signal for Telegram delivery with stability features"""
         if not self.telegram_bot_token or not self.telegram_chat_id:
             return False
         
@@ -212,7 +198,6 @@ class FinansLabUnified:
 
 🕐 {datetime.now().strftime('%H:%M')}"""
             
-            url = f"https://api.telegram.org/bot{self.telegram_bot_token}/sendMessage"
             data = {
                 'chat_id': self.telegram_chat_id,
                 'text': message
@@ -222,16 +207,13 @@ class FinansLabUnified:
             if self.telegram_topic_id and self.telegram_topic_id != '':
                 data['message_thread_id'] = int(self.telegram_topic_id)
             
-            # Send with robust error handling
-            response = self.robust_telegram_request(url, data)
-            
-            if response and response.status_code == 200:
-                if signal_data['symbol'] != 'TEST-SYMBOL':
-                    self.sent_signals.add(signal_id)
-                logging.info(f"Signal sent successfully: {signal_data['symbol']}")
-                return True
+            # Queue for background delivery (rate limit + retries off the scan path)
+            self.telegram_queue.enqueue(data, bot_token=self.telegram_bot_token)
             
-            return False
+            if signal_data['symbol'] != 'TEST-SYMBOL':
+                self.sent_signals.add(signal_id)
+            logging.info(f"Signal queued: {signal_data['symbol']}")
+            return True
             
         except Exception as e:
             logging.error(f"Signal send error: {str(e)}")
@@ -241,10 +223,8 @@ class FinansLabUnified:
     def cleanup_memory(self):
         """Periodic memory cleanup"""
         try:
-            # Limit sent signals cache size
-            if len(self.sent_signals) > 100:
-                # Keep only last 50 signals
-                self.sent_signals = set(list(self.sent_signals)[-50:])
+            # Drop expired signal keys (store size is bounded by max_size)
+            self.sent_signals.purge_expired()
             
             # Force garbage collection
             gc.collect()
@@ -292,8 +272,6 @@ class FinansLabUnified:
     def add_technical_indicators(self, data):
         """Add all technical indicators to data"""
         close = data['Close']
-        high = data['High']
-        low = data['Low']
         volume = data['Volume'] if 'Volume' in data.columns else pd.Series([1] * len(data))
         
         # EMAs
@@ -315,11 +293,7 @@ class FinansLabUnified:
         data['MACD_Histogram'] = data['MACD'] - data['MACD_Signal']
         
         # ATR
-        tr1 = high - low
-        tr2 = abs(high - close.shift())
-        tr3 = abs(low - close.shift())
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        data['ATR'] = tr.rolling(window=14).mean()
+        data['ATR'] = atr_features(data)['atr']
         
         # Bollinger Bands
         sma20 = close.rolling(window=20).mean()
@@ -687,9 +661,13 @@ class FinansLabUnified:
         all_results = []
         excellent_signals = []
         
+        # Each scan cycle ranks from scratch (previous cycle's setups are stale)
+        self.signal_ranker.reset()
+        
         for category, symbols in self.symbols.items():
             for symbol in symbols:
                 result = self.comprehensive_analysis(symbol)
+                self.signal_ranker.offer(result)
                 if result and result['confluence']['quality'] in ['MÜKEMMEL', 'ÇOK İYİ']:
                     all_results.append(result)
                     if result['confluence']['quality'] == 'MÜKEMMEL':
@@ -697,7 +675,22 @@ class FinansLabUnified:
                         # Send excellent signals to Telegram
                         self.send_telegram_signal(result)
         
+        # Every excellent result, best first (same order as the top-k ranking)
+        excellent_signals.sort(key=self.signal_ranker.key, reverse=True)
         return all_results, excellent_signals, session, activity, interval
+    
+    def get_top_signals(self, qualities=('MÜKEMMEL', 'ÇOK İYİ')):
+        """
+        Current top-k setups of the running (or last) scan, best first (dashboard priority view)
+        
+        Args:
+            qualities (tuple): Confluence qualities to keep
+            
+        Returns:
+            list: Scan results ranked by confluence score, bias conviction and recency
+        """
+        return [result for result in self.signal_ranker.top()
+                if result['confluence']['quality'] in qualities]
 
 # Streamlit UI Implementation
 def main():
@@ -878,11 +871,12 @@ def main():
                 success_rate = ((excellent_count + good_count) / len(results) * 100) if results else 0
                 st.metric("Başarı Oranı", f"{success_rate:.1f}%")
         
-        # Clean signal display
-        if excellent:
+        # Clean signal display: ranked top-k of the scan
+        priority_signals = system.get_top_signals(qualities=('MÜKEMMEL',))
+        if priority_signals:
             st.markdown("### 🔥 Öncelikli Trading Sinyalleri")
             
-            for result in excellent:
+            for result in priority_signals:
                 # Compact signal card
                 direction_emoji = "🟢" if result['risk']['direction'] == "LONG" else "🔴"
                 
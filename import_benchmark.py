@@ -0,0 +1,123 @@
+"""
+FinansLab Import Süresi Ölçümü
+==============================
+
+app.py soğuk başlangıç maliyetini ölçer:
+- Eager (modül seviyesinde) importlar birlikte, temiz bir süreçte ölçülür
+- Fonksiyon içinde (lazy) yüklenen modüllerin tek tek maliyeti raporlanır
+- Soğuk başlangıç bütçeyi aşarsa çıkış kodu 1 döner (CI'da regresyon yakalar)
+
+Kullanım:
+    python import_benchmark.py [--budget 1.5] [--runs 5]
+"""
+
+import argparse
+import ast
+import os
+import statistics
+import subprocess
+import sys
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+
+# Cold start budget in seconds for everything app.py imports at module level
+DEFAULT_BUDGET = 1.5
+
+
+def collect_imports(path=APP_PATH):
+    """
+    Split the modules imported by app.py into eager (module level) and lazy (inside functions)
+
+    Returns:
+        tuple: (eager modules, lazy modules) - top-level package names, in first-seen order
+    """
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+
+    def names(node):
+        if isinstance(node, ast.Import):
+            return [alias.name for alias in node.names]
+        if isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            return [node.module]
+        return []
+
+    eager = []
+    for node in tree.body:
+        for name in names(node):
+            if name not in eager:
+                eager.append(name)
+
+    lazy = []
+    for node in ast.walk(tree):
+        if node in tree.body:
+            continue
+        for name in names(node):
+            if name not in eager and name not in lazy:
+                lazy.append(name)
+
+    return eager, lazy
+
+
+def measure(modules, runs=5):
+    """
+    Median wall time of importing the modules together in a fresh interpreter
+
+    Returns:
+        tuple: (seconds or None, error message or None)
+    """
+    code = (
+        "import time; t = time.perf_counter()\n"
+        + "".join(f"import {m}\n" for m in modules)
+        + "print(time.perf_counter() - t)"
+    )
+    samples = []
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=os.path.dirname(APP_PATH), capture_output=True, text=True
+        )
+        if proc.returncode != 0:
+            lines = proc.stderr.strip().splitlines()
+            return None, lines[-1] if lines else f"exit {proc.returncode}"
+        samples.append(float(proc.stdout.strip().splitlines()[-1]))
+    return statistics.median(samples), None
+
+
+def run_benchmark(budget=DEFAULT_BUDGET, runs=5):
+    """
+    Print the report and return the process exit code
+    """
+    eager, lazy = collect_imports()
+
+    print("=== FinansLab Import Süresi ===")
+    print(f"\nEager importlar ({len(eager)}): {', '.join(eager)}")
+
+    cold_start, error = measure(eager, runs)
+    if error:
+        print(f"❌ Soğuk başlangıç ölçülemedi: {error}")
+        return 2
+
+    print("\nModül başına maliyet (temiz süreç, medyan):")
+    for module in eager + lazy:
+        seconds, error = measure([module], runs)
+        kind = "eager" if module in eager else "lazy "
+        if error:
+            print(f"  [{kind}] {module:<30} yüklenemedi ({error})")
+        else:
+            print(f"  [{kind}] {module:<30} {seconds * 1000:8.1f} ms")
+
+    print(f"\nSoğuk başlangıç: {cold_start * 1000:.1f} ms (bütçe: {budget * 1000:.0f} ms)")
+    if cold_start > budget:
+        print("❌ Soğuk başlangıç bütçeyi aştı")
+        return 1
+
+    print("✅ Bütçe içinde")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="app.py import süresi ölçümü")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET, help="Soğuk başlangıç bütçesi (saniye)")
+    parser.add_argument("--runs", type=int, default=5, help="Modül başına ölçüm sayısı")
+    args = parser.parse_args()
+    sys.exit(run_benchmark(args.budget, args.runs))
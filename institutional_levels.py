@@ -1,8 +1,239 @@
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+import threading
+from collections import OrderedDict
+
 import pytz
 
+DAY_NS = 86_400 * 10**9
+HOUR_NS = 3_600 * 10**9
+PERIOD_KINDS = ('yearly', 'quarterly', 'monthly', 'weekly', 'daily')
+
+# Session times in UTC (hours, end inclusive)
+SESSIONS = {
+    'asia': {'start': 23, 'end': 8},      # 23:00-08:00 UTC
+    'london': {'start': 8, 'end': 16},    # 08:00-16:00 UTC
+    'us': {'start': 13, 'end': 22}        # 13:00-22:00 UTC (overlaps with London)
+}
+
+
+NS_PER_UNIT = {'s': 10**9, 'ms': 10**6, 'us': 10**3, 'ns': 1}
+
+
+def _utc_ns(index):
+    """Bar times as int64 ns since the epoch in UTC (naive indexes are taken as UTC)"""
+    return index.asi8 * NS_PER_UNIT[index.unit]  # asi8 is a view; only the scaling copies
+
+
+def _local_ns(index):
+    """Bar wall-clock times in the index's timezone as int64 ns (naive indexes are taken as UTC)"""
+    return _utc_ns(index if index.tz is None else index.tz_localize(None))
+
+
+def _period_labels(local_days, utc_days):
+    """
+    Calendar period numbers for day numbers since the epoch
+
+    Days and weeks follow the index's timezone; months, quarters and years
+    start at 00:00 UTC.
+    """
+    months = utc_days.astype('datetime64[D]').astype('datetime64[M]').astype(np.int64)
+    return {
+        'yearly': months // 12,
+        'quarterly': months // 3,
+        'monthly': months,
+        'weekly': (local_days + 3) // 7,  # Monday-based weeks (1970-01-01 was a Thursday)
+        'daily': local_days,
+    }
+
+
+def _ohlc_levels(open_, high, low):
+    high = float(np.fmax.reduce(high))
+    low = float(np.fmin.reduce(low))
+    return {'open': float(open_[0]), 'high': high, 'low': low, 'eq': (high + low) / 2}
+
+
+def _reduce_rows(times, local_times, open_, high, low):
+    """One OHLC row per run of bars sharing their local day and UTC day"""
+    local_days = local_times // DAY_NS
+    utc_days = times // DAY_NS
+    starts = np.concatenate(([0], np.flatnonzero((np.diff(local_days) != 0) | (np.diff(utc_days) != 0)) + 1))
+    rows = {
+        'times': times[starts],
+        'open': open_[starts],
+        'high': np.fmax.reduceat(high, starts),
+        'low': np.fmin.reduceat(low, starts),
+    }
+    rows.update(_period_labels(local_days[starts], utc_days[starts]))
+    return rows
+
+
+class CalendarAggregates:
+    """
+    Pre-aggregated per-day OHLC table of one dataset
+
+    Bars are reduced to one row per day in a single pass (np.*.reduceat over day
+    boundaries); weeks, months, quarters and years are rolled up from this small
+    table. A row never spans a local or a UTC midnight, so days and weeks can be
+    bucketed in the index's timezone while months start at 00:00 UTC.
+
+    extend() only re-reduces the bars from the start of the last stored row, so
+    appending bars costs as much as the bars of one day. A sliding window that
+    dropped leading bars is re-anchored on the first kept row: only the partial
+    row left at the front is reduced again. Closed rows are assumed not to change.
+    """
+
+    def __init__(self):
+        self.rows = None  # name -> per-row array: times (ns), open/high/low and period labels
+        self._current = {}  # kind -> period label of the last bar
+        self._previous = {}  # (kind, label) -> levels of a period made of closed rows only
+        self._sessions = {}
+
+    def _reusable(self, all_times):
+        """(head_end, keep_lo, tail_start) bar/row positions to re-anchor on, or None"""
+        if self.rows is None or all_times[0] < self.rows['times'][0]:
+            return None
+        row_times = self.rows['times']
+        tail_start = int(np.searchsorted(all_times, row_times[-1]))
+        if tail_start == len(all_times) or all_times[tail_start] != row_times[-1]:
+            return None
+
+        # First stored row that starts inside data; bars before it form a partial row
+        keep_lo = int(np.searchsorted(row_times, all_times[0]))
+        head_end = int(np.searchsorted(all_times, row_times[keep_lo]))
+        if all_times[head_end] != row_times[keep_lo]:
+            return None
+        return head_end, keep_lo, tail_start
+
+    def extend(self, data):
+        """Fold new (or updated last-day) bars of data into the table"""
+        index = data.index
+        all_times = _utc_ns(index)
+        open_ = data['Open'].to_numpy(dtype=float)
+        high = data['High'].to_numpy(dtype=float)
+        low = data['Low'].to_numpy(dtype=float)
+
+        def reduce(lo, hi):
+            return _reduce_rows(all_times[lo:hi], _local_ns(index[lo:hi]), open_[lo:hi], high[lo:hi], low[lo:hi])
+
+        reuse = self._reusable(all_times)
+        if reuse is None:
+            self.rows = reduce(0, len(all_times))
+            self._previous = {}
+        else:
+            head_end, keep_lo, tail_start = reuse
+            kept = {name: values[keep_lo:-1] for name, values in self.rows.items()}
+            parts = ([reduce(0, head_end)] if head_end else []) + [kept, reduce(tail_start, len(all_times))]
+            self.rows = {name: np.concatenate([part[name] for part in parts]) for name in kept}
+            if head_end or keep_lo:
+                # Periods that lost leading bars (or all of them) are recomputed
+                self._previous = {(kind, label): levels for (kind, label), levels in self._previous.items()
+                                  if label > self.rows[kind][0]}
+
+        # Current periods are labelled like the rows: days/weeks local, months and up UTC
+        last_local_day = _local_ns(index[-1:]) // DAY_NS
+        last_utc_day = _utc_ns(index[-1:]) // DAY_NS
+        self._current = {kind: labels[0] for kind, labels in _period_labels(last_local_day, last_utc_day).items()}
+        self._sessions = self._session_levels(all_times, int(last_local_day[0]), open_, high, low)
+        return self
+
+    @staticmethod
+    def _session_levels(all_times, day, open_, high, low):
+        """Session levels of the last bar's (local) date, sessions in UTC hours"""
+        levels = {}
+        for session_name, session_times in SESSIONS.items():
+            start = day * DAY_NS + session_times['start'] * HOUR_NS
+            # Asia crosses midnight and ends on the next day
+            end_day = day + 1 if session_times['end'] < session_times['start'] else day
+            end = end_day * DAY_NS + session_times['end'] * HOUR_NS
+            lo = np.searchsorted(all_times, start, side='left')
+            hi = np.searchsorted(all_times, end, side='right')
+            if lo < hi:
+                levels[session_name] = _ohlc_levels(open_[lo:hi], high[lo:hi], low[lo:hi])
+        return levels
+
+    def period_levels(self):
+        """
+        Current and previous period levels for every calendar period
+
+        Returns:
+            dict: kind -> {'current': {...}, 'previous': {...}} (missing periods left out)
+        """
+        levels = {}
+        for kind in PERIOD_KINDS:
+            labels = self.rows[kind]
+            levels[kind] = {}
+            current = self._current[kind]
+            lo = int(np.searchsorted(labels, current))
+            if lo < len(labels):
+                levels[kind]['current'] = _ohlc_levels(self.rows['open'][lo:], self.rows['high'][lo:],
+                                                       self.rows['low'][lo:])
+
+            previous = self._previous.get((kind, current - 1), False)
+            if previous is False:
+                prev_lo = np.searchsorted(labels, current - 1)
+                previous = _ohlc_levels(self.rows['open'][prev_lo:lo], self.rows['high'][prev_lo:lo],
+                                        self.rows['low'][prev_lo:lo]) if prev_lo < lo else None
+                # Cached only while it lies entirely before the (possibly still changing) last row
+                if lo < len(labels):
+                    self._previous[(kind, current - 1)] = previous
+            if previous is not None:
+                levels[kind]['previous'] = dict(previous)
+        return levels
+
+    def session_levels(self):
+        """Today's Asia / London / US session levels"""
+        return {session_name: dict(levels) for session_name, levels in self._sessions.items()}
+
+
+class CalendarAggregateStore:
+    """
+    Thread-safe CalendarAggregates per dataset
+
+    Datasets are identified by an explicit key (e.g. (symbol, timeframe)) or,
+    when none is given, by their first bar.
+    """
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def levels(self, data, key=None):
+        """
+        Calendar and session levels for data, after folding in bars added since the last call
+
+        Returns:
+            dict: yearly/quarterly/monthly/weekly/daily period levels plus 'session'
+        """
+        entry_key = key if key is not None else (data.index[0], float(data['Close'].iloc[0]))
+        with self._lock:
+            aggregates = self._entries.get(entry_key)
+            if aggregates is None:
+                aggregates = self._entries[entry_key] = CalendarAggregates()
+            self._entries.move_to_end(entry_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            # Extended and read under the lock: concurrent callers for one dataset share the table
+            aggregates.extend(data)
+            levels = aggregates.period_levels()
+            levels['session'] = aggregates.session_levels()
+            return levels
+
+
+_calendar_store = None
+_calendar_store_lock = threading.Lock()
+
+
+def get_calendar_aggregates():
+    """Process-wide calendar aggregate store"""
+    global _calendar_store
+    with _calendar_store_lock:
+        if _calendar_store is None:
+            _calendar_store = CalendarAggregateStore()
+        return _calendar_store
+
+
 class InstitutionalLevels:
     """
     Institutional Level Detection System
@@ -17,13 +248,14 @@ class InstitutionalLevels:
     def __init__(self):
         self.timezone = pytz.timezone('UTC')
         
-    def calculate_institutional_levels(self, data, current_timeframe='1h'):
+    def calculate_institutional_levels(self, data, current_timeframe='1h', key=None):
         """
         Calculate all institutional levels for the given data
         
         Args:
             data (pd.DataFrame): OHLCV data with datetime index
             current_timeframe (str): Current analysis timeframe
+            key: Dataset identity for the incremental calendar table, e.g. (symbol, timeframe)
             
         Returns:
             dict: Comprehensive institutional levels analysis
@@ -39,15 +271,8 @@ class InstitutionalLevels:
             current_price = data['Close'].iloc[-1]
             current_time = data.index[-1]
             
-            # Calculate all timeframe levels
-            levels = {
-                'yearly': self._calculate_yearly_levels(data, current_time),
-                'quarterly': self._calculate_quarterly_levels(data, current_time),
-                'monthly': self._calculate_monthly_levels(data, current_time),
-                'weekly': self._calculate_weekly_levels(data, current_time),
-                'daily': self._calculate_daily_levels(data, current_time),
-                'session': self._calculate_session_levels(data, current_time)
-            }
+            # Calculate all timeframe levels from the shared per-day OHLC table
+            levels = get_calendar_aggregates().levels(data, key)
             
             # Find nearest levels to current price
             nearest_levels = self._find_nearest_levels(levels, current_price)
@@ -71,235 +296,6 @@ class InstitutionalLevels:
             print(f"Error calculating institutional levels: {e}")
             return self._get_fallback_levels()
     
-    def _calculate_yearly_levels(self, data, current_time):
-        """Calculate yearly levels (current and previous year)"""
-        year_start = datetime(current_time.year, 1, 1, tzinfo=self.timezone)
-        prev_year_start = datetime(current_time.year - 1, 1, 1, tzinfo=self.timezone)
-        prev_year_end = datetime(current_time.year - 1, 12, 31, 23, 59, 59, tzinfo=self.timezone)
-        
-        # Current year data
-        current_year_data = data[data.index >= year_start]
-        
-        # Previous year data
-        prev_year_data = data[(data.index >= prev_year_start) & (data.index <= prev_year_end)]
-        
-        levels = {}
-        
-        # Current year levels
-        if not current_year_data.empty:
-            levels['current'] = {
-                'open': current_year_data['Open'].iloc[0],
-                'high': current_year_data['High'].max(),
-                'low': current_year_data['Low'].min(),
-                'eq': (current_year_data['High'].max() + current_year_data['Low'].min()) / 2
-            }
-        
-        # Previous year levels
-        if not prev_year_data.empty:
-            levels['previous'] = {
-                'open': prev_year_data['Open'].iloc[0],
-                'high': prev_year_data['High'].max(),
-                'low': prev_year_data['Low'].min(),
-                'eq': (prev_year_data['High'].max() + prev_year_data['Low'].min()) / 2
-            }
-        
-        return levels
-    
-    def _calculate_quarterly_levels(self, data, current_time):
-        """Calculate quarterly levels (current and previous quarter)"""
-        # Determine current quarter
-        quarter = (current_time.month - 1) // 3 + 1
-        quarter_start_month = (quarter - 1) * 3 + 1
-        
-        quarter_start = datetime(current_time.year, quarter_start_month, 1, tzinfo=self.timezone)
-        
-        # Previous quarter
-        if quarter == 1:
-            prev_quarter_start = datetime(current_time.year - 1, 10, 1, tzinfo=self.timezone)
-            prev_quarter_end = datetime(current_time.year - 1, 12, 31, 23, 59, 59, tzinfo=self.timezone)
-        else:
-            prev_quarter_month = (quarter - 2) * 3 + 1
-            prev_quarter_start = datetime(current_time.year, prev_quarter_month, 1, tzinfo=self.timezone)
-            prev_quarter_end = datetime(current_time.year, quarter_start_month - 1, 28, 23, 59, 59, tzinfo=self.timezone)
-        
-        # Current quarter data
-        current_quarter_data = data[data.index >= quarter_start]
-        
-        # Previous quarter data
-        prev_quarter_data = data[(data.index >= prev_quarter_start) & (data.index <= prev_quarter_end)]
-        
-        levels = {}
-        
-        # Current quarter levels
-        if not current_quarter_data.empty:
-            levels['current'] = {
-                'open': current_quarter_data['Open'].iloc[0],
-                'high': current_quarter_data['High'].max(),
-                'low': current_quarter_data['Low'].min(),
-                'eq': (current_quarter_data['High'].max() + current_quarter_data['Low'].min()) / 2
-            }
-        
-        # Previous quarter levels
-        if not prev_quarter_data.empty:
-            levels['previous'] = {
-                'open': prev_quarter_data['Open'].iloc[0],
-                'high': prev_quarter_data['High'].max(),
-                'low': prev_quarter_data['Low'].min(),
-                'eq': (prev_quarter_data['High'].max() + prev_quarter_data['Low'].min()) / 2
-            }
-        
-        return levels
-    
-    def _calculate_monthly_levels(self, data, current_time):
-        """Calculate monthly levels (current and previous month)"""
-        month_start = datetime(current_time.year, current_time.month, 1, tzinfo=self.timezone)
-        
-        # Previous month
-        if current_time.month == 1:
-            prev_month_start = datetime(current_time.year - 1, 12, 1, tzinfo=self.timezone)
-            prev_month_end = datetime(current_time.year - 1, 12, 31, 23, 59, 59, tzinfo=self.timezone)
-        else:
-            prev_month_start = datetime(current_time.year, current_time.month - 1, 1, tzinfo=self.timezone)
-            # Get last day of previous month
-            next_month = month_start
-            prev_month_end = next_month - timedelta(seconds=1)
-        
-        # Current month data
-        current_month_data = data[data.index >= month_start]
-        
-        # Previous month data
-        prev_month_data = data[(data.index >= prev_month_start) & (data.index <= prev_month_end)]
-        
-        levels = {}
-        
-        # Current month levels
-        if not current_month_data.empty:
-            levels['current'] = {
-                'open': current_month_data['Open'].iloc[0],
-                'high': current_month_data['High'].max(),
-                'low': current_month_data['Low'].min(),
-                'eq': (current_month_data['High'].max() + current_month_data['Low'].min()) / 2
-            }
-        
-        # Previous month levels
-        if not prev_month_data.empty:
-            levels['previous'] = {
-                'open': prev_month_data['Open'].iloc[0],
-                'high': prev_month_data['High'].max(),
-                'low': prev_month_data['Low'].min(),
-                'eq': (prev_month_data['High'].max() + prev_month_data['Low'].min()) / 2
-            }
-        
-        return levels
-    
-    def _calculate_weekly_levels(self, data, current_time):
-        """Calculate weekly levels (current and previous week)"""
-        # Get Monday of current week
-        days_since_monday = current_time.weekday()
-        week_start = current_time - timedelta(days=days_since_monday)
-        week_start = week_start.replace(hour=0, minute=0, second=0, microsecond=0)
-        
-        # Previous week
-        prev_week_start = week_start - timedelta(days=7)
-        prev_week_end = week_start - timedelta(seconds=1)
-        
-        # Current week data
-        current_week_data = data[data.index >= week_start]
-        
-        # Previous week data
-        prev_week_data = data[(data.index >= prev_week_start) & (data.index <= prev_week_end)]
-        
-        levels = {}
-        
-        # Current week levels
-        if not current_week_data.empty:
-            levels['current'] = {
-                'open': current_week_data['Open'].iloc[0],
-                'high': current_week_data['High'].max(),
-                'low': current_week_data['Low'].min(),
-                'eq': (current_week_data['High'].max() + current_week_data['Low'].min()) / 2
-            }
-        
-        # Previous week levels
-        if not prev_week_data.empty:
-            levels['previous'] = {
-                'open': prev_week_data['Open'].iloc[0],
-                'high': prev_week_data['High'].max(),
-                'low': prev_week_data['Low'].min(),
-                'eq': (prev_week_data['High'].max() + prev_week_data['Low'].min()) / 2
-            }
-        
-        return levels
-    
-    def _calculate_daily_levels(self, data, current_time):
-        """Calculate daily levels (current and previous day)"""
-        day_start = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
-        prev_day_start = day_start - timedelta(days=1)
-        prev_day_end = day_start - timedelta(seconds=1)
-        
-        # Current day data
-        current_day_data = data[data.index >= day_start]
-        
-        # Previous day data
-        prev_day_data = data[(data.index >= prev_day_start) & (data.index <= prev_day_end)]
-        
-        levels = {}
-        
-        # Current day levels
-        if not current_day_data.empty:
-            levels['current'] = {
-                'open': current_day_data['Open'].iloc[0],
-                'high': current_day_data['High'].max(),
-                'low': current_day_data['Low'].min(),
-                'eq': (current_day_data['High'].max() + current_day_data['Low'].min()) / 2
-            }
-        
-        # Previous day levels
-        if not prev_day_data.empty:
-            levels['previous'] = {
-                'open': prev_day_data['Open'].iloc[0],
-                'high': prev_day_data['High'].max(),
-                'low': prev_day_data['Low'].min(),
-                'eq': (prev_day_data['High'].max() + prev_day_data['Low'].min()) / 2
-            }
-        
-        return levels
-    
-    def _calculate_session_levels(self, data, current_time):
-        """Calculate trading session levels (Asia, London, US)"""
-        # Session times in UTC
-        sessions = {
-            'asia': {'start': 23, 'end': 8},      # 23:00-08:00 UTC
-            'london': {'start': 8, 'end': 16},    # 08:00-16:00 UTC  
-            'us': {'start': 13, 'end': 22}        # 13:00-22:00 UTC (overlaps with London)
-        }
-        
-        levels = {}
-        
-        for session_name, session_times in sessions.items():
-            # Get today's session data
-            today = current_time.date()
-            session_start = datetime.combine(today, datetime.min.time().replace(hour=session_times['start']))
-            session_start = session_start.replace(tzinfo=self.timezone)
-            
-            if session_times['end'] < session_times['start']:  # Asia session crosses midnight
-                session_end = session_start + timedelta(days=1)
-                session_end = session_end.replace(hour=session_times['end'])
-            else:
-                session_end = session_start.replace(hour=session_times['end'])
-            
-            session_data = data[(data.index >= session_start) & (data.index <= session_end)]
-            
-            if not session_data.empty:
-                levels[session_name] = {
-                    'open': session_data['Open'].iloc[0],
-                    'high': session_data['High'].max(),
-                    'low': session_data['Low'].min(),
-                    'eq': (session_data['High'].max() + session_data['Low'].min()) / 2
-                }
-        
-        return levels
-    
     def _find_nearest_levels(self, levels, current_price):
         """Find the nearest support and resistance levels to current price"""
         all_levels = []
@@ -1,6 +1,7 @@
 import pandas as pd
 import numpy as np
-import streamlit as st
+
+from swing_points import find_swing_points
 
 class MarketStructureAnalyzer:
     """
@@ -32,16 +33,10 @@ class MarketStructureAnalyzer:
             lows = data['Low'].values
             closes = data['Close'].values
             
-            # Find swing highs and lows
-            swing_highs = []
-            swing_lows = []
-            
-            for i in range(2, len(highs) - 2):
-                if highs[i] > highs[i-1] and highs[i] > highs[i-2] and highs[i] > highs[i+1] and highs[i] > highs[i+2]:
-                    swing_highs.append(highs[i])
-                
-                if lows[i] < lows[i-1] and lows[i] < lows[i-2] and lows[i] < lows[i+1] and lows[i] < lows[i+2]:
-                    swing_lows.append(lows[i])
+            # Find swing highs and lows (2 bars on each side)
+            high_idx, low_idx = find_swing_points(data, lookback=2)
+            swing_highs = highs[high_idx]
+            swing_lows = lows[low_idx]
             
             current_price = closes[-1]
             
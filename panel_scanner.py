@@ -0,0 +1,330 @@
+"""
+FinansLab Panel Tarayıcı
+========================
+
+Tüm Binance USDT evrenini (semboller x zaman) hizalanmış NumPy dizileri olarak tutar.
+EMA bias, RSI, ATR, FVG bayrakları ve confluence skoru tüm semboller için tek
+vektörel geçişte hesaplanır ve sıralanmış bir top-k tablosu döndürülür.
+"""
+
+import numpy as np
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from scipy.signal import lfilter
+
+
+class PanelScanner:
+    """
+    Cross-sectional scanner over an aligned (symbols x time) OHLCV panel
+    """
+
+    def __init__(self, ema_periods=None, rsi_period=14, atr_period=14,
+                 fvg_lookback=50, max_bars=1000):
+        self.ema_periods = ema_periods or [45, 89, 144, 200, 276]
+        self.rsi_period = rsi_period
+        self.atr_period = atr_period
+        self.fvg_lookback = fvg_lookback
+        self.max_bars = max_bars
+
+        self.symbols = []
+        self.index = pd.DatetimeIndex([])
+        self.open = self.high = self.low = self.close = self.volume = None
+
+    # ------------------------------------------------------------------
+    # Panel construction
+    # ------------------------------------------------------------------
+
+    def load(self, fetcher, symbols, interval='15m', period='1mo', max_workers=16):
+        """
+        Fetch klines for all symbols concurrently and build the panel
+
+        Args:
+            fetcher: Any object with get_klines(symbol, interval, period)
+            symbols (list): Symbols to scan
+            interval (str): Kline interval
+            period (str): Data period
+            max_workers (int): Concurrent fetch threads
+
+        Returns:
+            PanelScanner: self
+        """
+        def fetch(symbol):
+            try:
+                return symbol, fetcher.get_klines(symbol, interval, period)
+            except Exception:
+                return symbol, None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            frames = dict(executor.map(fetch, symbols))
+
+        return self.from_frames(frames)
+
+    def from_frames(self, frames):
+        """
+        Build aligned (symbols x time) arrays from per-symbol DataFrames
+
+        Args:
+            frames (dict): symbol -> OHLCV DataFrame
+
+        Returns:
+            PanelScanner: self
+        """
+        frames = {s: df for s, df in frames.items() if df is not None and not df.empty}
+        self.symbols = list(frames.keys())
+
+        if not frames:
+            self.index = pd.DatetimeIndex([])
+            self.open = self.high = self.low = self.close = self.volume = np.empty((0, 0))
+            return self
+
+        index = frames[self.symbols[0]].index
+        for df in list(frames.values())[1:]:
+            index = index.union(df.index)
+        self.index = index[-self.max_bars:]
+
+        n, t = len(self.symbols), len(self.index)
+        arrays = {col: np.full((n, t), np.nan) for col in ['Open', 'High', 'Low', 'Close', 'Volume']}
+
+        for i, symbol in enumerate(self.symbols):
+            aligned = frames[symbol].reindex(self.index)
+            for col, arr in arrays.items():
+                if col in aligned.columns:
+                    arr[i] = aligned[col].to_numpy(dtype=float)
+
+        self.open = arrays['Open']
+        self.high = arrays['High']
+        self.low = arrays['Low']
+        self.close = arrays['Close']
+        self.volume = arrays['Volume']
+        return self
+
+    # ------------------------------------------------------------------
+    # Vectorized indicators (all operate along axis=1 / time)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def ema(values, period):
+        """
+        EMA for every row at once, matching pandas ewm(span=period).mean()
+
+        Uses the adjust=True form num/den so missing bars decay the same way pandas does.
+        """
+        decay = 1 - 2 / (period + 1)
+        mask = ~np.isnan(values)
+        num = lfilter([1.0], [1.0, -decay], np.where(mask, values, 0.0), axis=1)
+        den = lfilter([1.0], [1.0, -decay], mask.astype(float), axis=1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(den > 0, num / den, np.nan)
+
+    @staticmethod
+    def rolling_mean(values, window):
+        """Rolling mean along time; NaN until a full window of valid values exists"""
+        mask = ~np.isnan(values)
+        filled = np.where(mask, values, 0.0)
+        pad = np.zeros((values.shape[0], 1))
+        csum = np.concatenate([pad, np.cumsum(filled, axis=1)], axis=1)
+        ccount = np.concatenate([pad, np.cumsum(mask, axis=1)], axis=1)
+
+        result = np.full(values.shape, np.nan)
+        if values.shape[1] >= window:
+            sums = csum[:, window:] - csum[:, :-window]
+            counts = ccount[:, window:] - ccount[:, :-window]
+            with np.errstate(invalid='ignore', divide='ignore'):
+                result[:, window - 1:] = np.where(counts == window, sums / window, np.nan)
+        return result
+
+    def rsi(self):
+        """RSI with simple rolling averages (same formula as AdvancedIndicators.calculate_rsi)"""
+        delta = np.diff(self.close, axis=1, prepend=np.nan)
+        gain = np.where(delta > 0, delta, 0.0)
+        loss = np.where(delta < 0, -delta, 0.0)
+        # Like pandas where(): the first diff counts as 0, missing bars stay NaN
+        gain[np.isnan(self.close)] = np.nan
+        loss[np.isnan(self.close)] = np.nan
+
+        avg_gain = self.rolling_mean(gain, self.rsi_period)
+        avg_loss = self.rolling_mean(loss, self.rsi_period)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            rsi = 100 - 100 / (1 + avg_gain / avg_loss)
+        return np.where(np.isnan(rsi), 50.0, rsi)
+
+    def atr(self):
+        """Average True Range with a rolling mean of true range"""
+        prev_close = np.concatenate([np.full((self.close.shape[0], 1), np.nan), self.close[:, :-1]], axis=1)
+        tr = np.fmax(self.high - self.low,
+                     np.fmax(np.abs(self.high - prev_close), np.abs(self.low - prev_close)))
+        return self.rolling_mean(tr, self.atr_period)
+
+    def fvg_flags(self, current_price):
+        """
+        Unfilled FVG counts within the lookback window for every symbol
+
+        A bullish gap at bar t (low[t] > high[t-2]) stays unfilled while every later low
+        is above high[t-2]; bearish gaps mirror this with highs.
+
+        Returns:
+            dict: bullish/bearish/strong counts per symbol
+        """
+        n, t = self.close.shape
+        empty = np.zeros(n, dtype=int)
+        if t < 3:
+            return {'bullish': empty, 'bearish': empty, 'strong': empty}
+
+        low = np.where(np.isnan(self.low), np.inf, self.low)
+        high = np.where(np.isnan(self.high), -np.inf, self.high)
+
+        # Extremes of all bars after t (exclusive)
+        future_min_low = np.minimum.accumulate(low[:, ::-1], axis=1)[:, ::-1]
+        future_min_low = np.concatenate([future_min_low[:, 1:], np.full((n, 1), np.inf)], axis=1)
+        future_max_high = np.maximum.accumulate(high[:, ::-1], axis=1)[:, ::-1]
+        future_max_high = np.concatenate([future_max_high[:, 1:], np.full((n, 1), -np.inf)], axis=1)
+
+        start = max(2, t - self.fvg_lookback)
+        cur_low, cur_high = low[:, start:], high[:, start:]
+        ref_high, ref_low = high[:, start - 2:t - 2], low[:, start - 2:t - 2]
+
+        # Missing bars (padded with +/-inf) never form a gap
+        valid = ~np.isnan(self.close)
+        both_valid = valid[:, start:] & valid[:, start - 2:t - 2]
+
+        bullish = both_valid & (cur_low > ref_high) & (future_min_low[:, start:] > ref_high)
+        bearish = both_valid & (cur_high < ref_low) & (future_max_high[:, start:] < ref_low)
+
+        with np.errstate(invalid='ignore'):
+            bull_size = np.where(bullish, (cur_low - ref_high) / current_price[:, None] * 100, 0.0)
+            bear_size = np.where(bearish, (ref_low - cur_high) / current_price[:, None] * 100, 0.0)
+
+        return {
+            'bullish': bullish.sum(axis=1),
+            'bearish': bearish.sum(axis=1),
+            'strong': (bull_size > 1).sum(axis=1) + (bear_size > 1).sum(axis=1)
+        }
+
+    # ------------------------------------------------------------------
+    # Scan
+    # ------------------------------------------------------------------
+
+    def scan(self, top_k=20):
+        """
+        Compute bias, RSI, ATR, FVG flags and confluence for the whole panel
+
+        Returns:
+            pd.DataFrame: Top-k setups ordered by confluence score and bias conviction
+        """
+        columns = ['symbol', 'price', 'direction', 'bias', 'bias_strength', 'sequence_score',
+                   'momentum', 'rsi', 'atr', 'atr_pct', 'bullish_fvgs', 'bearish_fvgs',
+                   'confluence_score', 'quality']
+        if not self.symbols or self.close.shape[1] < 5:
+            return pd.DataFrame(columns=columns)
+
+        price = self.close[:, -1]
+
+        # EMA stack at the last bar, shape (symbols, periods)
+        ema_series = [self.ema(self.close, p) for p in self.ema_periods]
+        ema_now = np.stack([e[:, -1] for e in ema_series], axis=1)
+        ema_prev = np.stack([e[:, -5] for e in ema_series], axis=1)
+
+        above = (price[:, None] > ema_now).sum(axis=1)
+        strength = above / len(self.ema_periods) * 100
+
+        # EMA sequence score (FinansLabUnified.analyze_ema_sequence)
+        pair_up = ema_now[:, :-1] <= ema_now[:, 1:]
+        pair_down = ema_now[:, :-1] >= ema_now[:, 1:]
+        ascending = pair_up.all(axis=1)
+        descending = pair_down.all(axis=1)
+        partial = np.where((price > ema_now[:, 0])[:, None], pair_up, pair_down).sum(axis=1) / (len(self.ema_periods) - 1)
+        sequence = np.select(
+            [ascending & (price > ema_now.max(axis=1)), descending & (price < ema_now.min(axis=1))],
+            [1.0, 0.0], default=partial
+        )
+
+        # Momentum (price + average EMA momentum)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            price_momentum = (price - self.close[:, -5]) / self.close[:, -5] * 100
+            ema_momentum = np.nanmean((ema_now - ema_prev) / ema_prev * 100, axis=1)
+        momentum = (price_momentum + ema_momentum) / 2
+
+        bias = np.select(
+            [(strength >= 80) & (sequence > 0.8), strength >= 60,
+             (strength <= 20) & (sequence < 0.2), strength <= 40],
+            ['GÜÇLÜ YUKARI', 'YUKARI', 'GÜÇLÜ AŞAĞI', 'AŞAĞI'], default='NÖTR'
+        )
+        bullish_bias = strength >= 60
+        bearish_bias = strength <= 40
+
+        rsi_now = self.rsi()[:, -1]
+        atr_now = self.atr()[:, -1]
+        fvgs = self.fvg_flags(price)
+
+        # Confluence: direction-neutral version of FinansLabUnified.calculate_confluence_score
+        # (market bias and scalp factors need per-symbol context and are left out; max 10)
+        conviction = np.abs(strength - 50) + 50
+        sequence_conviction = np.maximum(sequence, 1 - sequence)
+        abs_momentum = np.abs(np.nan_to_num(momentum))
+        fvg_total = fvgs['bullish'] + fvgs['bearish']
+
+        score = (
+            np.select([conviction >= 80, conviction >= 60], [3, 2], default=0)
+            + np.select([sequence_conviction > 0.8, sequence_conviction > 0.6], [2, 1], default=0)
+            + np.select([abs_momentum > 2, abs_momentum > 1], [2, 1], default=0)
+            + np.select([fvgs['strong'] >= 2, fvg_total >= 2], [2, 1], default=0)
+            + ((bullish_bias & (rsi_now >= 30) & (rsi_now <= 50))
+               | (bearish_bias & (rsi_now >= 50) & (rsi_now <= 70))).astype(int)
+        )
+        quality = np.select(
+            [score >= 8, score >= 6, score >= 4, score >= 2],
+            ['MÜKEMMEL', 'ÇOK İYİ', 'İYİ', 'ORTA'], default='ZAYIF'
+        )
+        direction = np.select([bullish_bias, bearish_bias], ['LONG', 'SHORT'], default='NEUTRAL')
+
+        table = pd.DataFrame({
+            'symbol': self.symbols,
+            'price': price,
+            'direction': direction,
+            'bias': bias,
+            'bias_strength': strength,
+            'sequence_score': sequence,
+            'momentum': momentum,
+            'rsi': rsi_now,
+            'atr': atr_now,
+            'atr_pct': atr_now / price * 100,
+            'bullish_fvgs': fvgs['bullish'],
+            'bearish_fvgs': fvgs['bearish'],
+            'confluence_score': score,
+            'quality': quality
+        }, columns=columns)
+
+        # Symbols without a price on the last bar can't be ranked
+        table = table[~np.isnan(price)]
+        table['_conviction'] = conviction[~np.isnan(price)]
+        table = table.sort_values(['confluence_score', '_conviction'], ascending=False, kind='stable')
+        return table.drop(columns='_conviction').head(top_k).reset_index(drop=True)
+
+
+def scan_binance_universe(fetcher=None, interval='15m', period='1mo', top_k=20, max_workers=16):
+    """
+    Scan every Binance USDT futures pair and return the ranked top-k table
+
+    Args:
+        fetcher: Fetcher with get_futures_symbols()/get_usdt_pairs() and get_klines()
+                 (default: BinanceFuturesFetcher)
+        interval (str): Kline interval
+        period (str): Data period
+        top_k (int): Number of setups to return
+
+    Returns:
+        pd.DataFrame: Ranked setups
+    """
+    if fetcher is None:
+        from binance_futures_fetcher import BinanceFuturesFetcher
+        fetcher = BinanceFuturesFetcher()
+
+    if hasattr(fetcher, 'get_futures_symbols'):
+        symbols = fetcher.get_futures_symbols()
+    else:
+        symbols = fetcher.get_usdt_pairs()
+    symbols = [s for s in symbols if s.endswith('USDT')]
+
+    scanner = PanelScanner()
+    scanner.load(fetcher, symbols, interval=interval, period=period, max_workers=max_workers)
+    return scanner.scan(top_k=top_k)
@@ -1,8 +1,9 @@
 import yfinance as yf
 import pandas as pd
 import numpy as np
-import streamlit as st
+import diagnostics
 from datetime import datetime, timedelta
+from fetch_coalescer import coalesced
 
 class ReliableDataFetcher:
     """
@@ -72,6 +73,7 @@ class ReliableDataFetcher:
             'XAUUSD': 'GC=F'   # Gold futures
         }
     
+    @coalesced
     def get_klines(self, symbol, interval, period):
         """
         Get historical OHLCV data from Yahoo Finance
@@ -97,7 +99,7 @@ class ReliableDataFetcher:
                 yahoo_symbol = self.symbol_map.get(symbol, symbol)
             
             if not yahoo_symbol:
-                st.error(f"Sembol desteklenmiyor: {symbol}")
+                diagnostics.error(f"Sembol desteklenmiyor: {symbol}")
                 return pd.DataFrame()
             
             # Map intervals to Yahoo Finance format
@@ -130,24 +132,24 @@ class ReliableDataFetcher:
                     # 1-minute data: max 7 days
                     if self._period_to_days(period) > 7:
                         period = '7d'
-                        st.warning(f"1 dakika verisi için dönem {original_period}'den 7 güne düşürüldü")
+                        diagnostics.warning(f"1 dakika verisi için dönem {original_period}'den 7 güne düşürüldü")
                 elif yf_interval in ['5m', '15m']:
                     # 5m and 15m data: max 60 days
                     if self._period_to_days(period) > 60:
                         period = '60d'
-                        st.warning(f"Kısa vadeli veriler için dönem {original_period}'den 60 güne düşürüldü")
+                        diagnostics.warning(f"Kısa vadeli veriler için dönem {original_period}'den 60 güne düşürüldü")
                 elif yf_interval == '30m':
                     # 30m data: max 60 days
                     if self._period_to_days(period) > 60:
                         period = '60d'
-                        st.warning(f"30 dakika verisi için dönem {original_period}'den 60 güne düşürüldü")
+                        diagnostics.warning(f"30 dakika verisi için dönem {original_period}'den 60 güne düşürüldü")
             
             # Create ticker and fetch data
             ticker = yf.Ticker(yahoo_symbol)
             data = ticker.history(period=period, interval=yf_interval)
             
             if data.empty:
-                st.error(f"Yahoo Finance'den veri alınamadı: {yahoo_symbol}")
+                diagnostics.error(f"Yahoo Finance'den veri alınamadı: {yahoo_symbol}")
                 return pd.DataFrame()
             
             # Resample to target intervals if needed
@@ -171,21 +173,21 @@ class ReliableDataFetcher:
             # Ensure we have the required columns
             required_cols = ['Open', 'High', 'Low', 'Close', 'Volume']
             if not all(col in data.columns for col in required_cols):
-                st.error("Gerekli veri sütunları bulunamadı")
+                diagnostics.error("Gerekli veri sütunları bulunamadı")
                 return pd.DataFrame()
             
             # Clean data
             data = data.dropna()
             
             if len(data) == 0:
-                st.error("Temizlenen veri boş")
+                diagnostics.error("Temizlenen veri boş")
                 return pd.DataFrame()
             
 
             return data
             
         except Exception as e:
-            st.error(f"Veri alma hatası: {str(e)}")
+            diagnostics.error(f"Veri alma hatası: {str(e)}")
             return pd.DataFrame()
     
     def _resample_to_4h(self, data):
@@ -205,7 +207,7 @@ class ReliableDataFetcher:
             return resampled
             
         except Exception as e:
-            st.warning(f"4h resampling hatası: {str(e)}")
+            diagnostics.warning(f"4h resampling hatası: {str(e)}")
             return data
     
     def _resample_to_10m(self, data):
@@ -225,7 +227,7 @@ class ReliableDataFetcher:
             return resampled
             
         except Exception as e:
-            st.warning(f"10m resampling hatası: {str(e)}")
+            diagnostics.warning(f"10m resampling hatası: {str(e)}")
             return data
     
     def _resample_to_20m(self, data):
@@ -236,7 +238,7 @@ class ReliableDataFetcher:
             }).dropna()
             return resampled
         except Exception as e:
-            st.warning(f"20m resampling hatası: {str(e)}")
+            diagnostics.warning(f"20m resampling hatası: {str(e)}")
             return data
     
     def _resample_to_45m(self, data):
@@ -247,7 +249,7 @@ class ReliableDataFetcher:
             }).dropna()
             return resampled
         except Exception as e:
-            st.warning(f"45m resampling hatası: {str(e)}")
+            diagnostics.warning(f"45m resampling hatası: {str(e)}")
             return data
     
     def _resample_to_90m(self, data):
@@ -258,7 +260,7 @@ class ReliableDataFetcher:
             }).dropna()
             return resampled
         except Exception as e:
-            st.warning(f"90m resampling hatası: {str(e)}")
+            diagnostics.warning(f"90m resampling hatası: {str(e)}")
             return data
     
     def _resample_to_2h(self, data):
@@ -269,7 +271,7 @@ class ReliableDataFetcher:
             }).dropna()
             return resampled
         except Exception as e:
-            st.warning(f"2h resampling hatası: {str(e)}")
+            diagnostics.warning(f"2h resampling hatası: {str(e)}")
             return data
     
     def _resample_to_6h(self, data):
@@ -280,7 +282,7 @@ class ReliableDataFetcher:
             }).dropna()
             return resampled
         except Exception as e:
-            st.warning(f"6h resampling hatası: {str(e)}")
+            diagnostics.warning(f"6h resampling hatası: {str(e)}")
             return data
     
     def _resample_to_8h(self, data):
@@ -291,7 +293,7 @@ class ReliableDataFetcher:
             }).dropna()
             return resampled
         except Exception as e:
-            st.warning(f"8h resampling hatası: {str(e)}")
+            diagnostics.warning(f"8h resampling hatası: {str(e)}")
             return data
     
     def test_connection(self):
@@ -1,6 +1,7 @@
 import pandas as pd
-import numpy as np
-import streamlit as st
+
+from swing_points import find_swing_points
+from volatility_features import latest_atr
 
 class RiskManagementEngine:
     """
@@ -15,12 +16,16 @@ class RiskManagementEngine:
             'very_aggressive': 1.0
         }
     
-    def calculate_position_parameters(self, data, ema_data, confluence_score, market_structure):
+    def calculate_position_parameters(self, data, ema_data, confluence_score, market_structure, atr=None):
         """
         Calculate comprehensive position parameters including entry, stop loss, take profit
+        
+        Args:
+            atr (float): Precomputed ATR (e.g. shared pipeline feature); computed here if missing
         """
         current_price = data['Close'].iloc[-1]
-        atr = self._calculate_atr(data)
+        if atr is None or pd.isna(atr):
+            atr = self._calculate_atr(data)
         
         # Determine risk profile based on confluence and market structure
         risk_profile = self._determine_risk_profile(confluence_score, market_structure)
@@ -49,26 +54,10 @@ class RiskManagementEngine:
         Calculate Average True Range for volatility-based stops
         """
         try:
-            high = data['High'].values
-            low = data['Low'].values
-            close = data['Close'].values
-            
-            # Calculate True Range
-            tr_values = []
-            for i in range(1, len(high)):
-                tr = max(
-                    high[i] - low[i],
-                    abs(high[i] - close[i-1]),
-                    abs(low[i] - close[i-1])
-                )
-                tr_values.append(tr)
-            
-            # Calculate ATR
-            if len(tr_values) >= period:
-                atr = np.mean(tr_values[-period:])
-                return atr
-            else:
-                return high[-1] - low[-1]
+            atr = latest_atr(data, period)
+            if pd.isna(atr):
+                return data['High'].values[-1] - data['Low'].values[-1]
+            return atr
         except:
             return data['High'].values[-1] - data['Low'].values[-1]
     
@@ -109,9 +98,8 @@ class RiskManagementEngine:
         support_level = market_structure.get('support_resistance', {}).get('nearest_support')
         resistance_level = market_structure.get('support_resistance', {}).get('nearest_resistance')
         
-        # Method 4: Previous swing points
-        swing_low = data['Low'].iloc[-20:].min()
-        swing_high = data['High'].iloc[-20:].max()
+        # Method 4: Previous swing points (latest confirmed swing beyond price, else the 20-bar extreme)
+        swing_low, swing_high = self._recent_swing_levels(data, current_price)
         
         # Determine bias direction and optimal stop
         ema_bias = 'bullish' if ema_45 > ema_89 else 'bearish'
@@ -151,6 +139,20 @@ class RiskManagementEngine:
             'structure_based': support_level if ema_bias == 'bullish' else resistance_level
         }
     
+    def _recent_swing_levels(self, data, current_price, lookback=3):
+        """
+        Most recent confirmed swing low below and swing high above the current price
+        """
+        high_idx, low_idx = find_swing_points(data, lookback=lookback)
+        swing_lows = data['Low'].to_numpy(dtype=float)[low_idx]
+        swing_highs = data['High'].to_numpy(dtype=float)[high_idx]
+        
+        below = swing_lows[swing_lows < current_price]
+        above = swing_highs[swing_highs > current_price]
+        swing_low = below[-1] if len(below) else data['Low'].iloc[-20:].min()
+        swing_high = above[-1] if len(above) else data['High'].iloc[-20:].max()
+        return swing_low, swing_high
+    
     def _calculate_take_profit_levels(self, entry_price, stop_loss_data, market_structure, atr):
         """
         Calculate multiple take profit levels
@@ -2,6 +2,8 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 
+from volatility_features import atr_features
+
 class ScalpAnalyzer:
     """
     Specialized analyzer for scalp trading with faster EMA signals and micro-trend detection
@@ -157,12 +159,7 @@ class ScalpAnalyzer:
             if len(data) < 14:
                 return 1.0
                 
-            high_low = data['High'] - data['Low']
-            high_close = abs(data['High'] - data['Close'].shift(1))
-            low_close = abs(data['Low'] - data['Close'].shift(1))
-            
-            true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-            atr_series = true_range.rolling(14).mean()
+            atr_series = atr_features(data)['atr']
             try:
                 if isinstance(atr_series, pd.Series) and len(atr_series) > 0:
                     last_value = atr_series.values[-1]
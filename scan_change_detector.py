@@ -0,0 +1,123 @@
+"""
+FinansLab Tarama Değişiklik Tespiti
+===================================
+
+Periyodik taramalarda her sembolün son kapanmış barını parmak iziyle takip eder.
+Kapanmış barlar değişmediyse önceki analiz durumu yeniden kullanılır; sadece
+oluşmakta olan (forming) bar için kısmi hesaplama yapılır.
+"""
+
+import threading
+import pandas as pd
+
+
+class ScanChangeDetector:
+    """
+    Sembol bazlı kapanmış bar parmak izi ve analiz durumu önbelleği
+
+    Bir tarama döngüsünde her sembol için iki parmak izi tutulur:
+    - closed: son kapanmış barın zamanı ve OHLCV değerleri (ağır hesaplamalar buna bağlı)
+    - full: closed + oluşan barın OHLCV değerleri (tam sonuç buna bağlı)
+    """
+
+    def __init__(self, interval_minutes=60, max_symbols=1000):
+        self.interval = pd.Timedelta(minutes=interval_minutes)
+        self.max_symbols = max_symbols
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.stats = {'full_hits': 0, 'partial_hits': 0, 'misses': 0}
+
+    def split_closed(self, data, now=None):
+        """
+        Split data into closed bars and the forming bar (if any)
+
+        Args:
+            data (pd.DataFrame): OHLCV data indexed by bar open time
+            now (pd.Timestamp): Reference time (default: current time)
+
+        Returns:
+            tuple: (closed_data, forming_data) - forming_data has 0 or 1 rows
+        """
+        if data.empty:
+            return data, data.iloc[0:0]
+
+        last_open = data.index[-1]
+        if now is None:
+            now = pd.Timestamp.now(tz=getattr(last_open, 'tz', None))
+
+        if last_open + self.interval > now:
+            return data.iloc[:-1], data.iloc[-1:]
+        return data, data.iloc[0:0]
+
+    @staticmethod
+    def bar_fingerprint(bars):
+        """Fingerprint of the last row: (time, open, high, low, close, volume)"""
+        if bars is None or bars.empty:
+            return None
+        row = bars.iloc[-1]
+        return (
+            bars.index[-1],
+            float(row['Open']), float(row['High']), float(row['Low']),
+            float(row['Close']), float(row.get('Volume', 0.0)),
+        )
+
+    def fingerprint(self, data, now=None):
+        """
+        Compute closed and full fingerprints for a dataset
+
+        Returns:
+            dict: closed/forming split and both fingerprints
+        """
+        closed, forming = self.split_closed(data, now)
+        closed_fp = (len(closed), not forming.empty, self.bar_fingerprint(closed))
+        full_fp = (closed_fp, self.bar_fingerprint(forming))
+        return {
+            'closed': closed,
+            'forming': forming,
+            'closed_fp': closed_fp,
+            'full_fp': full_fp,
+        }
+
+    def lookup(self, symbol, fingerprints):
+        """
+        Look up cached state for a symbol
+
+        Returns:
+            tuple: (closed_state or None, result or None)
+            result is only returned when the forming bar is unchanged too.
+        """
+        with self._lock:
+            entry = self._entries.get(symbol)
+
+            if entry is None or entry['closed_fp'] != fingerprints['closed_fp']:
+                self.stats['misses'] += 1
+                return None, None
+
+            if entry['full_fp'] == fingerprints['full_fp'] and entry['result'] is not None:
+                self.stats['full_hits'] += 1
+                return entry['state'], entry['result']
+
+            self.stats['partial_hits'] += 1
+            return entry['state'], None
+
+    def store(self, symbol, fingerprints, state, result):
+        """Store the closed-bar state and the final result for a symbol"""
+        with self._lock:
+            if symbol not in self._entries and len(self._entries) >= self.max_symbols:
+                # Drop the oldest inserted symbol (dicts keep insertion order)
+                self._entries.pop(next(iter(self._entries)))
+
+            self._entries[symbol] = {
+                'closed_fp': fingerprints['closed_fp'],
+                'full_fp': fingerprints['full_fp'],
+                'state': state,
+                'result': result,
+            }
+
+    def invalidate(self, symbol=None):
+        """Invalidate one symbol or the whole cache"""
+        with self._lock:
+            if symbol is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(symbol, None)
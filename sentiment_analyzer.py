@@ -2,6 +2,8 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 
+from volatility_features import atr_features
+
 class SentimentAnalyzer:
     """
     Advanced sentiment analysis using price action, volume, and volatility patterns
@@ -114,8 +116,6 @@ class SentimentAnalyzer:
         Analyze volatility patterns for sentiment insights
         """
         closes = data['Close'].values
-        highs = data['High'].values
-        lows = data['Low'].values
         
         # Calculate rolling volatility
         if len(closes) >= 20:
@@ -130,17 +130,9 @@ class SentimentAnalyzer:
             vol_ratio = 1
             volatility = 0
         
-        # True range analysis
-        true_ranges = []
-        for i in range(1, min(len(highs), 14)):
-            tr = max(
-                highs[-i] - lows[-i],
-                abs(highs[-i] - closes[-i-1]),
-                abs(lows[-i] - closes[-i-1])
-            )
-            true_ranges.append(tr / closes[-i] * 100)
-        
-        avg_true_range = np.mean(true_ranges) if true_ranges else 0
+        # True range analysis (last 13 bars, as % of close)
+        true_range_pct = (atr_features(data)['true_range'] / data['Close'] * 100).iloc[-13:].dropna()
+        avg_true_range = true_range_pct.mean() if len(true_range_pct) else 0
         
         # Volatility sentiment (higher volatility can indicate uncertainty)
         volatility_sentiment = -10 if vol_ratio > 1.5 else 5 if vol_ratio < 0.7 else 0
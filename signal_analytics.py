@@ -0,0 +1,236 @@
+"""
+FinansLab Sinyal Analitiği
+==========================
+
+Sinyal geçmişini kolon bazlı Parquet dosyalarına aktarır ve hızlı sorgular:
+- signals tablosu parça parça okunur (bellek sınırlı) ve aya göre bölümlenir:
+  <root>/month=YYYY-MM/signals.parquet
+- Her ay dosyası geçici dosyaya yazılıp atomik olarak değiştirilir (okuyucular yarım dosya görmez)
+- load_signals(): yalnızca istenen kolonlar ve tarih aralığı okunur (ay bölümü eleme + filtre)
+- equity_curve() / rolling_stats(): yıllarca sinyal üzerinde iki-üç kolonla çalışır
+
+Kullanım:
+    python signal_analytics.py [--db finanslab_signals.db] [--out signal_history] [--since 2024-01]
+"""
+
+import logging
+import os
+from itertools import groupby
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+from sinyal_takip_sistemi import SIGNAL_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EXPORT_DIR = "signal_history"
+EXPORT_COLUMNS = SIGNAL_COLUMNS + ", signal_date, exit_date"
+TIME_COLUMNS = ('timestamp', 'entry_time', 'exit_time')
+
+
+def _require_pyarrow():
+    if not HAS_PYARROW:
+        raise ImportError("Parquet aktarımı için pyarrow gerekli: pip install pyarrow")
+
+
+def signal_schema():
+    """Arrow schema for exported/archived signal rows (EXPORT_COLUMNS order)"""
+    return pa.schema([
+        ('id', pa.int64()),
+        ('timestamp', pa.timestamp('us')),
+        ('symbol', pa.string()),
+        ('direction', pa.string()),
+        ('entry_price', pa.float64()),
+        ('stop_loss', pa.float64()),
+        ('take_profit1', pa.float64()),
+        ('take_profit2', pa.float64()),
+        ('bias_strength', pa.float64()),
+        ('confluence_score', pa.float64()),
+        ('signal_quality', pa.string()),
+        ('status', pa.string()),
+        ('entry_time', pa.timestamp('us')),
+        ('exit_time', pa.timestamp('us')),
+        ('exit_price', pa.float64()),
+        ('pnl_percentage', pa.float64()),
+        ('r_multiple', pa.float64()),
+        ('notes', pa.string()),
+        ('signal_date', pa.string()),
+        ('exit_date', pa.string()),
+    ])
+
+
+def rows_to_table(rows, schema):
+    """Convert EXPORT_COLUMNS tuples from SQLite into an Arrow table"""
+    frame = pd.DataFrame(rows, columns=schema.names)
+    for column in TIME_COLUMNS:
+        # Stored as naive local ISO strings; tz-aware inputs are normalized to UTC wall time
+        frame[column] = pd.to_datetime(frame[column], format='ISO8601', errors='coerce', utc=True).dt.tz_localize(None)
+    return pa.Table.from_pandas(frame, schema=schema, preserve_index=False)
+
+
+def export_signals(tracker, root=DEFAULT_EXPORT_DIR, since_month=None, chunk_size=50_000):
+    """
+    Stream the signals table into month-partitioned Parquet files
+
+    Rows are read in signal_date order (signal_date index) with fetchmany, so
+    memory stays at one chunk regardless of table size. Each chunk becomes a
+    row group of its month's file.
+
+    Args:
+        tracker (SinyalTakipSistemi): Source database
+        root (str): Output directory
+        since_month (str): 'YYYY-MM' - only rewrite this month and later (older partitions are kept)
+        chunk_size (int): Rows per fetch / row group
+
+    Returns:
+        dict: month -> exported row count
+    """
+    _require_pyarrow()
+    schema = signal_schema()
+    os.makedirs(root, exist_ok=True)
+
+    where, params = "", ()
+    if since_month:
+        where, params = "WHERE signal_date >= ?", (f"{since_month}-01",)
+
+    exported = {}
+    date_idx = schema.names.index('signal_date')
+    writer, month, tmp_path = None, None, None
+
+    def finish():
+        nonlocal writer
+        if writer is not None:
+            writer.close()
+            writer = None
+            os.replace(tmp_path, os.path.join(os.path.dirname(tmp_path), "signals.parquet"))
+
+    with tracker.db.connection() as conn:
+        cursor = conn.execute(f"SELECT {EXPORT_COLUMNS} FROM signals {where} ORDER BY signal_date, id", params)
+        try:
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+
+                # Rows arrive ordered by date, so each month is one contiguous run
+                for row_month, run in groupby(rows, key=lambda row: (row[date_idx] or "unknown")[:7]):
+                    run = list(run)
+                    if row_month != month:
+                        finish()
+                        month = row_month
+                        partition = os.path.join(root, f"month={month}")
+                        os.makedirs(partition, exist_ok=True)
+                        # Dot prefix: dataset discovery skips it while it is being written
+                        tmp_path = os.path.join(partition, ".signals.parquet.tmp")
+                        writer = pq.ParquetWriter(tmp_path, schema, compression='zstd')
+
+                    writer.write_table(rows_to_table(run, schema))
+                    exported[month] = exported.get(month, 0) + len(run)
+            finish()
+        except BaseException:
+            if writer is not None:
+                writer.close()
+                os.remove(tmp_path)
+            raise
+
+    logger.info(f"✅ {sum(exported.values())} sinyal {len(exported)} aylık Parquet dosyasına aktarıldı ({root})")
+    return exported
+
+
+def load_signals(root=DEFAULT_EXPORT_DIR, columns=None, start=None, end=None, symbols=None, status=None):
+    """
+    Read exported signals - only the requested columns and signal time range
+
+    Args:
+        columns (list): Columns to load (default: all)
+        start, end: Signal timestamp bounds (inclusive start, exclusive end)
+        symbols (list): Optional symbol filter
+        status (list): Optional status filter, e.g. ['WIN', 'LOSS']
+
+    Returns:
+        pd.DataFrame
+    """
+    _require_pyarrow()
+    if not os.path.isdir(root):
+        return pd.DataFrame(columns=columns or signal_schema().names)
+
+    dataset = ds.dataset(root, format='parquet', partitioning='hive')
+    expr = None
+
+    def add(condition):
+        nonlocal expr
+        expr = condition if expr is None else expr & condition
+
+    if start is not None:
+        start = pd.Timestamp(start)
+        add(ds.field('month') >= start.strftime('%Y-%m'))
+        add(ds.field('timestamp') >= pa.scalar(start.to_pydatetime(), pa.timestamp('us')))
+    if end is not None:
+        end = pd.Timestamp(end)
+        add(ds.field('month') <= end.strftime('%Y-%m'))
+        add(ds.field('timestamp') < pa.scalar(end.to_pydatetime(), pa.timestamp('us')))
+    if symbols:
+        add(ds.field('symbol').isin(list(symbols)))
+    if status:
+        add(ds.field('status').isin(list(status)))
+
+    return dataset.to_table(columns=columns, filter=expr).to_pandas()
+
+
+def equity_curve(root=DEFAULT_EXPORT_DIR, start=None, end=None, freq='D'):
+    """
+    Cumulative R of closed signals, bucketed by exit time
+
+    Returns:
+        pd.Series: Cumulative R indexed by period end
+    """
+    closed = load_signals(root, ['exit_time', 'r_multiple'], start, end, status=['WIN', 'LOSS'])
+    if closed.empty:
+        return pd.Series(dtype=float)
+    per_period = closed.set_index('exit_time')['r_multiple'].sort_index().resample(freq).sum()
+    return per_period.cumsum()
+
+
+def rolling_stats(root=DEFAULT_EXPORT_DIR, window='30D', start=None, end=None):
+    """
+    Rolling trade statistics over closed signals
+
+    Returns:
+        pd.DataFrame: trades, win_rate, total_r, avg_r per exit time (time-based window)
+    """
+    closed = load_signals(root, ['exit_time', 'r_multiple', 'pnl_percentage'], start, end, status=['WIN', 'LOSS'])
+    if closed.empty:
+        return pd.DataFrame(columns=['trades', 'win_rate', 'total_r', 'avg_r'])
+
+    closed = closed.set_index('exit_time').sort_index()
+    rolling = closed.rolling(window)
+    stats = pd.DataFrame({
+        'trades': rolling['r_multiple'].count(),
+        'win_rate': (closed['pnl_percentage'] > 0).astype(float).rolling(window).mean() * 100,
+        'total_r': rolling['r_multiple'].sum(),
+    })
+    stats['avg_r'] = stats['total_r'] / stats['trades']
+    return stats
+
+
+if __name__ == "__main__":
+    import argparse
+    from sinyal_takip_sistemi import SinyalTakipSistemi
+
+    parser = argparse.ArgumentParser(description="Sinyal geçmişini Parquet'e aktar")
+    parser.add_argument("--db", default="finanslab_signals.db")
+    parser.add_argument("--out", default=DEFAULT_EXPORT_DIR)
+    parser.add_argument("--since", default=None, help="Bu aydan itibaren yeniden yaz (YYYY-MM)")
+    args = parser.parse_args()
+
+    counts = export_signals(SinyalTakipSistemi(args.db), args.out, args.since)
+    for month, count in sorted(counts.items()):
+        print(f"  {month}: {count} sinyal")
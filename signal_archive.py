@@ -0,0 +1,222 @@
+"""
+FinansLab Sinyal Arşivi
+=======================
+
+Sıcak veritabanını (finanslab_signals.db) küçük tutar:
+- Ufuk süresinden (varsayılan 90 gün) eski, tamamı geçmiş aylardaki kapanmış sinyaller
+  aylık Parquet dosyalarına taşınır: <archive_dir>/month=YYYY-MM/signals.parquet
+- Her arşivlenen ay için sıcak DB'de monthly_summary satırı tutulur
+- load_signals(): sıcak + arşiv verisini tek DataFrame olarak döner (aynı id'de sıcak kayıt geçerli)
+- Aktif sinyaller ve günlük/kayan performans tabloları yerinde kalır
+
+Kullanım:
+    python signal_archive.py [--db finanslab_signals.db] [--archive signal_archive] [--horizon 90]
+"""
+
+import logging
+import os
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+import signal_analytics
+from signal_analytics import EXPORT_COLUMNS, rows_to_table, signal_schema
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ARCHIVE_DIR = "signal_archive"
+DEFAULT_HORIZON_DAYS = 90
+
+
+class SignalArchiver:
+    """
+    Move old closed signals out of the hot SQLite table, month by month
+
+    Only whole months that ended before the horizon are archived, so a month is
+    never split between "archived" and "about to be archived". Signals of such
+    a month that are still ACTIVE stay hot and are picked up by a later run once
+    they close (the month file and summary are then rebuilt with them).
+    """
+
+    def __init__(self, tracker, archive_dir=DEFAULT_ARCHIVE_DIR, horizon_days=DEFAULT_HORIZON_DAYS):
+        if not signal_analytics.HAS_PYARROW:
+            raise ImportError("Sinyal arşivi için pyarrow gerekli: pip install pyarrow")
+        self.tracker = tracker
+        self.archive_dir = archive_dir
+        self.horizon_days = horizon_days
+
+    def _month_path(self, month):
+        return os.path.join(self.archive_dir, f"month={month}", "signals.parquet")
+
+    def cutoff_month(self, now=None):
+        """First month that stays hot ('YYYY-MM')"""
+        cutoff = (now or datetime.now()) - timedelta(days=self.horizon_days)
+        return cutoff.strftime('%Y-%m')
+
+    def archive(self, now=None):
+        """
+        Archive every eligible month
+
+        Returns:
+            dict: month -> number of signals moved
+        """
+        cutoff = f"{self.cutoff_month(now)}-01"
+        with self.tracker.db.connection() as conn:
+            months = [row[0] for row in conn.execute('''
+                SELECT DISTINCT substr(signal_date, 1, 7) FROM signals
+                WHERE signal_date < ? AND status IN ('WIN', 'LOSS')
+            ''', (cutoff,))]
+
+        moved = {}
+        for month in sorted(months):
+            moved[month] = self.archive_month(month)
+
+        if moved:
+            logger.info(f"✅ {sum(moved.values())} sinyal {len(moved)} aya arşivlendi ({self.archive_dir})")
+        return moved
+
+    def archive_month(self, month):
+        """
+        Move one month's closed signals into its Parquet file
+
+        The file is written (atomically) before the hot rows are deleted; if the
+        process dies in between, rows exist in both places and load_signals()
+        de-duplicates them by id. The moved rows' totals are added to
+        archived_daily_performance in the same transaction as the delete, so
+        daily_performance recomputes keep counting them.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        schema = signal_schema()
+        with self.tracker.db.connection() as conn:
+            rows = conn.execute(f'''
+                SELECT {EXPORT_COLUMNS} FROM signals
+                WHERE signal_date >= ? AND signal_date < date(?, '+1 month') AND status IN ('WIN', 'LOSS')
+            ''', (f"{month}-01", f"{month}-01")).fetchall()
+        if not rows:
+            return 0
+
+        path = self._month_path(month)
+        table = rows_to_table(rows, schema)
+        moved = table.to_pandas()
+        if os.path.exists(path):
+            table = pa.concat_tables([pq.read_table(path, schema=schema), table])
+        frame = table.to_pandas().drop_duplicates('id', keep='last').sort_values('id')
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = os.path.join(os.path.dirname(path), ".signals.parquet.tmp")
+        pq.write_table(pa.Table.from_pandas(frame, schema=schema, preserve_index=False), tmp_path, compression='zstd')
+        os.replace(tmp_path, path)
+
+        wins = int((frame['pnl_percentage'] > 0).sum())
+        total = len(frame)
+        # Per exit day totals of the moved rows, so daily_performance can still be
+        # recomputed for days whose signals are (partly) archived
+        moved['win'] = moved['pnl_percentage'] > 0
+        by_exit_day = moved.groupby('exit_date')['r_multiple'].agg(['count', 'sum', 'max', 'min'])
+        by_exit_day['wins'] = moved.groupby('exit_date')['win'].sum()
+        exit_day_params = [
+            (day, int(row['count']), int(row['wins']), float(row['sum']), float(row['max']), float(row['min']))
+            for day, row in by_exit_day.iterrows()
+        ]
+
+        with self.tracker.db.transaction() as conn:
+            conn.executemany('DELETE FROM signals WHERE id = ?', [(row[0],) for row in rows])
+            conn.executemany('''
+                INSERT INTO archived_daily_performance (
+                    exit_date, total_signals, winning_signals, total_r, best_trade_r, worst_trade_r
+                ) VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(exit_date) DO UPDATE SET
+                    total_signals = total_signals + excluded.total_signals,
+                    winning_signals = winning_signals + excluded.winning_signals,
+                    total_r = total_r + excluded.total_r,
+                    best_trade_r = MAX(COALESCE(best_trade_r, excluded.best_trade_r), excluded.best_trade_r),
+                    worst_trade_r = MIN(COALESCE(worst_trade_r, excluded.worst_trade_r), excluded.worst_trade_r)
+            ''', exit_day_params)
+            conn.execute('''
+                INSERT OR REPLACE INTO monthly_summary (
+                    month, total_signals, winning_signals, losing_signals, win_rate,
+                    total_r, best_trade_r, worst_trade_r, archive_path, archived_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (month, total, wins, total - wins, wins / total * 100,
+                  float(frame['r_multiple'].sum()), float(frame['r_multiple'].max()),
+                  float(frame['r_multiple'].min()), path, datetime.now().isoformat()))
+
+        logger.info(f"📦 {month}: {len(rows)} sinyal arşivlendi (toplam {total})")
+        return len(rows)
+
+    def get_monthly_summary(self):
+        """
+        Archived month summaries, oldest first
+
+        Returns:
+            list: (month, total_signals, winning_signals, losing_signals, win_rate,
+                   total_r, best_trade_r, worst_trade_r) tuples
+        """
+        with self.tracker.db.connection() as conn:
+            return conn.execute('''
+                SELECT month, total_signals, winning_signals, losing_signals, win_rate,
+                       total_r, best_trade_r, worst_trade_r
+                FROM monthly_summary ORDER BY month
+            ''').fetchall()
+
+    def load_signals(self, columns=None, start=None, end=None, symbols=None, status=None):
+        """
+        Signals from the hot table and the archive as one DataFrame
+
+        Same arguments as signal_analytics.load_signals. The archive is only
+        opened when the requested range reaches an archived month.
+        """
+        schema = signal_schema()
+        columns = list(columns or schema.names)
+        load_columns = columns if 'id' in columns else ['id'] + columns
+
+        where, params = [], []
+        if start is not None:
+            where.append('timestamp >= ?')
+            params.append(pd.Timestamp(start).isoformat())
+        if end is not None:
+            where.append('timestamp < ?')
+            params.append(pd.Timestamp(end).isoformat())
+        if symbols:
+            where.append(f"symbol IN ({', '.join('?' * len(symbols))})")
+            params.extend(symbols)
+        if status:
+            where.append(f"status IN ({', '.join('?' * len(status))})")
+            params.extend(status)
+
+        with self.tracker.db.connection() as conn:
+            rows = conn.execute(
+                f"SELECT {EXPORT_COLUMNS} FROM signals" + (f" WHERE {' AND '.join(where)}" if where else ""),
+                params
+            ).fetchall()
+            newest_archived = conn.execute('SELECT MAX(month) FROM monthly_summary').fetchone()[0]
+
+        hot = rows_to_table(rows, schema).to_pandas()[load_columns]
+
+        reaches_archive = newest_archived is not None and (
+            start is None or pd.Timestamp(start).strftime('%Y-%m') <= newest_archived
+        )
+        if not reaches_archive:
+            return hot[columns]
+
+        archived = signal_analytics.load_signals(self.archive_dir, load_columns, start, end, symbols, status)
+        archived = archived[~archived['id'].isin(hot['id'])]
+        combined = pd.concat([archived, hot], ignore_index=True) if len(hot) else archived
+        return combined[columns].reset_index(drop=True)
+
+
+if __name__ == "__main__":
+    import argparse
+    from sinyal_takip_sistemi import SinyalTakipSistemi
+
+    parser = argparse.ArgumentParser(description="Eski kapanmış sinyalleri aylık Parquet arşivine taşı")
+    parser.add_argument("--db", default="finanslab_signals.db")
+    parser.add_argument("--archive", default=DEFAULT_ARCHIVE_DIR)
+    parser.add_argument("--horizon", type=int, default=DEFAULT_HORIZON_DAYS, help="Sıcak tutulacak gün sayısı")
+    args = parser.parse_args()
+
+    archiver = SignalArchiver(SinyalTakipSistemi(args.db), args.archive, args.horizon)
+    for month, count in sorted(archiver.archive().items()):
+        print(f"  {month}: {count} sinyal arşivlendi")
@@ -0,0 +1,144 @@
+"""
+FinansLab Sinyal Tekrar Önleme Deposu
+=====================================
+
+Gönderilen sinyal anahtarlarını süre sınırlı (TTL) ve boyut sınırlı (LRU) tutar.
+İsteğe bağlı olarak SQLite'a yazılır; yeniden başlatmada aynı sinyal tekrar gönderilmez.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+
+class SignalDedupStore:
+    """
+    Bounded dedup set with per-key expiry and O(1) membership checks
+
+    Keys are kept in insertion order; re-adding a key moves it to the end.
+    When max_size is exceeded the oldest key is evicted.
+    """
+
+    def __init__(self, ttl_seconds=4 * 3600, max_size=1000, db_path=None):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self.db_path = db_path
+        self._entries = OrderedDict()  # key -> expires_at (epoch seconds)
+        self._lock = threading.Lock()
+
+        if self.db_path:
+            self.setup_database()
+            self._load()
+
+    def setup_database(self):
+        """Kalıcı tekrar önleme tablosu kurulumu"""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS sent_signal_keys (
+                    signal_key TEXT PRIMARY KEY,
+                    expires_at REAL NOT NULL
+                )
+            ''')
+            conn.commit()
+            conn.close()
+        except Exception as e:
+            logger.error(f"❌ Dedup tablo kurulum hatası: {str(e)}")
+
+    def _load(self):
+        """Süresi dolmamış anahtarları yükle (en yeni max_size kadar)"""
+        try:
+            now = time.time()
+            conn = sqlite3.connect(self.db_path)
+            conn.execute('DELETE FROM sent_signal_keys WHERE expires_at <= ?', (now,))
+            rows = conn.execute('''
+                SELECT signal_key, expires_at FROM sent_signal_keys
+                ORDER BY expires_at DESC LIMIT ?
+            ''', (self.max_size,)).fetchall()
+            conn.commit()
+            conn.close()
+
+            for key, expires_at in reversed(rows):
+                self._entries[key] = expires_at
+        except Exception as e:
+            logger.error(f"❌ Dedup yükleme hatası: {str(e)}")
+
+    def _persist(self, upserts=(), deletes=()):
+        if not self.db_path or (not upserts and not deletes):
+            return
+        try:
+            conn = sqlite3.connect(self.db_path)
+            if upserts:
+                conn.executemany('''
+                    INSERT OR REPLACE INTO sent_signal_keys (signal_key, expires_at) VALUES (?, ?)
+                ''', upserts)
+            if deletes:
+                conn.executemany('DELETE FROM sent_signal_keys WHERE signal_key = ?',
+                                 [(key,) for key in deletes])
+            conn.commit()
+            conn.close()
+        except Exception as e:
+            logger.error(f"❌ Dedup kayıt hatası: {str(e)}")
+
+    def __contains__(self, key):
+        with self._lock:
+            expires_at = self._entries.get(key)
+            if expires_at is None:
+                return False
+            if expires_at > time.time():
+                return True
+            del self._entries[key]
+        self._persist(deletes=[key])
+        return False
+
+    def add(self, key, ttl_seconds=None):
+        """Mark a signal key as sent for ttl_seconds (default: store TTL)"""
+        expires_at = time.time() + (ttl_seconds or self.ttl_seconds)
+        evicted = []
+
+        with self._lock:
+            self._entries[key] = expires_at
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                old_key, _ = self._entries.popitem(last=False)
+                evicted.append(old_key)
+
+        self._persist(upserts=[(key, expires_at)], deletes=evicted)
+
+    def discard(self, key):
+        """Forget a key (e.g. to allow an immediate resend)"""
+        with self._lock:
+            self._entries.pop(key, None)
+        self._persist(deletes=[key])
+
+    def purge_expired(self):
+        """
+        Drop expired keys from memory and SQLite
+
+        Returns:
+            int: Number of keys removed from memory
+        """
+        now = time.time()
+        with self._lock:
+            expired = [key for key, expires_at in self._entries.items() if expires_at <= now]
+            for key in expired:
+                del self._entries[key]
+
+        if self.db_path:
+            try:
+                conn = sqlite3.connect(self.db_path)
+                conn.execute('DELETE FROM sent_signal_keys WHERE expires_at <= ?', (now,))
+                conn.commit()
+                conn.close()
+            except Exception as e:
+                logger.error(f"❌ Dedup temizleme hatası: {str(e)}")
+
+        return len(expired)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
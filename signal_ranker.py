@@ -0,0 +1,137 @@
+"""
+FinansLab Top-K Sinyal Sıralayıcı
+=================================
+
+Tarama sırasında gelen sembol sonuçlarından en iyi k kurulumu sınırlı bir heap'te tutar.
+Sıralama: confluence skoru > bias gücü (yön bağımsız) > güncellik.
+Telegram ve dashboard tarama bitmeden güncel top-k listesini okuyabilir.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from datetime import datetime
+
+
+# TamOtomatikSistem string confluence seviyeleri
+CONFLUENCE_LEVELS = {
+    'cok_yuksek': 4,
+    'yuksek': 3,
+    'orta': 2,
+    'dusuk': 1
+}
+
+
+def default_rank_key(result):
+    """
+    Build (confluence_score, bias_conviction, recency) for a scanner result
+
+    Supports FinansLabUnified.comprehensive_analysis, TamOtomatikSistem.analyze_symbol
+    and PanelScanner rows (dict form).
+    """
+    confluence = result.get('confluence')
+    if isinstance(confluence, dict):
+        score = float(confluence.get('score', 0))
+    elif isinstance(confluence, str):
+        score = float(CONFLUENCE_LEVELS.get(confluence, 0))
+    else:
+        score = float(result.get('confluence_score', 0))
+
+    bias = result.get('bias')
+    if isinstance(bias, dict):
+        strength = bias.get('strength', 50)
+    else:
+        strength = result.get('bias_strength', 50)
+    conviction = abs(float(strength) - 50)
+
+    timestamp = result.get('timestamp')
+    if isinstance(timestamp, datetime):
+        recency = timestamp.timestamp()
+    else:
+        recency = time.time()
+
+    return (score, conviction, recency)
+
+
+class TopKSignalRanker:
+    """
+    Thread-safe bounded min-heap of the best setups across the universe
+
+    The heap root is always the weakest member, so a new result only enters when it
+    beats the root. Each symbol holds at most one slot; a newer result for the same
+    symbol replaces its previous entry.
+    """
+
+    def __init__(self, k=10, key=default_rank_key):
+        self.k = k
+        self.key = key
+        self._heap = []
+        self._members = {}
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self.last_update = None
+
+    def offer(self, result):
+        """
+        Offer a per-symbol result; safe to call from concurrent workers
+
+        Returns:
+            bool: True if the result is currently in the top-k
+        """
+        if not result:
+            return False
+
+        symbol = result.get('symbol')
+        rank_key = self.key(result)
+        entry = [rank_key, next(self._counter), symbol, result]
+
+        with self._lock:
+            self.last_update = datetime.now()
+
+            if symbol in self._members:
+                # Replace this symbol's previous entry in place
+                old = self._members[symbol]
+                self._heap[self._heap.index(old)] = entry
+                heapq.heapify(self._heap)
+                self._members[symbol] = entry
+                return True
+
+            if len(self._heap) < self.k:
+                heapq.heappush(self._heap, entry)
+                self._members[symbol] = entry
+                return True
+
+            if rank_key > self._heap[0][0]:
+                evicted = heapq.heapreplace(self._heap, entry)
+                del self._members[evicted[2]]
+                self._members[symbol] = entry
+                return True
+
+            return False
+
+    def top(self, n=None):
+        """
+        Current top-k results, best first (does not wait for the scan to finish)
+        """
+        with self._lock:
+            entries = sorted(self._heap, key=lambda e: (e[0], e[1]), reverse=True)
+        results = [e[3] for e in entries]
+        return results[:n] if n else results
+
+    def min_key(self):
+        """Rank key a result must beat to enter a full heap"""
+        with self._lock:
+            if len(self._heap) < self.k:
+                return None
+            return self._heap[0][0]
+
+    def reset(self):
+        """Clear the heap at the start of a new scan"""
+        with self._lock:
+            self._heap = []
+            self._members = {}
+
+    def __len__(self):
+        with self._lock:
+            return len(self._heap)
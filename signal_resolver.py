@@ -0,0 +1,250 @@
+"""
+FinansLab Sinyal Sonuç Çözümleyici
+==================================
+
+Aktif sinyallerin sonucunu fiyat verisinden otomatik belirler:
+- Tüm aktif sinyaller tek sorguda yüklenir
+- Her sembol için en eski girişi kapsayan bar verisi bir kez çekilir (veya hazır veri kullanılır)
+- Stop / TP1 / TP2 seviyelerinden hangisine önce dokunulduğu NumPy ile sinyal x bar matrisi üzerinde bulunur
+- Kapanan sinyaller tek toplu güncelleme ile yazılır (guncelle_sonuclar)
+
+Kurallar:
+- Giriş zamanından önce açılan barlar dikkate alınmaz
+- Aynı barda hem stop hem hedef görülürse stop kabul edilir (muhafazakar)
+- TP1'e dokunulan barda TP2'ye de ulaşıldıysa sonuç TP2'dir
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+LONG_DIRECTIONS = ('LONG', 'BUY', 'ALIM')
+
+OPEN, STOP_LOSS, TAKE_PROFIT1, TAKE_PROFIT2 = 0, 1, 2, 3
+OUTCOME_NAMES = {STOP_LOSS: 'stop_loss', TAKE_PROFIT1: 'take_profit1', TAKE_PROFIT2: 'take_profit2'}
+
+# Fetcher periods (name, days) - the smallest one covering the oldest entry is used
+FETCH_PERIODS = (('1d', 1), ('7d', 7), ('1mo', 30), ('60d', 60), ('3mo', 90),
+                 ('6mo', 180), ('1y', 365), ('2y', 730))
+
+
+def first_hit(hit, start):
+    """
+    Index of the first True at or after start, per row
+
+    Args:
+        hit (np.ndarray): bool matrix (signals x bars)
+        start (np.ndarray): First eligible bar per signal
+
+    Returns:
+        np.ndarray: Bar index, or the bar count when never hit
+    """
+    n_bars = hit.shape[1]
+    hit &= np.arange(n_bars) >= start[:, None]
+    idx = hit.argmax(axis=1)
+    return np.where(hit[np.arange(len(idx)), idx], idx, n_bars)
+
+
+def resolve_outcomes(bar_times, highs, lows, entry_times, is_long, stop_loss,
+                     take_profit1, take_profit2, chunk_size=512):
+    """
+    Decide which level each signal touched first
+
+    Args:
+        bar_times (np.ndarray): Bar open times (int64 ns, ascending)
+        highs, lows (np.ndarray): Bar extremes
+        entry_times (np.ndarray): Signal entry times (int64 ns)
+        is_long (np.ndarray): bool per signal
+        stop_loss, take_profit1, take_profit2 (np.ndarray): Levels per signal
+        chunk_size (int): Signals per matrix block (bounds memory to chunk_size x bars)
+
+    Returns:
+        tuple: (outcome codes, bar index of the exit) - OPEN signals get index -1
+    """
+    n_signals = len(entry_times)
+    outcomes = np.full(n_signals, OPEN, dtype=np.int8)
+    exit_idx = np.full(n_signals, -1, dtype=np.int64)
+    if n_signals == 0 or len(bar_times) == 0:
+        return outcomes, exit_idx
+
+    start = np.searchsorted(bar_times, entry_times, side='left')
+    n_bars = len(bar_times)
+    highs = np.asarray(highs, dtype=float)[None, :]
+    lows = np.asarray(lows, dtype=float)[None, :]
+
+    for lo in range(0, n_signals, chunk_size):
+        rows = slice(lo, lo + chunk_size)
+        long_ = is_long[rows, None]
+        sl = stop_loss[rows, None]
+        tp1 = take_profit1[rows, None]
+        tp2 = take_profit2[rows, None]
+
+        # Long: stop below (low), targets above (high); short mirrored
+        sl_at = first_hit(np.where(long_, lows <= sl, highs >= sl), start[rows])
+        tp1_at = first_hit(np.where(long_, highs >= tp1, lows <= tp1), start[rows])
+        tp2_at = first_hit(np.where(long_, highs >= tp2, lows <= tp2), start[rows])
+
+        first = np.minimum(sl_at, np.minimum(tp1_at, tp2_at))
+        chunk_outcomes = np.select(
+            [first == n_bars, sl_at == first, tp2_at == first],
+            [OPEN, STOP_LOSS, TAKE_PROFIT2],
+            default=TAKE_PROFIT1
+        )
+        outcomes[rows] = chunk_outcomes
+        exit_idx[rows] = np.where(chunk_outcomes == OPEN, -1, first)
+
+    return outcomes, exit_idx
+
+
+def bar_times_ns(index):
+    """Bar index as UTC int64 ns (naive indexes are exchange data in UTC)"""
+    index = pd.DatetimeIndex(index)
+    if index.tz is None:
+        index = index.tz_localize('UTC')
+    return index.tz_convert('UTC').tz_localize(None).to_numpy(dtype='datetime64[ns]').astype(np.int64)
+
+
+def signal_times_ns(timestamps):
+    """Stored signal timestamps (naive local ISO strings) as UTC int64 ns"""
+    return np.array([int(datetime.fromisoformat(ts).astimezone().timestamp() * 1e9) for ts in timestamps],
+                    dtype=np.int64)
+
+
+class SignalOutcomeResolver:
+    """
+    Close ACTIVE signals whose stop or targets were reached
+
+    Args:
+        tracker (SinyalTakipSistemi): Signal store
+        fetcher: Object with get_klines(symbol, interval, period); defaults to EnhancedDataFetcher
+        interval (str): Bar interval used to check the levels
+    """
+
+    def __init__(self, tracker, fetcher=None, interval='1h', max_workers=4):
+        self.tracker = tracker
+        self.fetcher = fetcher
+        self.interval = interval
+        self.max_workers = max_workers
+
+    def _get_fetcher(self):
+        if self.fetcher is None:
+            from enhanced_data_fetcher import EnhancedDataFetcher
+            self.fetcher = EnhancedDataFetcher()
+        return self.fetcher
+
+    @staticmethod
+    def _period_for(oldest_ns):
+        age_days = (datetime.now().timestamp() - oldest_ns / 1e9) / 86400
+        for name, days in FETCH_PERIODS:
+            if age_days < days:
+                return name
+        return FETCH_PERIODS[-1][0]
+
+    def load_bars(self, oldest_by_symbol):
+        """
+        Fetch bars once per symbol, concurrently
+
+        Args:
+            oldest_by_symbol (dict): symbol -> oldest entry time (int64 ns)
+
+        Returns:
+            dict: symbol -> OHLC DataFrame (symbols without data are left out)
+        """
+        fetcher = self._get_fetcher()
+
+        def fetch(symbol):
+            try:
+                return symbol, fetcher.get_klines(symbol, self.interval, self._period_for(oldest_by_symbol[symbol]))
+            except Exception as e:
+                logger.warning(f"⚠️ {symbol} verisi alınamadı: {str(e)}")
+                return symbol, None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = executor.map(fetch, list(oldest_by_symbol))
+            return {symbol: data for symbol, data in results if data is not None and not data.empty}
+
+    def resolve(self, bars=None, dry_run=False):
+        """
+        Resolve all active signals in one pass
+
+        Args:
+            bars (dict): Optional symbol -> OHLC DataFrame already in memory;
+                only symbols missing here are fetched
+            dry_run (bool): Compute outcomes without writing them
+
+        Returns:
+            dict: Summary counts and the closes as (signal_id, exit_price, exit_time)
+        """
+        active = self.tracker.get_aktif_sinyaller()
+        summary = {'active': len(active), 'resolved': 0, 'no_data': 0, 'closes': [],
+                   'stop_loss': 0, 'take_profit1': 0, 'take_profit2': 0}
+        if not active:
+            return summary
+
+        frame = pd.DataFrame(active, columns=['id', 'timestamp', 'symbol', 'direction', 'entry_price',
+                                              'stop_loss', 'take_profit1', 'take_profit2'])
+        frame['entry_ns'] = signal_times_ns(frame['timestamp'])
+        groups = frame.groupby('symbol', sort=False)
+
+        bars = dict(bars or {})
+        missing = {symbol: group['entry_ns'].min() for symbol, group in groups if symbol not in bars}
+        if missing:
+            bars.update(self.load_bars(missing))
+
+        closes = []
+        for symbol, group in groups:
+            data = bars.get(symbol)
+            if data is None or data.empty:
+                summary['no_data'] += len(group)
+                continue
+
+            times = bar_times_ns(data.index)
+            outcomes, exit_idx = resolve_outcomes(
+                times, data['High'].to_numpy(), data['Low'].to_numpy(),
+                group['entry_ns'].to_numpy(),
+                group['direction'].str.upper().isin(LONG_DIRECTIONS).to_numpy(),
+                group['stop_loss'].to_numpy(dtype=float),
+                group['take_profit1'].to_numpy(dtype=float),
+                group['take_profit2'].to_numpy(dtype=float)
+            )
+
+            levels = {
+                STOP_LOSS: group['stop_loss'].to_numpy(dtype=float),
+                TAKE_PROFIT1: group['take_profit1'].to_numpy(dtype=float),
+                TAKE_PROFIT2: group['take_profit2'].to_numpy(dtype=float),
+            }
+            for row in np.flatnonzero(outcomes != OPEN):
+                outcome = int(outcomes[row])
+                exit_time = datetime.fromtimestamp(times[exit_idx[row]] / 1e9).isoformat()
+                closes.append((int(group['id'].iat[row]), float(levels[outcome][row]), exit_time))
+                summary[OUTCOME_NAMES[outcome]] += 1
+
+        summary['resolved'] = len(closes)
+        summary['closes'] = closes
+
+        if closes and not dry_run:
+            self.tracker.guncelle_sonuclar(closes)
+
+        logger.info(f"✅ Sinyal çözümleme: {summary['active']} aktif, {summary['resolved']} kapandı "
+                    f"(SL: {summary['stop_loss']}, TP1: {summary['take_profit1']}, "
+                    f"TP2: {summary['take_profit2']}), veri yok: {summary['no_data']}")
+        return summary
+
+
+if __name__ == "__main__":
+    import argparse
+    from sinyal_takip_sistemi import SinyalTakipSistemi
+
+    parser = argparse.ArgumentParser(description="Aktif sinyallerin sonuçlarını otomatik belirle")
+    parser.add_argument("--db", default="finanslab_signals.db")
+    parser.add_argument("--interval", default="1h")
+    parser.add_argument("--dry-run", action="store_true", help="Sonuçları yazmadan göster")
+    args = parser.parse_args()
+
+    result = SignalOutcomeResolver(SinyalTakipSistemi(args.db), interval=args.interval).resolve(dry_run=args.dry_run)
+    print({k: v for k, v in result.items() if k != 'closes'})
@@ -0,0 +1,206 @@
+"""
+FinansLab Sinyal Veritabanı Eşzamanlılık Testi
+==============================================
+
+SinyalTakipSistemi'ni birden çok yazıcı ve okuyucu thread ile zorlar ve iki
+bağlantı stratejisini karşılaştırır:
+- per-call: her çağrıda yeni bağlantı, rollback journal (eski davranış)
+- pooled:   WAL modunda bağlantı havuzu (SQLiteConnectionPool)
+
+Toplu mod, satır satır kayıt/güncelleme ile kaydet_sinyaller/guncelle_sonuclar
+(executemany, tek transaction) hızını satır/saniye olarak karşılaştırır.
+
+Kullanım:
+    python sinyal_db_benchmark.py [--mode all|contention|bulk] [--writers 4] [--readers 4]
+                                  [--seconds 5] [--rows 500]
+"""
+
+import argparse
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+from sinyal_takip_sistemi import SinyalTakipSistemi
+
+
+class PerCallConnections:
+    """Previous behaviour: a fresh connection per call, default rollback journal"""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+
+    @contextmanager
+    def connection(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA journal_mode = DELETE")
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def transaction(self):
+        with self.connection() as conn:
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            conn.commit()
+
+    def close(self):
+        pass
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def run_workload(tracker, writers, readers, seconds):
+    """
+    Returns:
+        dict: kind -> {'ops', 'errors', 'latencies'}
+    """
+    stats = {kind: {'ops': 0, 'errors': 0, 'latencies': []} for kind in ('write', 'read')}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + seconds
+
+    def record(kind, started, ok):
+        elapsed = time.perf_counter() - started
+        with lock:
+            stats[kind]['ops'] += 1
+            stats[kind]['latencies'].append(elapsed)
+            if not ok:
+                stats[kind]['errors'] += 1
+
+    def writer(worker_id):
+        n = 0
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            signal_id = tracker.kaydet_sinyal(
+                f"TEST{worker_id}USDT", "LONG" if n % 2 else "SHORT", 100.0, 98.0, 103.0, 106.0,
+                65.0, 7.5, "İYİ", "benchmark"
+            )
+            record('write', started, signal_id is not None)
+
+            if signal_id is not None:
+                started = time.perf_counter()
+                ok = tracker.guncelle_sinyal_sonuc(signal_id, 101.0 if n % 3 else 97.0)
+                record('write', started, ok)
+            n += 1
+
+    def reader():
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            ok = tracker.get_gunluk_rapor() is not None
+            tracker.get_recent_performance(7)
+            record('read', started, ok)
+
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(writers)]
+    threads += [threading.Thread(target=reader) for _ in range(readers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return stats
+
+
+def report(name, stats, seconds):
+    print(f"\n[{name}]")
+    for kind, data in stats.items():
+        lat = data['latencies']
+        print(f"  {kind:<5} {data['ops'] / seconds:8.1f} op/s | "
+              f"p50 {percentile(lat, 50) * 1000:7.2f} ms | p95 {percentile(lat, 95) * 1000:7.2f} ms | "
+              f"max {max(lat, default=0) * 1000:7.1f} ms | hata {data['errors']}")
+
+
+def run_benchmark(writers=4, readers=4, seconds=5):
+    # The tracker logs every insert/update; keep the benchmark output readable
+    logging.getLogger("sinyal_takip_sistemi").setLevel(logging.CRITICAL)
+
+    print("=== FinansLab Sinyal DB Eşzamanlılık Testi ===")
+    print(f"Yazıcı: {writers}, Okuyucu: {readers}, Süre: {seconds}s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in ("per-call", "pooled"):
+            db_path = os.path.join(tmp, f"{name}.db")
+            tracker = SinyalTakipSistemi(db_path=db_path, pool_size=writers + readers)
+            if name == "per-call":
+                tracker.db.close()
+                tracker.db = PerCallConnections(db_path)
+
+            stats = run_workload(tracker, writers, readers, seconds)
+            tracker.db.close()
+            report(name, stats, seconds)
+
+
+def sample_signals(rows):
+    """Deterministic signal dicts in kaydet_sinyal's argument layout"""
+    signals = []
+    for i in range(rows):
+        entry = 100.0 + i % 50
+        signals.append({
+            'symbol': f"TEST{i % 20}USDT", 'direction': "LONG" if i % 2 else "SHORT",
+            'entry_price': entry, 'stop_loss': entry * (0.98 if i % 2 else 1.02),
+            'take_profit1': entry * (1.03 if i % 2 else 0.97), 'take_profit2': entry * (1.06 if i % 2 else 0.94),
+            'bias_strength': 65.0, 'confluence_score': 7.5, 'signal_quality': "İYİ", 'notes': "benchmark"
+        })
+    return signals
+
+
+def run_bulk_benchmark(rows=500):
+    """Per-row vs. bulk ingest and outcome update on the same pooled store"""
+    logging.getLogger("sinyal_takip_sistemi").setLevel(logging.CRITICAL)
+
+    print(f"\n=== Toplu Kayıt/Güncelleme ({rows} satır) ===")
+    signals = sample_signals(rows)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {}
+        for name in ("satır satır", "toplu"):
+            tracker = SinyalTakipSistemi(db_path=os.path.join(tmp, f"bulk-{len(results)}.db"))
+
+            started = time.perf_counter()
+            if name == "toplu":
+                signal_ids = tracker.kaydet_sinyaller(signals)
+            else:
+                signal_ids = [tracker.kaydet_sinyal(**s) for s in signals]
+            insert_time = time.perf_counter() - started
+
+            updates = [(signal_id, s['entry_price'] * (1.01 if i % 3 else 0.99))
+                       for i, (signal_id, s) in enumerate(zip(signal_ids, signals))]
+            started = time.perf_counter()
+            if name == "toplu":
+                tracker.guncelle_sonuclar(updates)
+            else:
+                for signal_id, exit_price in updates:
+                    tracker.guncelle_sinyal_sonuc(signal_id, exit_price)
+            update_time = time.perf_counter() - started
+
+            results[name] = tracker.get_recent_performance(7)
+            tracker.db.close()
+            print(f"  {name:<12} kayıt {rows / insert_time:9.0f} satır/s | güncelleme {rows / update_time:9.0f} satır/s")
+
+        same = results["satır satır"] == results["toplu"]
+        print(f"  Aynı performans özeti: {'✅' if same else '❌'} {results['toplu']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sinyal veritabanı eşzamanlılık testi")
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--rows", type=int, default=500, help="Toplu modda satır sayısı")
+    parser.add_argument("--mode", choices=("all", "contention", "bulk"), default="all")
+    args = parser.parse_args()
+    if args.mode in ("all", "contention"):
+        run_benchmark(args.writers, args.readers, args.seconds)
+    if args.mode in ("all", "bulk"):
+        run_bulk_benchmark(args.rows)
@@ -13,9 +13,10 @@ import pandas as pd
 import numpy as np
 import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-import sqlite3
-import streamlit as st
+from sqlite_pool import SQLiteConnectionPool
 from typing import Dict, List, Optional
 import logging
 
@@ -23,103 +24,230 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Bumped whenever setup_database() gains a migration step (stored in PRAGMA user_version)
+SCHEMA_VERSION = 2
+
+# Row layout returned for signals; explicit so migrated tables (extra columns) unpack the same way
+SIGNAL_COLUMNS = (
+    "id, timestamp, symbol, direction, entry_price, stop_loss, "
+    "take_profit1, take_profit2, bias_strength, confluence_score, "
+    "signal_quality, status, entry_time, exit_time, exit_price, "
+    "pnl_percentage, r_multiple, notes"
+)
+
+SIGNAL_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_signals_status_timestamp ON signals (status, timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_signals_symbol_timestamp ON signals (symbol, timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_signals_signal_date ON signals (signal_date, status)",
+    "CREATE INDEX IF NOT EXISTS idx_signals_exit_date ON signals (exit_date, exit_time)",
+)
+
+SIGNAL_INSERT = '''
+    INSERT INTO signals (
+        timestamp, symbol, direction, entry_price, stop_loss,
+        take_profit1, take_profit2, bias_strength, confluence_score,
+        signal_quality, notes, signal_date
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, date(?))
+'''
+
+# Ids per "WHERE id IN (...)" statement (SQLite caps bound parameters per statement)
+ID_CHUNK_SIZE = 500
+
+# Stored daily bias older than this is recomputed in the background
+BIAS_MAX_AGE_SECONDS = 3600
+
+# Rolling windows (days) kept precomputed in rolling_performance
+ROLLING_WINDOWS = (7, 30, 90, 365)
+
+# Background daily bias refresh locks per database file, shared by every tracker instance
+# (the app creates one tracker per session)
+_bias_refresh_locks = {}
+_bias_refresh_locks_guard = threading.Lock()
+
+
+def _get_bias_refresh_lock(db_path):
+    """Process-wide refresh lock for a database file"""
+    with _bias_refresh_locks_guard:
+        return _bias_refresh_locks.setdefault(os.path.abspath(db_path), threading.Lock())
+
 class SinyalTakipSistemi:
     """Otomatik sinyal takip ve performans analiz sistemi"""
     
-    def __init__(self, db_path="finanslab_signals.db"):
+    def __init__(self, db_path="finanslab_signals.db", pool_size=4):
         self.db_path = db_path
+        # Pooled WAL connections: scanner writes and dashboard reads don't block each other
+        self.db = SQLiteConnectionPool(db_path, pool_size=pool_size)
+        self._bias_refresh_lock = _get_bias_refresh_lock(db_path)
         self.setup_database()
         
     def setup_database(self):
         """Veritabanı kurulumu"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Sinyaller tablosu
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS signals (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp TEXT NOT NULL,
-                    symbol TEXT NOT NULL,
-                    direction TEXT NOT NULL,
-                    entry_price REAL NOT NULL,
-                    stop_loss REAL NOT NULL,
-                    take_profit1 REAL NOT NULL,
-                    take_profit2 REAL NOT NULL,
-                    bias_strength REAL NOT NULL,
-                    confluence_score REAL NOT NULL,
-                    signal_quality TEXT NOT NULL,
-                    status TEXT DEFAULT 'ACTIVE',
-                    entry_time TEXT,
-                    exit_time TEXT,
-                    exit_price REAL,
-                    pnl_percentage REAL,
-                    r_multiple REAL,
-                    notes TEXT
-                )
-            ''')
-            
-            # Günlük performans tablosu
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS daily_performance (
-                    date TEXT PRIMARY KEY,
-                    total_signals INTEGER DEFAULT 0,
-                    winning_signals INTEGER DEFAULT 0,
-                    losing_signals INTEGER DEFAULT 0,
-                    win_rate REAL DEFAULT 0,
-                    total_r REAL DEFAULT 0,
-                    best_trade_r REAL DEFAULT 0,
-                    worst_trade_r REAL DEFAULT 0,
-                    daily_bias TEXT DEFAULT 'NEUTRAL',
-                    market_sentiment TEXT DEFAULT 'NEUTRAL'
-                )
-            ''')
-            
-            # Günlük bias önerileri tablosu
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS daily_bias (
-                    date TEXT PRIMARY KEY,
-                    recommended_bias TEXT NOT NULL,
-                    confidence REAL NOT NULL,
-                    reasoning TEXT NOT NULL,
-                    market_conditions TEXT NOT NULL,
-                    active_pairs TEXT NOT NULL,
-                    expected_volatility TEXT NOT NULL
-                )
-            ''')
-            
-            conn.commit()
-            conn.close()
+            with self.db.transaction() as conn:
+                cursor = conn.cursor()
+                
+                # Sinyaller tablosu
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS signals (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        timestamp TEXT NOT NULL,
+                        symbol TEXT NOT NULL,
+                        direction TEXT NOT NULL,
+                        entry_price REAL NOT NULL,
+                        stop_loss REAL NOT NULL,
+                        take_profit1 REAL NOT NULL,
+                        take_profit2 REAL NOT NULL,
+                        bias_strength REAL NOT NULL,
+                        confluence_score REAL NOT NULL,
+                        signal_quality TEXT NOT NULL,
+                        status TEXT DEFAULT 'ACTIVE',
+                        entry_time TEXT,
+                        exit_time TEXT,
+                        exit_price REAL,
+                        pnl_percentage REAL,
+                        r_multiple REAL,
+                        notes TEXT,
+                        signal_date TEXT,
+                        exit_date TEXT
+                    )
+                ''')
+                
+                # Günlük performans tablosu
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS daily_performance (
+                        date TEXT PRIMARY KEY,
+                        total_signals INTEGER DEFAULT 0,
+                        winning_signals INTEGER DEFAULT 0,
+                        losing_signals INTEGER DEFAULT 0,
+                        win_rate REAL DEFAULT 0,
+                        total_r REAL DEFAULT 0,
+                        best_trade_r REAL DEFAULT 0,
+                        worst_trade_r REAL DEFAULT 0,
+                        daily_bias TEXT DEFAULT 'NEUTRAL',
+                        market_sentiment TEXT DEFAULT 'NEUTRAL'
+                    )
+                ''')
+                
+                # Günlük bias önerileri tablosu
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS daily_bias (
+                        date TEXT PRIMARY KEY,
+                        recommended_bias TEXT NOT NULL,
+                        confidence REAL NOT NULL,
+                        reasoning TEXT NOT NULL,
+                        market_conditions TEXT NOT NULL,
+                        active_pairs TEXT NOT NULL,
+                        expected_volatility TEXT NOT NULL,
+                        computed_at TEXT
+                    )
+                ''')
+
+                # Kayan pencere toplamları (get_recent_performance)
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS rolling_performance (
+                        window_days INTEGER PRIMARY KEY,
+                        start_date TEXT NOT NULL,
+                        end_date TEXT NOT NULL,
+                        total_signals INTEGER DEFAULT 0,
+                        winning_signals INTEGER DEFAULT 0,
+                        total_r REAL DEFAULT 0,
+                        best_trade_r REAL,
+                        worst_trade_r REAL,
+                        days_analyzed INTEGER DEFAULT 0
+                    )
+                ''')
+
+                # Arşivlenen ayların özeti (signal_archive)
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS monthly_summary (
+                        month TEXT PRIMARY KEY,
+                        total_signals INTEGER DEFAULT 0,
+                        winning_signals INTEGER DEFAULT 0,
+                        losing_signals INTEGER DEFAULT 0,
+                        win_rate REAL DEFAULT 0,
+                        total_r REAL DEFAULT 0,
+                        best_trade_r REAL,
+                        worst_trade_r REAL,
+                        archive_path TEXT NOT NULL,
+                        archived_at TEXT NOT NULL
+                    )
+                ''')
+
+                # Arşivlenen sinyallerin kapanış gününe göre toplamları; günlük performans
+                # yeniden hesaplanırken sıcak tablodaki sinyallere eklenir
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS archived_daily_performance (
+                        exit_date TEXT PRIMARY KEY,
+                        total_signals INTEGER DEFAULT 0,
+                        winning_signals INTEGER DEFAULT 0,
+                        total_r REAL DEFAULT 0,
+                        best_trade_r REAL,
+                        worst_trade_r REAL
+                    )
+                ''')
+
+                self._migrate(cursor)
+
             logger.info("✅ Veritabanı başarıyla kuruldu")
             
         except Exception as e:
             logger.error(f"❌ Veritabanı kurulum hatası: {str(e)}")
     
+    def _migrate(self, cursor):
+        """
+        Bring an existing database up to SCHEMA_VERSION
+
+        v1: normalized signal_date/exit_date columns (YYYY-MM-DD, backfilled
+        with SQLite's date()) and secondary indexes, so daily queries are index
+        lookups instead of date(...) scans over the whole signals table.
+        v2: daily_bias.computed_at, used for the bias freshness check.
+        """
+        version = cursor.execute('PRAGMA user_version').fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            return
+
+        def add_columns(table, names):
+            columns = {row[1] for row in cursor.execute(f'PRAGMA table_info({table})')}
+            for column in names:
+                if column not in columns:
+                    cursor.execute(f'ALTER TABLE {table} ADD COLUMN {column} TEXT')
+
+        migrated = 0
+        if version < 1:
+            add_columns('signals', ('signal_date', 'exit_date'))
+
+            cursor.execute('''
+                UPDATE signals SET signal_date = date(timestamp), exit_date = date(exit_time)
+                WHERE signal_date IS NULL OR (exit_time IS NOT NULL AND exit_date IS NULL)
+            ''')
+            migrated = cursor.rowcount
+
+            for statement in SIGNAL_INDEXES:
+                cursor.execute(statement)
+
+        if version < 2:
+            # Existing rows have no timestamp and count as stale
+            add_columns('daily_bias', ('computed_at',))
+
+        cursor.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+        logger.info(f"✅ Veritabanı şeması v{SCHEMA_VERSION} sürümüne taşındı ({migrated} sinyal güncellendi)")
+
     def kaydet_sinyal(self, symbol: str, direction: str, entry_price: float, 
                      stop_loss: float, take_profit1: float, take_profit2: float,
                      bias_strength: float, confluence_score: float, signal_quality: str,
                      notes: str = ""):
         """Yeni sinyal kaydı"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            timestamp = datetime.now().isoformat()
-            
-            cursor.execute('''
-                INSERT INTO signals (
-                    timestamp, symbol, direction, entry_price, stop_loss,
-                    take_profit1, take_profit2, bias_strength, confluence_score,
-                    signal_quality, notes
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (timestamp, symbol, direction, entry_price, stop_loss,
-                  take_profit1, take_profit2, bias_strength, confluence_score,
-                  signal_quality, notes))
-            
-            signal_id = cursor.lastrowid
-            conn.commit()
-            conn.close()
+            with self.db.transaction() as conn:
+                cursor = conn.cursor()
+                
+                timestamp = datetime.now().isoformat()
+                
+                cursor.execute(SIGNAL_INSERT, (timestamp, symbol, direction, entry_price, stop_loss,
+                                               take_profit1, take_profit2, bias_strength, confluence_score,
+                                               signal_quality, notes, timestamp))
+                
+                signal_id = cursor.lastrowid
             
             logger.info(f"✅ Sinyal kaydedildi: {symbol} {direction} - ID: {signal_id}")
             return signal_id
@@ -128,154 +256,348 @@ class SinyalTakipSistemi:
             logger.error(f"❌ Sinyal kaydetme hatası: {str(e)}")
             return None
     
+    def kaydet_sinyaller(self, signals: List[Dict]):
+        """
+        Birden çok sinyali tek transaction içinde kaydet (executemany)
+        
+        Args:
+            signals (list): kaydet_sinyal argümanlarıyla aynı anahtarlara sahip dict'ler
+                (notes opsiyonel)
+        
+        Returns:
+            list: Sırayla yeni sinyal ID'leri (hata durumunda boş liste)
+        """
+        if not signals:
+            return []
+        
+        try:
+            timestamp = datetime.now().isoformat()
+            rows = [(timestamp, s['symbol'], s['direction'], s['entry_price'], s['stop_loss'],
+                     s['take_profit1'], s['take_profit2'], s['bias_strength'], s['confluence_score'],
+                     s['signal_quality'], s.get('notes', ""), timestamp) for s in signals]
+            
+            with self.db.transaction() as conn:
+                conn.executemany(SIGNAL_INSERT, rows)
+                # AUTOINCREMENT ids within one write transaction are consecutive
+                last_id = conn.execute('SELECT last_insert_rowid()').fetchone()[0]
+            
+            signal_ids = list(range(last_id - len(rows) + 1, last_id + 1))
+            logger.info(f"✅ {len(signal_ids)} sinyal toplu kaydedildi (ID: {signal_ids[0]}-{signal_ids[-1]})")
+            return signal_ids
+            
+        except Exception as e:
+            logger.error(f"❌ Toplu sinyal kaydetme hatası: {str(e)}")
+            return []
+    
     def guncelle_sinyal_sonuc(self, signal_id: int, exit_price: float, 
                              exit_time: Optional[str] = None):
         """Sinyal sonucunu güncelle"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Sinyal bilgilerini al
-            cursor.execute('SELECT * FROM signals WHERE id = ?', (signal_id,))
-            signal = cursor.fetchone()
+            # Sonuç ve günlük performans aynı transaction içinde yazılır
+            with self.db.transaction() as conn:
+                results = self._kapat_sinyaller(conn.cursor(), [(signal_id, exit_price, exit_time)])
             
-            if not signal:
-                logger.error(f"❌ Sinyal bulunamadı: {signal_id}")
+            if not results:
                 return False
             
-            # Unpack signal data
-            (id, timestamp, symbol, direction, entry_price, stop_loss,
-             take_profit1, take_profit2, bias_strength, confluence_score,
-             signal_quality, status, entry_time, old_exit_time, old_exit_price,
-             old_pnl, old_r_multiple, notes) = signal
-            
-            # PnL hesaplama
-            if direction.upper() in ['LONG', 'BUY', 'ALIM']:
-                pnl_percentage = ((exit_price - entry_price) / entry_price) * 100
-            else:  # SHORT
-                pnl_percentage = ((entry_price - exit_price) / entry_price) * 100
-            
-            # R Multiple hesaplama
-            risk = abs(entry_price - stop_loss)
-            if risk > 0:
-                if direction.upper() in ['LONG', 'BUY', 'ALIM']:
-                    r_multiple = (exit_price - entry_price) / risk
-                else:
-                    r_multiple = (entry_price - exit_price) / risk
-            else:
-                r_multiple = 0
-            
-            # Durumu belirle
-            new_status = 'WIN' if pnl_percentage > 0 else 'LOSS'
-            
-            # Güncelle
-            exit_time = exit_time or datetime.now().isoformat()
-            
-            cursor.execute('''
-                UPDATE signals SET
-                    status = ?, exit_time = ?, exit_price = ?,
-                    pnl_percentage = ?, r_multiple = ?
-                WHERE id = ?
-            ''', (new_status, exit_time, exit_price, pnl_percentage, r_multiple, signal_id))
-            
-            conn.commit()
-            conn.close()
-            
-            logger.info(f"✅ Sinyal güncellendi: {symbol} {new_status} - PnL: {pnl_percentage:.2f}% - R: {r_multiple:.2f}")
-            
-            # Günlük performansı güncelle
-            self.guncelle_gunluk_performans()
-            
+            result = results[0]
+            logger.info(f"✅ Sinyal güncellendi: {result['symbol']} {result['status']} - "
+                        f"PnL: {result['pnl_percentage']:.2f}% - R: {result['r_multiple']:.2f}")
             return True
             
         except Exception as e:
             logger.error(f"❌ Sinyal güncelleme hatası: {str(e)}")
             return False
     
-    def guncelle_gunluk_performans(self, target_date: Optional[str] = None):
-        """Günlük performans istatistiklerini güncelle"""
+    def guncelle_sonuclar(self, updates: List[tuple]):
+        """
+        Birden çok sinyal sonucunu tek transaction içinde güncelle (executemany)
+        
+        Args:
+            updates (list): (signal_id, exit_price) veya (signal_id, exit_price, exit_time) tuple'ları
+        
+        Returns:
+            int: Güncellenen sinyal sayısı
+        """
+        if not updates:
+            return 0
+        
         try:
-            if not target_date:
-                target_date = datetime.now().strftime('%Y-%m-%d')
+            with self.db.transaction() as conn:
+                results = self._kapat_sinyaller(conn.cursor(), updates)
             
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            wins = len([r for r in results if r['status'] == 'WIN'])
+            logger.info(f"✅ {len(results)} sinyal toplu güncellendi - WIN: {wins}, LOSS: {len(results) - wins}")
+            return len(results)
             
-            # O gün kapanan sinyalleri al
-            cursor.execute('''
-                SELECT * FROM signals 
-                WHERE date(exit_time) = ? AND status IN ('WIN', 'LOSS')
-            ''', (target_date,))
-            
-            signals = cursor.fetchall()
-            
-            if not signals:
-                logger.info(f"📊 {target_date} için kapanan sinyal bulunamadı")
-                return
-            
-            # İstatistikleri hesapla
-            total_signals = len(signals)
-            winning_signals = len([s for s in signals if s[14] > 0])  # pnl_percentage > 0
-            losing_signals = total_signals - winning_signals
-            win_rate = (winning_signals / total_signals) * 100 if total_signals > 0 else 0
-            
-            # R multiple'ları al
-            r_multiples = [s[15] for s in signals if s[15] is not None]  # r_multiple
-            total_r = sum(r_multiples) if r_multiples else 0
-            best_trade_r = max(r_multiples) if r_multiples else 0
-            worst_trade_r = min(r_multiples) if r_multiples else 0
-            
-            # Günlük bias hesapla (aktif sinyallerin çoğunluğu)
-            cursor.execute('''
-                SELECT direction FROM signals 
-                WHERE date(timestamp) = ? AND status = 'ACTIVE'
-            ''', (target_date,))
-            
-            active_directions = [row[0] for row in cursor.fetchall()]
-            
-            if active_directions:
-                long_count = len([d for d in active_directions if d.upper() in ['LONG', 'BUY', 'ALIM']])
-                short_count = len([d for d in active_directions if d.upper() in ['SHORT', 'SELL', 'SATIM']])
-                
-                if long_count > short_count:
-                    daily_bias = 'BULLISH'
-                elif short_count > long_count:
-                    daily_bias = 'BEARISH'
-                else:
-                    daily_bias = 'NEUTRAL'
-            else:
-                daily_bias = 'NEUTRAL'
-            
-            # Market sentiment (win rate'e göre)
-            if win_rate >= 70:
-                market_sentiment = 'STRONG'
-            elif win_rate >= 50:
-                market_sentiment = 'POSITIVE'
-            elif win_rate >= 30:
-                market_sentiment = 'NEUTRAL'
+        except Exception as e:
+            logger.error(f"❌ Toplu sinyal güncelleme hatası: {str(e)}")
+            return 0
+    
+    @staticmethod
+    def _hesapla_sonuc(direction: str, entry_price: float, stop_loss: float, exit_price: float):
+        """
+        Returns:
+            tuple: (pnl_percentage, r_multiple, status)
+        """
+        is_long = direction.upper() in ['LONG', 'BUY', 'ALIM']
+        
+        # PnL hesaplama
+        if is_long:
+            pnl_percentage = ((exit_price - entry_price) / entry_price) * 100
+        else:  # SHORT
+            pnl_percentage = ((entry_price - exit_price) / entry_price) * 100
+        
+        # R Multiple hesaplama
+        risk = abs(entry_price - stop_loss)
+        if risk > 0:
+            r_multiple = (exit_price - entry_price) / risk if is_long else (entry_price - exit_price) / risk
+        else:
+            r_multiple = 0
+        
+        return pnl_percentage, r_multiple, 'WIN' if pnl_percentage > 0 else 'LOSS'
+    
+    def _signal_rows(self, cursor, columns: str, signal_ids: List[int]):
+        """Select rows by id in chunks that stay under SQLite's bound-parameter limit"""
+        for i in range(0, len(signal_ids), ID_CHUNK_SIZE):
+            chunk = signal_ids[i:i + ID_CHUNK_SIZE]
+            placeholders = ', '.join('?' * len(chunk))
+            yield from cursor.execute(f'SELECT {columns} FROM signals WHERE id IN ({placeholders})', chunk)
+    
+    def _kapat_sinyaller(self, cursor, updates):
+        """
+        Close signals and update the aggregates (inside the caller's transaction)
+        
+        Args:
+            updates (iterable): (signal_id, exit_price[, exit_time]) tuples; a repeated
+                id keeps its last update
+        
+        Returns:
+            list: One dict per closed signal (id, symbol, status, pnl_percentage, r_multiple)
+        """
+        latest = {}
+        for update in updates:
+            signal_id, exit_price = update[0], update[1]
+            latest[signal_id] = (exit_price, update[2] if len(update) > 2 else None)
+        
+        signal_ids = list(latest)
+        signals = {row[0]: row for row in self._signal_rows(
+            cursor, 'id, symbol, direction, entry_price, stop_loss, status, exit_date', signal_ids)}
+        
+        now = datetime.now().isoformat()
+        params, results = [], []
+        for signal_id, (exit_price, exit_time) in latest.items():
+            signal = signals.get(signal_id)
+            if not signal:
+                logger.error(f"❌ Sinyal bulunamadı: {signal_id}")
+                continue
+            
+            _, symbol, direction, entry_price, stop_loss, status, old_exit_date = signal
+            pnl_percentage, r_multiple, new_status = self._hesapla_sonuc(direction, entry_price, stop_loss, exit_price)
+            exit_time = exit_time or now
+            
+            params.append((new_status, exit_time, exit_time, exit_price, pnl_percentage, r_multiple, signal_id))
+            results.append({
+                'id': signal_id, 'symbol': symbol, 'status': new_status,
+                'pnl_percentage': pnl_percentage, 'r_multiple': r_multiple,
+                'reclosed_from': old_exit_date if status in ('WIN', 'LOSS') else False
+            })
+        
+        if not params:
+            return []
+        
+        cursor.executemany('''
+            UPDATE signals SET
+                status = ?, exit_time = ?, exit_date = date(?), exit_price = ?,
+                pnl_percentage = ?, r_multiple = ?
+            WHERE id = ?
+        ''', params)
+        
+        exit_dates = dict(self._signal_rows(cursor, 'id, exit_date', [r['id'] for r in results]))
+        
+        # Günlük performansı güncelle: yeni kapanışlar gün bazında artımlı,
+        # zaten kapanmış sinyallerin etkilediği günler baştan hesaplanır
+        new_closes, rebuild_days = {}, set()
+        for result in results:
+            exit_date = exit_dates[result['id']]
+            if result['reclosed_from'] is not False:
+                rebuild_days |= {result['reclosed_from'], exit_date}
             else:
-                market_sentiment = 'NEGATIVE'
-            
-            # Güncelle veya ekle
-            cursor.execute('''
-                INSERT OR REPLACE INTO daily_performance (
-                    date, total_signals, winning_signals, losing_signals,
-                    win_rate, total_r, best_trade_r, worst_trade_r,
-                    daily_bias, market_sentiment
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (target_date, total_signals, winning_signals, losing_signals,
-                  win_rate, total_r, best_trade_r, worst_trade_r,
-                  daily_bias, market_sentiment))
-            
-            conn.commit()
-            conn.close()
-            
-            logger.info(f"✅ Günlük performans güncellendi: {target_date}")
-            logger.info(f"   📊 Sinyaller: {total_signals}, Win Rate: {win_rate:.1f}%, Total R: {total_r:.2f}")
+                new_closes.setdefault(exit_date, []).append((result['pnl_percentage'], result['r_multiple']))
+        
+        for exit_date, outcomes in new_closes.items():
+            if exit_date not in rebuild_days:
+                self._kaydet_kapanis(cursor, exit_date, outcomes)
+        
+        rebuild_days.discard(None)
+        if rebuild_days:
+            for day in rebuild_days:
+                self._guncelle_gunluk_performans(cursor, day)
+            cursor.execute('DELETE FROM rolling_performance')
+        
+        for result in results:
+            del result['reclosed_from']
+        return results
+    
+    def guncelle_gunluk_performans(self, target_date: Optional[str] = None):
+        """
+        Günlük performansı kapanan sinyallerden baştan hesapla
+
+        Normal akışta gerekmez (kapanışlar _kaydet_kapanis ile artımlı işlenir);
+        eski verileri onarmak veya elle düzeltilen sinyaller için kullanılır.
+        """
+        try:
+            with self.db.transaction() as conn:
+                cursor = conn.cursor()
+                self._guncelle_gunluk_performans(cursor, target_date)
+                # Kayan pencereler bir sonraki okumada yeniden kurulur
+                cursor.execute('DELETE FROM rolling_performance')
             
         except Exception as e:
             logger.error(f"❌ Günlük performans güncelleme hatası: {str(e)}")
     
+    def _guncelle_gunluk_performans(self, cursor, target_date: Optional[str] = None):
+        """Günlük performansın tam hesaplaması (çağıranın transaction'ı içinde)"""
+        if not target_date:
+            target_date = datetime.now().strftime('%Y-%m-%d')
+        
+        # O gün kapanan sinyalleri al (exit_date indeksi üzerinden)
+        cursor.execute('''
+            SELECT pnl_percentage, r_multiple FROM signals
+            WHERE exit_date = ? AND status IN ('WIN', 'LOSS')
+        ''', (target_date,))
+        
+        signals = cursor.fetchall()
+        
+        # O gün kapanıp arşive taşınmış sinyaller (signal_archive)
+        archived = cursor.execute('''
+            SELECT total_signals, winning_signals, total_r, best_trade_r, worst_trade_r
+            FROM archived_daily_performance WHERE exit_date = ?
+        ''', (target_date,)).fetchone()
+        
+        if not signals and not archived:
+            cursor.execute('DELETE FROM daily_performance WHERE date = ?', (target_date,))
+            logger.info(f"📊 {target_date} için kapanan sinyal bulunamadı")
+            return
+        
+        # İstatistikleri hesapla
+        total_signals = len(signals)
+        winning_signals = len([s for s in signals if s[0] > 0])  # pnl_percentage > 0
+        
+        # R multiple'ları al
+        r_multiples = [s[1] for s in signals if s[1] is not None]  # r_multiple
+        total_r = sum(r_multiples) if r_multiples else 0
+        
+        if archived:
+            total_signals += archived[0]
+            winning_signals += archived[1]
+            total_r += archived[2]
+            r_multiples += [r for r in archived[3:] if r is not None]
+        
+        losing_signals = total_signals - winning_signals
+        win_rate = (winning_signals / total_signals) * 100 if total_signals > 0 else 0
+        best_trade_r = max(r_multiples) if r_multiples else 0
+        worst_trade_r = min(r_multiples) if r_multiples else 0
+        
+        # Güncelle veya ekle
+        cursor.execute('''
+            INSERT OR REPLACE INTO daily_performance (
+                date, total_signals, winning_signals, losing_signals,
+                win_rate, total_r, best_trade_r, worst_trade_r,
+                daily_bias, market_sentiment
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (target_date, total_signals, winning_signals, losing_signals,
+              win_rate, total_r, best_trade_r, worst_trade_r,
+              self._gunluk_bias_yonu(cursor, target_date), self._market_sentiment(win_rate)))
+        
+        logger.info(f"✅ Günlük performans güncellendi: {target_date}")
+        logger.info(f"   📊 Sinyaller: {total_signals}, Win Rate: {win_rate:.1f}%, Total R: {total_r:.2f}")
+    
+    def _kaydet_kapanis(self, cursor, exit_date: str, outcomes: List[tuple]):
+        """
+        Apply closed signals of one exit day to the aggregates
+        
+        A constant number of statements per day regardless of how many signals
+        closed: the day's daily_performance row is upserted and every rolling
+        window that is current (end_date = today) and covers exit_date is bumped.
+        
+        Args:
+            outcomes (list): (pnl_percentage, r_multiple) per closed signal
+        """
+        count = len(outcomes)
+        wins = len([o for o in outcomes if o[0] > 0])
+        r_multiples = [o[1] for o in outcomes]
+        total_r, best_r, worst_r = sum(r_multiples), max(r_multiples), min(r_multiples)
+        
+        new_day = cursor.execute(
+            'SELECT 1 FROM daily_performance WHERE date = ?', (exit_date,)
+        ).fetchone() is None
+        
+        cursor.execute('''
+            INSERT INTO daily_performance (
+                date, total_signals, winning_signals, losing_signals,
+                total_r, best_trade_r, worst_trade_r
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(date) DO UPDATE SET
+                total_signals = total_signals + excluded.total_signals,
+                winning_signals = winning_signals + excluded.winning_signals,
+                losing_signals = losing_signals + excluded.losing_signals,
+                total_r = total_r + excluded.total_r,
+                best_trade_r = MAX(best_trade_r, excluded.best_trade_r),
+                worst_trade_r = MIN(worst_trade_r, excluded.worst_trade_r)
+        ''', (exit_date, count, wins, count - wins, total_r, best_r, worst_r))
+        
+        total_signals, winning_signals = cursor.execute(
+            'SELECT total_signals, winning_signals FROM daily_performance WHERE date = ?', (exit_date,)
+        ).fetchone()
+        win_rate = winning_signals / total_signals * 100
+        
+        cursor.execute('''
+            UPDATE daily_performance SET win_rate = ?, daily_bias = ?, market_sentiment = ?
+            WHERE date = ?
+        ''', (win_rate, self._gunluk_bias_yonu(cursor, exit_date), self._market_sentiment(win_rate), exit_date))
+        
+        cursor.execute('''
+            UPDATE rolling_performance SET
+                total_signals = total_signals + ?,
+                winning_signals = winning_signals + ?,
+                total_r = total_r + ?,
+                best_trade_r = MAX(COALESCE(best_trade_r, ?), ?),
+                worst_trade_r = MIN(COALESCE(worst_trade_r, ?), ?),
+                days_analyzed = days_analyzed + ?
+            WHERE end_date = ? AND start_date <= ? AND end_date >= ?
+        ''', (count, wins, total_r, best_r, best_r, worst_r, worst_r, int(new_day),
+              datetime.now().strftime('%Y-%m-%d'), exit_date, exit_date))
+    
+    def _gunluk_bias_yonu(self, cursor, target_date: str):
+        """Günlük bias (o gün açılan aktif sinyallerin çoğunluğu)"""
+        cursor.execute('''
+            SELECT direction FROM signals 
+            WHERE signal_date = ? AND status = 'ACTIVE'
+        ''', (target_date,))
+        
+        active_directions = [row[0] for row in cursor.fetchall()]
+        
+        long_count = len([d for d in active_directions if d.upper() in ['LONG', 'BUY', 'ALIM']])
+        short_count = len([d for d in active_directions if d.upper() in ['SHORT', 'SELL', 'SATIM']])
+        
+        if long_count > short_count:
+            return 'BULLISH'
+        elif short_count > long_count:
+            return 'BEARISH'
+        return 'NEUTRAL'
+    
+    @staticmethod
+    def _market_sentiment(win_rate: float):
+        """Market sentiment (win rate'e göre)"""
+        if win_rate >= 70:
+            return 'STRONG'
+        elif win_rate >= 50:
+            return 'POSITIVE'
+        elif win_rate >= 30:
+            return 'NEUTRAL'
+        return 'NEGATIVE'
+    
     def hesapla_gunluk_bias(self, market_data: Dict = None):
         """Günlük bias önerisi hesapla"""
         try:
@@ -367,20 +689,20 @@ class SinyalTakipSistemi:
             else:
                 expected_volatility = "Normal - Standart pozisyon büyüklüğü"
             
-            # Veritabanına kaydet
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            computed_at = datetime.now().isoformat()
             
-            cursor.execute('''
-                INSERT OR REPLACE INTO daily_bias (
-                    date, recommended_bias, confidence, reasoning,
-                    market_conditions, active_pairs, expected_volatility
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (today, recommended_bias, confidence_score, reasoning,
-                  market_conditions, active_pairs, expected_volatility))
+            # Veritabanına kaydet
+            with self.db.transaction() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute('''
+                    INSERT OR REPLACE INTO daily_bias (
+                        date, recommended_bias, confidence, reasoning,
+                        market_conditions, active_pairs, expected_volatility, computed_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (today, recommended_bias, confidence_score, reasoning,
+                      market_conditions, active_pairs, expected_volatility, computed_at))
             
-            conn.commit()
-            conn.close()
             
             logger.info(f"✅ Günlük bias hesaplandı: {recommended_bias} (%{confidence_score:.0f} güven)")
             
@@ -391,13 +713,74 @@ class SinyalTakipSistemi:
                 'reasoning': reasoning,
                 'market_conditions': market_conditions,
                 'active_pairs': active_pairs,
-                'expected_volatility': expected_volatility
+                'expected_volatility': expected_volatility,
+                'computed_at': computed_at
             }
             
         except Exception as e:
             logger.error(f"❌ Günlük bias hesaplama hatası: {str(e)}")
             return None
     
+    def get_gunluk_bias(self, max_age: float = BIAS_MAX_AGE_SECONDS, refresh: bool = True):
+        """
+        Bugünün kayıtlı bias önerisini oku (ağ çağrısı yapmaz)
+        
+        Kayıt yoksa veya max_age saniyeden eskiyse, refresh=True iken yeniden
+        hesaplama arka planda başlatılır; bu çağrı beklemez ve eldeki kaydı döner.
+        
+        Returns:
+            dict: hesapla_gunluk_bias() ile aynı alanlar + 'stale', veya kayıt yoksa None
+        """
+        try:
+            today = datetime.now().strftime('%Y-%m-%d')
+            with self.db.connection() as conn:
+                row = conn.execute('''
+                    SELECT date, recommended_bias, confidence, reasoning, market_conditions,
+                           active_pairs, expected_volatility, computed_at
+                    FROM daily_bias WHERE date = ?
+                ''', (today,)).fetchone()
+            
+        except Exception as e:
+            logger.error(f"❌ Günlük bias okuma hatası: {str(e)}")
+            return None
+        
+        bias_data = None
+        stale = True
+        if row:
+            bias_data = dict(zip(('date', 'recommended_bias', 'confidence', 'reasoning', 'market_conditions',
+                                  'active_pairs', 'expected_volatility', 'computed_at'), row))
+            if bias_data['computed_at']:
+                age = (datetime.now() - datetime.fromisoformat(bias_data['computed_at'])).total_seconds()
+                stale = age > max_age
+            bias_data['stale'] = stale
+        
+        if stale and refresh:
+            self.yenile_gunluk_bias_arka_planda(max_age)
+        
+        return bias_data
+    
+    def yenile_gunluk_bias_arka_planda(self, max_age: float = BIAS_MAX_AGE_SECONDS):
+        """
+        Günlük bias'ı arka plan thread'inde yeniden hesapla (veritabanı başına aynı anda tek hesaplama)
+        
+        Returns:
+            bool: Yeni bir hesaplama başlatıldıysa True
+        """
+        if not self._bias_refresh_lock.acquire(blocking=False):
+            return False
+        
+        def run():
+            try:
+                # Başka bir oturum bu arada hesaplamış olabilir
+                current = self.get_gunluk_bias(max_age, refresh=False)
+                if current is None or current['stale']:
+                    self.hesapla_gunluk_bias()
+            finally:
+                self._bias_refresh_lock.release()
+        
+        threading.Thread(target=run, name="daily-bias-refresh", daemon=True).start()
+        return True
+    
     def analyze_market_conditions(self):
         """Market koşullarını analiz et"""
         try:
@@ -415,12 +798,19 @@ class SinyalTakipSistemi:
             bearish_count = 0
             volatilities = []
             
-            for symbol in major_symbols:
+            def fetch(symbol):
                 try:
-                    ticker = yf.Ticker(symbol)
-                    data = ticker.history(period='5d', interval='1h')
-                    
-                    if len(data) < 20:
+                    return yf.Ticker(symbol).history(period='5d', interval='1h')
+                except Exception:
+                    return None
+            
+            # Semboller paralel çekilir (sıralı indirme yerine)
+            with ThreadPoolExecutor(max_workers=len(major_symbols)) as executor:
+                histories = list(executor.map(fetch, major_symbols))
+            
+            for symbol, data in zip(major_symbols, histories):
+                try:
+                    if data is None or len(data) < 20:
                         continue
                     
                     # Trend analizi
@@ -462,74 +852,138 @@ class SinyalTakipSistemi:
             return {'overall_trend': 'neutral', 'volatility': 'normal', 'strong_symbols': []}
     
     def get_recent_performance(self, days: int = 7):
-        """Son günlerin performansını al"""
+        """Son günlerin performansını al (ROLLING_WINDOWS önceden hesaplanmış satırdan okunur)"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=days)
-            
-            cursor.execute('''
-                SELECT * FROM daily_performance 
-                WHERE date >= ? AND date <= ?
-                ORDER BY date DESC
-            ''', (start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')))
+            end_date = datetime.now().strftime('%Y-%m-%d')
+            start_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+            
+            if days in ROLLING_WINDOWS:
+                with self.db.connection() as conn:
+                    row = conn.execute('''
+                        SELECT total_signals, winning_signals, total_r, days_analyzed
+                        FROM rolling_performance WHERE window_days = ? AND end_date = ?
+                    ''', (days, end_date)).fetchone()
+                
+                if row is None:
+                    # Yeni gün (veya onarım sonrası): pencere günlük satırlardan bir kez kurulur
+                    with self.db.transaction() as conn:
+                        row = self._kur_kayan_pencere(conn.cursor(), days, start_date, end_date)
+            else:
+                with self.db.connection() as conn:
+                    row = self._topla_gunluk(conn.cursor(), start_date, end_date)[:4]
             
-            performances = cursor.fetchall()
-            conn.close()
+            total_signals, winning_signals, total_r, days_analyzed = row
             
-            if not performances:
+            if not days_analyzed:
                 return {'win_rate': 0, 'total_r': 0, 'total_signals': 0}
             
-            # Toplam istatistikler
-            total_signals = sum([p[1] for p in performances])  # total_signals
-            winning_signals = sum([p[2] for p in performances])  # winning_signals
-            total_r = sum([p[5] for p in performances])  # total_r
-            
             win_rate = (winning_signals / total_signals * 100) if total_signals > 0 else 0
             
             return {
                 'win_rate': win_rate,
                 'total_r': total_r,
                 'total_signals': total_signals,
-                'days_analyzed': len(performances)
+                'days_analyzed': days_analyzed
             }
             
         except Exception as e:
             logger.error(f"❌ Son performans alma hatası: {str(e)}")
             return {'win_rate': 0, 'total_r': 0, 'total_signals': 0}
     
+    def _topla_gunluk(self, cursor, start_date: str, end_date: str):
+        """
+        Sum daily_performance rows in [start_date, end_date] (primary key range scan)
+
+        Returns:
+            tuple: (total_signals, winning_signals, total_r, days_analyzed, best_trade_r, worst_trade_r)
+        """
+        return cursor.execute('''
+            SELECT COALESCE(SUM(total_signals), 0), COALESCE(SUM(winning_signals), 0),
+                   COALESCE(SUM(total_r), 0), COUNT(*), MAX(best_trade_r), MIN(worst_trade_r)
+            FROM daily_performance
+            WHERE date >= ? AND date <= ?
+        ''', (start_date, end_date)).fetchone()
+    
+    def _kur_kayan_pencere(self, cursor, days: int, start_date: str, end_date: str):
+        """Rebuild one rolling window row; later closes update it incrementally"""
+        row = self._topla_gunluk(cursor, start_date, end_date)
+        cursor.execute('''
+            INSERT OR REPLACE INTO rolling_performance (
+                window_days, start_date, end_date, total_signals, winning_signals,
+                total_r, days_analyzed, best_trade_r, worst_trade_r
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (days, start_date, end_date) + tuple(row))
+        return row[:4]
+    
+    def get_gunluk_performans(self, days: int = 30):
+        """
+        Son günlerin günlük performans satırları (eskiden yeniye)
+
+        Returns:
+            list: (date, win_rate, total_r, total_signals) tuples
+        """
+        try:
+            start_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+            with self.db.connection() as conn:
+                return conn.execute('''
+                    SELECT date, win_rate, total_r, total_signals
+                    FROM daily_performance
+                    WHERE date >= ?
+                    ORDER BY date
+                ''', (start_date,)).fetchall()
+            
+        except Exception as e:
+            logger.error(f"❌ Günlük performans okuma hatası: {str(e)}")
+            return []
+    
+    def get_aktif_sinyaller(self):
+        """
+        Aktif sinyaller (sonuç çözümleyici için, status indeksi üzerinden)
+        
+        Returns:
+            list: (id, timestamp, symbol, direction, entry_price, stop_loss,
+                   take_profit1, take_profit2) tuples, oldest first
+        """
+        try:
+            with self.db.connection() as conn:
+                return conn.execute('''
+                    SELECT id, timestamp, symbol, direction, entry_price, stop_loss,
+                           take_profit1, take_profit2
+                    FROM signals WHERE status = 'ACTIVE' ORDER BY timestamp
+                ''').fetchall()
+            
+        except Exception as e:
+            logger.error(f"❌ Aktif sinyal okuma hatası: {str(e)}")
+            return []
+    
     def get_gunluk_rapor(self, target_date: Optional[str] = None):
         """Günlük rapor oluştur"""
         try:
             if not target_date:
                 target_date = datetime.now().strftime('%Y-%m-%d')
             
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Günlük performans
-            cursor.execute('SELECT * FROM daily_performance WHERE date = ?', (target_date,))
-            performance = cursor.fetchone()
-            
-            # Günlük bias
-            cursor.execute('SELECT * FROM daily_bias WHERE date = ?', (target_date,))
-            bias_data = cursor.fetchone()
-            
-            # Aktif sinyaller
-            cursor.execute('SELECT * FROM signals WHERE status = "ACTIVE" ORDER BY timestamp DESC')
-            active_signals = cursor.fetchall()
-            
-            # Kapanan sinyaller
-            cursor.execute('''
-                SELECT * FROM signals 
-                WHERE date(exit_time) = ? AND status IN ("WIN", "LOSS")
-                ORDER BY exit_time DESC
-            ''', (target_date,))
-            closed_signals = cursor.fetchall()
-            
-            conn.close()
+            with self.db.connection() as conn:
+                cursor = conn.cursor()
+                
+                # Günlük performans
+                cursor.execute('SELECT * FROM daily_performance WHERE date = ?', (target_date,))
+                performance = cursor.fetchone()
+                
+                # Günlük bias
+                cursor.execute('SELECT * FROM daily_bias WHERE date = ?', (target_date,))
+                bias_data = cursor.fetchone()
+                
+                # Aktif sinyaller
+                cursor.execute(f"SELECT {SIGNAL_COLUMNS} FROM signals WHERE status = 'ACTIVE' ORDER BY timestamp DESC")
+                active_signals = cursor.fetchall()
+                
+                # Kapanan sinyaller
+                cursor.execute(f'''
+                    SELECT {SIGNAL_COLUMNS} FROM signals
+                    WHERE exit_date = ? AND status IN ('WIN', 'LOSS')
+                    ORDER BY exit_time DESC
+                ''', (target_date,))
+                closed_signals = cursor.fetchall()
             
             return {
                 'date': target_date,
@@ -545,15 +999,22 @@ class SinyalTakipSistemi:
     
     def display_streamlit_dashboard(self):
         """Streamlit dashboard gösterimi"""
+        # UI-only dependency: the tracking core stays importable without Streamlit
+        import streamlit as st
+        
         try:
             st.header("📊 FinansLab Sinyal Takip Sistemi")
             
-            # Günlük bias önerisi
-            today = datetime.now().strftime('%Y-%m-%d')
-            bias_data = self.hesapla_gunluk_bias()
+            # Günlük bias önerisi (kayıtlı öneri okunur; eskiyse arka planda yenilenir)
+            bias_data = self.get_gunluk_bias()
             
-            if bias_data:
+            if not bias_data:
                 st.subheader("🎯 Günlük Bias Önerisi")
+                st.info("🔄 Günlük bias hesaplanıyor, birkaç saniye sonra sayfayı yenileyin")
+            else:
+                st.subheader("🎯 Günlük Bias Önerisi")
+                st.caption(f"Son güncelleme: {(bias_data['computed_at'] or '')[:16].replace('T', ' ')}"
+                           + (" - yenileniyor" if bias_data['stale'] else ""))
                 
                 col1, col2, col3 = st.columns(3)
                 
@@ -599,6 +1060,14 @@ class SinyalTakipSistemi:
             if rapor and rapor['active_signals']:
                 st.subheader("⚡ Aktif Sinyaller")
                 
+                if st.button("🔄 Sonuçları Fiyat Verisinden Belirle"):
+                    from signal_resolver import SignalOutcomeResolver
+                    with st.spinner("Aktif sinyaller kontrol ediliyor..."):
+                        result = SignalOutcomeResolver(self).resolve()
+                    st.success(f"✅ {result['resolved']}/{result['active']} sinyal kapandı "
+                               f"(SL: {result['stop_loss']}, TP1: {result['take_profit1']}, TP2: {result['take_profit2']})")
+                    rapor = self.get_gunluk_rapor() or {'active_signals': []}
+                
                 for signal in rapor['active_signals'][:5]:  # Son 5 aktif sinyal
                     (id, timestamp, symbol, direction, entry_price, stop_loss,
                      take_profit1, take_profit2, bias_strength, confluence_score,
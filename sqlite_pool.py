@@ -0,0 +1,123 @@
+"""
+FinansLab SQLite Bağlantı Havuzu
+================================
+
+Thread'ler arası paylaşılan, WAL modunda çalışan SQLite bağlantı havuzu:
+- WAL: okuyucular yazıcıyı, yazıcı okuyucuları bloklamaz
+- Ayarlı pragmalar (synchronous=NORMAL, busy_timeout, bellek içi temp, büyük cache)
+- Bağlantı başına hazırlanmış ifade (prepared statement) önbelleği
+- transaction(): birden çok ifadeyi tek BEGIN IMMEDIATE ... COMMIT içinde toplar
+"""
+
+import logging
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+PRAGMAS = (
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -16000",
+    "PRAGMA foreign_keys = ON",
+)
+
+
+class SQLiteConnectionPool:
+    """
+    Fixed-size pool of autocommit connections to one database file
+
+    Reads run in autocommit mode (each SELECT sees the latest committed data);
+    writes should use transaction() so related statements commit together.
+    """
+
+    def __init__(self, db_path, pool_size=4, busy_timeout_ms=5000, cached_statements=256):
+        self.db_path = db_path
+        # Every ':memory:' connection is its own database - share a single one
+        self.pool_size = 1 if db_path == ":memory:" else pool_size
+        self.busy_timeout_ms = busy_timeout_ms
+        self.cached_statements = cached_statements
+
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _connect(self):
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.busy_timeout_ms / 1000,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=self.cached_statements
+        )
+        conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}")
+        if self.db_path != ":memory:":
+            conn.execute("PRAGMA journal_mode = WAL")
+        for pragma in PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def _acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if self._closed:
+                raise sqlite3.ProgrammingError("Bağlantı havuzu kapatıldı")
+            if self._created < self.pool_size:
+                self._created += 1
+                try:
+                    return self._connect()
+                except Exception:
+                    self._created -= 1
+                    raise
+
+        return self._idle.get()
+
+    def _release(self, conn):
+        if self._closed:
+            conn.close()
+            return
+        self._idle.put(conn)
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection (autocommit - use for reads)"""
+        conn = self._acquire()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._release(conn)
+
+    @contextmanager
+    def transaction(self):
+        """
+        Borrow a connection inside BEGIN IMMEDIATE ... COMMIT
+
+        The write lock is taken up front, so concurrent writers queue on
+        busy_timeout instead of failing mid-transaction with SQLITE_BUSY.
+        """
+        with self.connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            conn.commit()
+
+    def close(self):
+        """Close idle connections; borrowed ones close when returned"""
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
@@ -0,0 +1,120 @@
+"""
+FinansLab Swing Noktaları
+=========================
+
+Swing high / swing low tespiti için ortak, vektörel uygulama:
+- Bir bar, her iki yanındaki `lookback` barın hepsinden kesin olarak yüksekse swing high,
+  hepsinden kesin olarak düşükse swing low sayılır (son `lookback` bar henüz onaylanmamıştır)
+- Pencere maksimum/minimumları NumPy sliding_window_view ile tek geçişte hesaplanır
+- Sonuç: pozisyonel indeks dizileri; veri seti + lookback başına önbelleklenir
+
+Order block, destek/direnç, likidite bölgeleri ve stop yerleşimi bu modülü kullanır.
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def _side_extremes(values, lookback, reducer):
+    """reducer over the `lookback` bars before and after every confirmable bar"""
+    windows = reducer(sliding_window_view(values, lookback), axis=1)  # windows[k] = values[k:k + lookback]
+    n_candidates = len(values) - 2 * lookback
+    before = windows[:n_candidates]
+    after = windows[lookback + 1:lookback + 1 + n_candidates]
+    return before, after
+
+
+def swing_high_indices(high, lookback):
+    """Positions whose high is strictly above the `lookback` highs on each side"""
+    high = np.asarray(high, dtype=float)
+    if lookback < 1 or len(high) < 2 * lookback + 1:
+        return np.empty(0, dtype=np.int64)
+    before, after = _side_extremes(high, lookback, np.max)
+    center = high[lookback:len(high) - lookback]
+    return np.flatnonzero((center > before) & (center > after)) + lookback
+
+
+def swing_low_indices(low, lookback):
+    """Positions whose low is strictly below the `lookback` lows on each side"""
+    low = np.asarray(low, dtype=float)
+    if lookback < 1 or len(low) < 2 * lookback + 1:
+        return np.empty(0, dtype=np.int64)
+    before, after = _side_extremes(low, lookback, np.min)
+    center = low[lookback:len(low) - lookback]
+    return np.flatnonzero((center < before) & (center < after)) + lookback
+
+
+class SwingPointStore:
+    """
+    Thread-safe cache of swing point indices per dataset and lookback
+
+    Datasets are identified by an explicit key or their first bar; a cached
+    result is reused only while the High/Low arrays are unchanged.
+    """
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # (key, lookback) -> (high, low, (high_idx, low_idx))
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0}
+
+    def get(self, data, lookback, key=None):
+        """
+        Swing high and swing low positions for data
+
+        Args:
+            data (pd.DataFrame): OHLC data
+            lookback (int): Bars required on each side
+            key: Dataset identity; defaults to the first bar
+
+        Returns:
+            tuple: (swing_high_idx, swing_low_idx) int64 position arrays, ascending
+        """
+        if data is None or data.empty:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+
+        entry_key = (key if key is not None else (data.index[0], float(data['Close'].iloc[0])), lookback)
+        high = data['High'].to_numpy(dtype=float)
+        low = data['Low'].to_numpy(dtype=float)
+
+        with self._lock:
+            cached = self._entries.get(entry_key)
+        if cached is not None and np.array_equal(cached[0], high, equal_nan=True) and \
+                np.array_equal(cached[1], low, equal_nan=True):
+            result, stat = cached[2], 'hits'
+        else:
+            result, stat = (swing_high_indices(high, lookback), swing_low_indices(low, lookback)), 'misses'
+
+        with self._lock:
+            self.stats[stat] += 1
+            self._entries[entry_key] = (high, low, result)
+            self._entries.move_to_end(entry_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_swing_store = None
+_swing_store_lock = threading.Lock()
+
+
+def get_swing_points():
+    """Process-wide swing point store"""
+    global _swing_store
+    with _swing_store_lock:
+        if _swing_store is None:
+            _swing_store = SwingPointStore()
+        return _swing_store
+
+
+def find_swing_points(data, lookback=5, key=None):
+    """(swing_high_idx, swing_low_idx) for data from the shared store"""
+    return get_swing_points().get(data, lookback, key)
@@ -14,6 +14,8 @@ import time
 import threading
 import json
 import os
+from scan_change_detector import ScanChangeDetector
+from signal_ranker import TopKSignalRanker
 
 class TamOtomatikSistem:
     def __init__(self):
@@ -48,6 +50,12 @@ class TamOtomatikSistem:
         self.current_mode = 'normal'
         self.running = True
         
+        # Kapanmış bar değişmeyen semboller için analiz yeniden kullanımı
+        self.change_detector = ScanChangeDetector(interval_minutes=60)
+        
+        # Tarama boyunca güncellenen en iyi k kurulum
+        self.signal_ranker = TopKSignalRanker(k=10)
+        
     def get_current_session(self):
         """Şu anki trading sessionu belirle"""
         hour = datetime.utcnow().hour
@@ -84,62 +92,134 @@ class TamOtomatikSistem:
             if len(data) < 100:
                 return None
             
-            close = data['Close']
-            high = data['High']
-            low = data['Low']
-            volume = data['Volume']
-            
-            current_price = close.iloc[-1]
-            
-            # EMA analizi
-            emas = {}
-            for period in self.ema_periods:
-                emas[period] = close.ewm(span=period).mean()
-            
-            # Bias hesaplama
-            above_emas = sum(1 for period in self.ema_periods 
-                           if current_price > emas[period].iloc[-1])
-            bias_strength = (above_emas / len(self.ema_periods)) * 100
-            
-            # Momentum analizi
-            momentum = self.calculate_momentum(close, emas)
-            
-            # Volatilite analizi
-            volatility = self.calculate_volatility(close)
+            # Kapanmış bar değişmediyse önceki durumu yeniden kullan
+            fingerprints = self.change_detector.fingerprint(data)
+            state, cached_result = self.change_detector.lookup(symbol, fingerprints)
             
-            # FVG tespiti
-            fvgs = self.detect_advanced_fvgs(data)
+            if cached_result is not None:
+                return cached_result
             
-            # Volume profil
-            volume_profile = self.analyze_volume(volume, close)
+            if state is None:
+                state = self._build_closed_state(fingerprints['closed'])
             
-            # Confluence score
-            confluence = self.calculate_confluence(
-                bias_strength, momentum, volatility, len(fvgs), volume_profile
-            )
-            
-            # Signal generation
-            signal = self.generate_signal(
-                bias_strength, momentum, confluence, symbol
-            )
-            
-            return {
-                'symbol': symbol,
-                'timestamp': datetime.now(),
-                'price': round(current_price, 6),
-                'bias_strength': round(bias_strength, 1),
-                'momentum': round(momentum, 2),
-                'volatility': round(volatility, 2),
-                'fvg_count': len(fvgs),
-                'volume_profile': volume_profile,
-                'confluence': confluence,
-                'signal': signal,
-                'emas': {k: round(v.iloc[-1], 6) for k, v in emas.items()}
-            }
+            result = self._finalize_analysis(symbol, state, fingerprints['forming'])
+            self.change_detector.store(symbol, fingerprints, state, result)
+            return result
             
         except Exception as e:
             return None
     
+    def _build_closed_state(self, closed):
+        """Kapanmış barlara bağlı ağır hesaplamalar (bar kapanışında bir kez)"""
+        close = closed['Close']
+        volume = closed['Volume']
+        
+        # EMA durumu: pandas ewm(adjust=True) = num / den
+        ema_state = {}
+        for period in self.ema_periods:
+            ema = close.ewm(span=period).mean()
+            decay = 1 - 2 / (period + 1)
+            den = (1 - decay ** len(close)) / (1 - decay)
+            ema_state[period] = {
+                'tail': ema.iloc[-5:],
+                'num': ema.iloc[-1] * den,
+                'den': den,
+                'decay': decay
+            }
+        
+        # Getiri toplamları (volatilite için)
+        returns = close.pct_change().dropna()
+        
+        return {
+            'ema': ema_state,
+            'returns_count': len(returns),
+            'returns_sum': float(returns.sum()),
+            'returns_sumsq': float((returns ** 2).sum()),
+            'volume_sum': float(volume.sum()),
+            'volume_count': len(volume),
+            # FVG ve volume pencereleri için son 32 bar yeterli
+            'tail': closed.iloc[-32:]
+        }
+    
+    def _finalize_analysis(self, symbol, state, forming):
+        """Oluşan bar ile kısmi hesaplama ve sonuç üretimi"""
+        window = pd.concat([state['tail'], forming]) if not forming.empty else state['tail']
+        close = window['Close']
+        current_price = close.iloc[-1]
+        
+        # EMA'ları oluşan bar için tek adım ilerlet
+        emas = {}
+        for period, ema in state['ema'].items():
+            tail = ema['tail']
+            if not forming.empty:
+                num = forming['Close'].iloc[-1] + ema['decay'] * ema['num']
+                den = 1 + ema['decay'] * ema['den']
+                tail = pd.concat([tail, pd.Series([num / den], index=forming.index)])
+            emas[period] = tail
+        
+        # Bias hesaplama
+        above_emas = sum(1 for period in self.ema_periods 
+                       if current_price > emas[period].iloc[-1])
+        bias_strength = (above_emas / len(self.ema_periods)) * 100
+        
+        # Momentum analizi
+        momentum = self.calculate_momentum(close, emas)
+        
+        # Volatilite analizi (kapanmış getiri toplamları + oluşan bar getirisi)
+        volatility = self._volatility_from_state(state, forming)
+        
+        # FVG tespiti
+        fvgs = self.detect_advanced_fvgs(window)
+        
+        # Volume profil
+        volume_count = state['volume_count'] + len(forming)
+        volume_sum = state['volume_sum'] + float(forming['Volume'].sum())
+        avg_volume = volume_sum / volume_count if volume_count else 0
+        volume_profile = self.analyze_volume(window['Volume'], close, avg_volume=avg_volume)
+        
+        # Confluence score
+        confluence = self.calculate_confluence(
+            bias_strength, momentum, volatility, len(fvgs), volume_profile
+        )
+        
+        # Signal generation
+        signal = self.generate_signal(
+            bias_strength, momentum, confluence, symbol
+        )
+        
+        return {
+            'symbol': symbol,
+            'timestamp': datetime.now(),
+            'price': round(current_price, 6),
+            'bias_strength': round(bias_strength, 1),
+            'momentum': round(momentum, 2),
+            'volatility': round(volatility, 2),
+            'fvg_count': len(fvgs),
+            'volume_profile': volume_profile,
+            'confluence': confluence,
+            'signal': signal,
+            'emas': {k: round(v.iloc[-1], 6) for k, v in emas.items()}
+        }
+    
+    def _volatility_from_state(self, state, forming):
+        """Kapanmış getiri toplamlarından volatilite (std * 100)"""
+        count = state['returns_count']
+        total = state['returns_sum']
+        total_sq = state['returns_sumsq']
+        
+        if not forming.empty:
+            last_close = state['tail']['Close'].iloc[-1]
+            forming_return = forming['Close'].iloc[-1] / last_close - 1
+            count += 1
+            total += forming_return
+            total_sq += forming_return ** 2
+        
+        if count < 2:
+            return 0
+        
+        variance = max((total_sq - total ** 2 / count) / (count - 1), 0)
+        return np.sqrt(variance) * 100
+    
     def calculate_momentum(self, close, emas):
         """Momentum hesaplama"""
         # EMA eğimleri
@@ -201,11 +281,12 @@ class TamOtomatikSistem:
         fvgs.sort(key=lambda x: x['strength'], reverse=True)
         return fvgs[:3]
     
-    def analyze_volume(self, volume, close):
+    def analyze_volume(self, volume, close, avg_volume=None):
         """Volume profil analizi"""
         try:
             recent_volume = volume.iloc[-20:].mean()
-            avg_volume = volume.mean()
+            if avg_volume is None:
+                avg_volume = volume.mean()
             volume_ratio = recent_volume / avg_volume if avg_volume > 0 else 1
             
             # Price-volume divergence
@@ -329,6 +410,9 @@ class TamOtomatikSistem:
         excellent_signals = []
         good_signals = []
         
+        # Her tarama döngüsü sıralamaya sıfırdan başlar
+        self.signal_ranker.reset()
+        
         # Her kategoriden sembol tara
         for category, symbols in self.symbols.items():
             print(f"\n📈 {category.upper()} PIYASASI:")
@@ -338,6 +422,7 @@ class TamOtomatikSistem:
                 result = self.analyze_symbol(symbol)
                 if result:
                     all_results.append(result)
+                    self.signal_ranker.offer(result)
                     signal = result['signal']
                     
                     # Emoji mapping
@@ -372,7 +457,9 @@ class TamOtomatikSistem:
                     elif signal['quality'] == 'GOOD':
                         good_signals.append(result)
         
-        # Signal summary
+        # Signal summary: every excellent/good result, best first (same order as the top-k ranking)
+        excellent_signals.sort(key=self.signal_ranker.key, reverse=True)
+        good_signals.sort(key=self.signal_ranker.key, reverse=True)
         self.print_signal_summary(excellent_signals, good_signals, session, volatility)
         
         # Save to history
@@ -0,0 +1,352 @@
+"""
+FinansLab Telegram Gönderim Kuyruğu
+===================================
+
+Telegram mesajlarını tarama döngüsünden ayırır:
+1. Mesajlar SQLite tabanlı bir outbox'a yazılır (yeniden başlatmada kaybolmaz)
+2. Arka plan thread'i token-bucket limitine göre gönderir
+3. Hata/429 durumunda backoff ile tekrar dener - tarama hiç beklemez
+4. Outbox dosyası başına süreç genelinde tek kuyruk (tek gönderici, tek limit): get_telegram_queue()
+"""
+
+import inspect
+import json
+import logging
+import sqlite3
+import threading
+import time
+import weakref
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Token bucket rate limiter (non-blocking)"""
+
+    def __init__(self, rate_per_minute, capacity=None):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity or rate_per_minute
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def try_acquire(self):
+        """
+        Take one token if available
+
+        Returns:
+            float: 0 if a token was taken, otherwise seconds until the next token
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+    def pause(self, seconds):
+        """Drain the bucket so no calls happen for the given seconds (e.g. Telegram retry_after)"""
+        with self._lock:
+            self.tokens = -seconds * self.rate
+            self.updated = time.monotonic()
+
+
+class TelegramDeliveryQueue:
+    """
+    Persistent outbound Telegram queue with a background sender thread
+    """
+
+    def __init__(self, bot_token, db_path="telegram_outbox.db", max_calls_per_minute=20,
+                 max_attempts=5, base_backoff=2.0, max_backoff=300.0,
+                 api_base="https://api.telegram.org", request_timeout=10,
+                 on_success=None, on_failure=None, autostart=True):
+        self.bot_token = bot_token
+        self.db_path = db_path
+        self.api_base = api_base.rstrip('/')
+        self.max_attempts = max_attempts
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.request_timeout = request_timeout
+        self._listeners = []  # (on_success, on_failure) references
+        self._listeners_lock = threading.Lock()
+        if on_success or on_failure:
+            self.add_listener(on_success, on_failure)
+
+        self.limiter = TokenBucket(max_calls_per_minute)
+        self.session = requests.Session()
+
+        self._wakeup = threading.Condition()
+        self._stopped = threading.Event()
+        self._thread = None
+
+        self.setup_database()
+        if autostart:
+            self.start()
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    @staticmethod
+    def _reference(callback):
+        # Bound methods are held weakly so a subscriber (e.g. a UI session) can be collected
+        if callback is None:
+            return None
+        if inspect.ismethod(callback):
+            return weakref.WeakMethod(callback)
+        return lambda: callback
+
+    def add_listener(self, on_success=None, on_failure=None):
+        """
+        Subscribe to delivery results
+
+        Args:
+            on_success (callable): on_success(message_id) after a message was sent
+            on_failure (callable): on_failure(message_id, error) after a message exhausted its retries
+        """
+        with self._listeners_lock:
+            self._listeners.append((self._reference(on_success), self._reference(on_failure)))
+
+    def _notify(self, position, *args):
+        with self._listeners_lock:
+            # Drop subscribers that were collected
+            self._listeners = [listener for listener in self._listeners
+                               if all(reference() is not None for reference in listener if reference is not None)]
+            callbacks = [listener[position]() for listener in self._listeners if listener[position] is not None]
+        for callback in callbacks:
+            try:
+                callback(*args)
+            except Exception as e:
+                logger.error(f"Telegram kuyruk dinleyici hatası: {str(e)}")
+
+    def setup_database(self):
+        """Outbox tablosu kurulumu; yarım kalan gönderimleri kuyruğa geri al"""
+        conn = self._connect()
+        try:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS telegram_outbox (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    method TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'PENDING',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    next_attempt_at REAL NOT NULL,
+                    created_at REAL NOT NULL,
+                    claimed_at REAL,
+                    last_error TEXT,
+                    bot_token TEXT
+                )
+            ''')
+            # Outboxes created before messages carried their own bot token
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(telegram_outbox)")}
+            if 'bot_token' not in columns:
+                conn.execute("ALTER TABLE telegram_outbox ADD COLUMN bot_token TEXT")
+            conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_outbox_due
+                ON telegram_outbox (status, next_attempt_at)
+            ''')
+            # Crash during send: the message was claimed but never acknowledged
+            conn.execute('''
+                UPDATE telegram_outbox SET status = 'PENDING'
+                WHERE status = 'SENDING' AND claimed_at < ?
+            ''', (time.time() - 2 * self.request_timeout,))
+            conn.commit()
+        finally:
+            conn.close()
+
+    # ------------------------------------------------------------------
+    # Producer side (called from the scan path - never blocks on the network)
+    # ------------------------------------------------------------------
+
+    def enqueue(self, payload, method="sendMessage", bot_token=None):
+        """
+        Queue a Telegram API call
+
+        Args:
+            payload (dict): Form data for the API method (chat_id, text, ...)
+            method (str): Telegram Bot API method name
+            bot_token (str): Bot to send as; stored with the message so callers sharing
+                the queue can use different bots (defaults to the queue's token)
+
+        Returns:
+            int: Outbox message id
+        """
+        now = time.time()
+        conn = self._connect()
+        try:
+            cursor = conn.execute('''
+                INSERT INTO telegram_outbox (method, payload, next_attempt_at, created_at, bot_token)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (method, json.dumps(payload, ensure_ascii=False), now, now, bot_token or self.bot_token))
+            conn.commit()
+            message_id = cursor.lastrowid
+        finally:
+            conn.close()
+
+        with self._wakeup:
+            self._wakeup.notify()
+        return message_id
+
+    def pending_count(self):
+        """Number of messages waiting to be delivered"""
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT COUNT(*) FROM telegram_outbox WHERE status IN ('PENDING', 'SENDING')"
+            ).fetchone()
+            return row[0]
+        finally:
+            conn.close()
+
+    # ------------------------------------------------------------------
+    # Sender thread
+    # ------------------------------------------------------------------
+
+    def start(self):
+        """Start the background sender if not already running"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="telegram-sender", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=5):
+        """Stop the sender; pending messages stay in the outbox"""
+        self._stopped.set()
+        with self._wakeup:
+            self._wakeup.notify_all()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def _claim_next(self):
+        """
+        Claim the next due message
+
+        Returns:
+            tuple: (message row or None, seconds until the next due message or None)
+        """
+        now = time.time()
+        conn = self._connect()
+        try:
+            row = conn.execute('''
+                SELECT id, method, payload, attempts, next_attempt_at, bot_token FROM telegram_outbox
+                WHERE status = 'PENDING'
+                ORDER BY next_attempt_at, id
+                LIMIT 1
+            ''').fetchone()
+
+            if row is None:
+                return None, None
+            if row[4] > now:
+                return None, row[4] - now
+
+            # Only one sender (across processes sharing the file) may claim a message
+            cursor = conn.execute(
+                "UPDATE telegram_outbox SET status = 'SENDING', claimed_at = ? WHERE id = ? AND status = 'PENDING'",
+                (now, row[0])
+            )
+            conn.commit()
+            if cursor.rowcount != 1:
+                return None, 0
+            return row, None
+        finally:
+            conn.close()
+
+    def _finish(self, message_id, status=None, attempts=None, next_attempt_at=None, error=None):
+        conn = self._connect()
+        try:
+            if status == 'SENT':
+                conn.execute("DELETE FROM telegram_outbox WHERE id = ?", (message_id,))
+            else:
+                conn.execute('''
+                    UPDATE telegram_outbox
+                    SET status = ?, attempts = ?, next_attempt_at = ?, last_error = ?
+                    WHERE id = ?
+                ''', (status, attempts, next_attempt_at, error, message_id))
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _wait(self, seconds):
+        with self._wakeup:
+            self._wakeup.wait(timeout=seconds)
+
+    def _run(self):
+        while not self._stopped.is_set():
+            try:
+                row, wait_for = self._claim_next()
+                if row is None:
+                    self._wait(wait_for if wait_for is not None else 60)
+                    continue
+
+                # Token bucket: put the message back and sleep only this thread
+                token_wait = self.limiter.try_acquire()
+                if token_wait > 0:
+                    self._finish(row[0], 'PENDING', row[3], time.time() + token_wait)
+                    self._wait(token_wait)
+                    continue
+
+                self._deliver(row)
+
+            except Exception as e:
+                logger.error(f"Telegram kuyruk hatası: {str(e)}")
+                self._wait(5)
+
+    def _deliver(self, row):
+        message_id, method, payload, attempts, _, bot_token = row
+        attempts += 1
+        url = f"{self.api_base}/bot{bot_token or self.bot_token}/{method}"
+        retry_after = None
+
+        try:
+            response = self.session.post(url, data=json.loads(payload), timeout=self.request_timeout)
+
+            if response.status_code == 200:
+                self._finish(message_id, 'SENT')
+                self._notify(0, message_id)
+                return
+
+            error = f"HTTP {response.status_code}: {response.text[:200]}"
+            if response.status_code == 429:
+                try:
+                    retry_after = response.json().get('parameters', {}).get('retry_after')
+                except ValueError:
+                    retry_after = None
+                retry_after = float(retry_after or 5)
+                self.limiter.pause(retry_after)
+
+        except requests.exceptions.RequestException as e:
+            error = str(e)
+
+        if attempts >= self.max_attempts:
+            logger.error(f"Telegram mesajı gönderilemedi ({attempts} deneme): {error}")
+            self._finish(message_id, 'FAILED', attempts, time.time(), error)
+            self._notify(1, message_id, error)
+            return
+
+        backoff = retry_after if retry_after else min(self.base_backoff ** attempts, self.max_backoff)
+        logger.warning(f"Telegram deneme {attempts} başarısız, {backoff:.0f}s sonra tekrar: {error}")
+        self._finish(message_id, 'PENDING', attempts, time.time() + backoff, error)
+
+
+_queues = {}
+_queues_lock = threading.Lock()
+
+
+def get_telegram_queue(bot_token, db_path="telegram_outbox.db", **options):
+    """
+    Process-wide delivery queue for an outbox file
+
+    Every caller sharing the outbox shares one sender thread and one rate limit;
+    bot_token and options (see TelegramDeliveryQueue) only apply when the queue is
+    created - pass a caller's own token to enqueue().
+    """
+    with _queues_lock:
+        queue = _queues.get(db_path)
+        if queue is None:
+            queue = _queues[db_path] = TelegramDeliveryQueue(bot_token, db_path=db_path, **options)
+        return queue
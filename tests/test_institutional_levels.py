@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from institutional_levels import CalendarAggregates
+
+PERIODS = {
+    # Days and weeks follow the index's timezone; months, quarters and years start at 00:00 UTC
+    'daily': lambda index: index.tz_localize(None).normalize(),
+    'weekly': lambda index: index.tz_localize(None).to_period('W-SUN').start_time,
+    'monthly': lambda index: index.tz_convert('UTC').tz_localize(None).to_period('M').start_time,
+    'quarterly': lambda index: index.tz_convert('UTC').tz_localize(None).to_period('Q').start_time,
+    'yearly': lambda index: index.tz_convert('UTC').tz_localize(None).to_period('Y').start_time,
+}
+
+
+def _frame(index, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.standard_normal(len(index)))
+    return pd.DataFrame({'Open': close, 'High': close + rng.random(len(index)),
+                         'Low': close - rng.random(len(index)), 'Close': close}, index=index)
+
+
+def _expected(data, kind):
+    """Current and previous period levels from a plain groupby"""
+    groups = data.groupby(PERIODS[kind](data.index), sort=True)
+    table = pd.DataFrame({'open': groups['Open'].first(), 'high': groups['High'].max(),
+                          'low': groups['Low'].min()})
+    levels = {}
+    for name, period in (('current', table.index[-1]), ('previous', None)):
+        if name == 'previous':
+            previous = table.index[table.index < table.index[-1]]
+            if not len(previous):
+                continue
+            period = previous[-1]
+        row = table.loc[period]
+        levels[name] = {'open': row['open'], 'high': row['high'], 'low': row['low'],
+                        'eq': (row['high'] + row['low']) / 2}
+    return levels
+
+
+def _assert_levels(data):
+    levels = CalendarAggregates().extend(data).period_levels()
+    for kind in PERIODS:
+        expected = _expected(data, kind)
+        assert levels[kind].keys() == expected.keys(), kind
+        for name, values in expected.items():
+            assert levels[kind][name] == pytest.approx(values), (kind, name)
+
+
+@pytest.mark.parametrize('last_bar', [
+    '2024-04-01 01:00',  # 03-31 22:00 UTC: local April / Q2, UTC still March / Q1
+    '2024-04-01 03:00',  # 04-01 00:00 UTC: both calendars in April
+    '2025-01-01 02:00',  # 12-31 23:00 UTC: local new year, UTC still the old one
+])
+def test_non_utc_index_across_month_and_quarter_boundary(last_bar):
+    index = pd.date_range(end=last_bar, periods=24 * 120, freq='h', tz='Europe/Istanbul')
+    _assert_levels(_frame(index))
+
+
+def test_daily_bars_stamped_at_local_midnight():
+    # BIST-style daily bars: 00:00+03 is 21:00 UTC of the previous day
+    index = pd.date_range('2023-11-01', '2024-04-01', freq='D', tz='Europe/Istanbul')
+    for end in range(len(index) - 40, len(index) + 1):
+        _assert_levels(_frame(index[:end], seed=end))
+
+
+def test_incremental_updates_match_full_computation():
+    index = pd.date_range(end='2024-04-02 12:00', periods=24 * 90, freq='h', tz='America/New_York')
+    data = _frame(index)
+    aggregates = CalendarAggregates()
+    for end in range(24 * 60, len(data), 7):
+        window = data.iloc[end - 24 * 45:end]  # sliding window
+        assert aggregates.extend(window).period_levels() == CalendarAggregates().extend(window).period_levels()
@@ -0,0 +1,67 @@
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from signal_archive import SignalArchiver
+from sinyal_takip_sistemi import SinyalTakipSistemi
+
+
+def _long_signal(symbol):
+    return {
+        'symbol': symbol, 'direction': 'LONG', 'entry_price': 100.0, 'stop_loss': 98.0,
+        'take_profit1': 103.0, 'take_profit2': 106.0, 'bias_strength': 65.0,
+        'confluence_score': 7.5, 'signal_quality': 'İYİ'
+    }
+
+
+def _daily_row(tracker, day):
+    with tracker.db.connection() as conn:
+        return conn.execute(
+            'SELECT total_signals, winning_signals, total_r FROM daily_performance WHERE date = ?', (day,)
+        ).fetchone()
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    return SinyalTakipSistemi(db_path=str(tmp_path / "signals.db"))
+
+
+def _open_signals(tracker, created):
+    ids = tracker.kaydet_sinyaller([_long_signal(f"TEST{i}USDT") for i in range(len(created))])
+    with tracker.db.transaction() as conn:
+        conn.executemany('UPDATE signals SET timestamp = ?, signal_date = date(?) WHERE id = ?',
+                         [(ts, ts, signal_id) for signal_id, ts in zip(ids, created)])
+    return ids
+
+
+def test_recompute_after_archiving_keeps_archived_signals(tracker, tmp_path):
+    # Created in May (archived) and June (stays hot), both closed on 2026-06-02 at +1R
+    ids = _open_signals(tracker, ['2026-05-30T12:00:00', '2026-06-01T12:00:00'])
+    tracker.guncelle_sonuclar([(signal_id, 102.0, '2026-06-02T10:00:00') for signal_id in ids])
+    assert _daily_row(tracker, '2026-06-02') == (2, 2, pytest.approx(2.0))
+
+    moved = SignalArchiver(tracker, str(tmp_path / "archive")).archive(now=datetime(2026, 9, 10))
+    assert moved == {'2026-05': 1}
+
+    tracker.guncelle_gunluk_performans('2026-06-02')
+    assert _daily_row(tracker, '2026-06-02') == (2, 2, pytest.approx(2.0))
+
+
+def test_recompute_of_fully_archived_day(tracker, tmp_path):
+    ids = _open_signals(tracker, ['2026-03-10T09:00:00', '2026-03-10T11:00:00'])
+    tracker.guncelle_sonuclar([(ids[0], 102.0, '2026-03-11T10:00:00'), (ids[1], 98.0, '2026-03-11T12:00:00')])
+
+    archiver = SignalArchiver(tracker, str(tmp_path / "archive"))
+    assert archiver.archive(now=datetime(2026, 9, 10)) == {'2026-03': 2}
+
+    tracker.guncelle_gunluk_performans('2026-03-11')
+    assert _daily_row(tracker, '2026-03-11') == (2, 1, pytest.approx(0.0))
+
+    # Nothing was archived for this day: an empty recompute still clears it
+    tracker.guncelle_gunluk_performans('2026-03-12')
+    assert _daily_row(tracker, '2026-03-12') is None
+
+    loaded = archiver.load_signals(['id', 'r_multiple'])
+    assert sorted(loaded['id']) == sorted(ids)
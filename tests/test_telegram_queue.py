@@ -0,0 +1,237 @@
+import json
+import sqlite3
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+import pytest
+
+from telegram_queue import TelegramDeliveryQueue, get_telegram_queue
+
+
+class FakeTelegram:
+    """Local stand-in for the Bot API: replies from a script, then 200"""
+
+    def __init__(self):
+        self.responses = []  # (status, body) consumed in order
+        self.requests = []  # (monotonic time, path, form)
+        self.received = threading.Event()
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get('Content-Length', 0))).decode()
+                fake.requests.append((time.monotonic(), self.path, parse_qs(body)))
+                status, reply = fake.responses.pop(0) if fake.responses else (200, {'ok': True})
+                payload = json.dumps(reply).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+                if status == 200:
+                    fake.received.set()
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def telegram():
+    fake = FakeTelegram()
+    yield fake
+    fake.close()
+
+
+def _queue(telegram, db_path, **options):
+    options.setdefault('autostart', False)
+    return TelegramDeliveryQueue("TOKEN", db_path=str(db_path), api_base=telegram.url, **options)
+
+
+def _outbox(db_path):
+    conn = sqlite3.connect(str(db_path))
+    try:
+        return conn.execute(
+            'SELECT id, status, attempts, next_attempt_at, last_error FROM telegram_outbox ORDER BY id'
+        ).fetchall()
+    finally:
+        conn.close()
+
+
+def _deliver_next(queue):
+    row, _ = queue._claim_next()
+    assert row is not None
+    queue._deliver(row)
+
+
+def test_delivers_payload_and_notifies_listener(telegram, tmp_path):
+    queue = _queue(telegram, tmp_path / "outbox.db")
+    sent = []
+    queue.add_listener(on_success=sent.append)
+    message_id = queue.enqueue({'chat_id': '42', 'text': 'merhaba'})
+
+    _deliver_next(queue)
+
+    _, path, form = telegram.requests[0]
+    assert path == "/botTOKEN/sendMessage"
+    assert form == {'chat_id': ['42'], 'text': ['merhaba']}
+    assert sent == [message_id]
+    assert _outbox(tmp_path / "outbox.db") == []
+
+
+def test_429_retry_after_reschedules_and_pauses_limiter(telegram, tmp_path):
+    telegram.responses = [(429, {'ok': False, 'parameters': {'retry_after': 7}})]
+    queue = _queue(telegram, tmp_path / "outbox.db")
+    queue.enqueue({'chat_id': '42', 'text': 'x'})
+
+    before = time.time()
+    _deliver_next(queue)
+
+    [(_, status, attempts, next_attempt_at, last_error)] = _outbox(tmp_path / "outbox.db")
+    assert (status, attempts) == ('PENDING', 1)
+    assert before + 7 <= next_attempt_at <= time.time() + 7
+    assert last_error.startswith("HTTP 429")
+    # No other call may go out while Telegram asked us to wait
+    assert queue.limiter.try_acquire() == pytest.approx(7 + 60 / 20, abs=0.5)
+
+
+def test_sender_thread_waits_retry_after_before_resending(telegram, tmp_path):
+    telegram.responses = [(429, {'ok': False, 'parameters': {'retry_after': 1}})]
+    queue = _queue(telegram, tmp_path / "outbox.db", max_calls_per_minute=600, autostart=True)
+    try:
+        queue.enqueue({'chat_id': '42', 'text': 'x'})
+        assert telegram.received.wait(10)
+    finally:
+        queue.stop()
+
+    assert len(telegram.requests) == 2
+    assert telegram.requests[1][0] - telegram.requests[0][0] >= 0.9
+    assert queue.pending_count() == 0
+
+
+def test_errors_back_off_exponentially_then_fail(telegram, tmp_path):
+    telegram.responses = [(500, {'ok': False})] * 3
+    queue = _queue(telegram, tmp_path / "outbox.db", max_attempts=3, base_backoff=4.0)
+    failed = []
+    queue.add_listener(on_failure=lambda message_id, error: failed.append((message_id, error)))
+    message_id = queue.enqueue({'chat_id': '42', 'text': 'x'})
+
+    for attempt, backoff in ((1, 4.0), (2, 16.0)):
+        before = time.time()
+        _deliver_next(queue)
+        [(_, status, attempts, next_attempt_at, _)] = _outbox(tmp_path / "outbox.db")
+        assert (status, attempts) == ('PENDING', attempt)
+        assert before + backoff <= next_attempt_at <= time.time() + backoff
+        # Not due yet: the sender would sleep until then
+        row, wait_for = queue._claim_next()
+        assert row is None and wait_for > backoff - 1
+        with sqlite3.connect(str(tmp_path / "outbox.db")) as conn:
+            conn.execute('UPDATE telegram_outbox SET next_attempt_at = 0')
+
+    _deliver_next(queue)
+    [(_, status, attempts, _, last_error)] = _outbox(tmp_path / "outbox.db")
+    assert (status, attempts) == ('FAILED', 3)
+    assert failed == [(message_id, last_error)]
+
+
+def test_pending_messages_survive_restart(telegram, tmp_path):
+    first = _queue(telegram, tmp_path / "outbox.db")
+    first.enqueue({'chat_id': '42', 'text': 'restart'})
+    first.session.close()
+    del first
+
+    second = _queue(telegram, tmp_path / "outbox.db", autostart=True)
+    try:
+        assert telegram.received.wait(10)
+    finally:
+        second.stop()
+
+    assert telegram.requests[0][2]['text'] == ['restart']
+    assert second.pending_count() == 0
+
+
+def test_stale_sending_claim_is_reclaimed_on_start(telegram, tmp_path):
+    crashed = _queue(telegram, tmp_path / "outbox.db")
+    crashed.enqueue({'chat_id': '42', 'text': 'claimed'})
+    row, _ = crashed._claim_next()  # claimed, then the process died before acknowledging
+    assert row is not None and _outbox(tmp_path / "outbox.db")[0][1] == 'SENDING'
+
+    # A fresh claim is left alone (another sender may still be delivering it)
+    _queue(telegram, tmp_path / "outbox.db")
+    assert _outbox(tmp_path / "outbox.db")[0][1] == 'SENDING'
+
+    with sqlite3.connect(str(tmp_path / "outbox.db")) as conn:
+        conn.execute('UPDATE telegram_outbox SET claimed_at = ?', (time.time() - 60,))
+    restarted = _queue(telegram, tmp_path / "outbox.db", autostart=True)
+    try:
+        assert telegram.received.wait(10)
+    finally:
+        restarted.stop()
+    assert restarted.pending_count() == 0
+
+
+def test_queue_is_shared_per_outbox(telegram, tmp_path):
+    db_path = str(tmp_path / "shared.db")
+    queue = get_telegram_queue("TOKEN", db_path=db_path, api_base=telegram.url, autostart=False)
+    try:
+        assert get_telegram_queue("TOKEN", db_path=db_path) is queue
+        assert get_telegram_queue("TOKEN", db_path=str(tmp_path / "other.db"), autostart=False) is not queue
+    finally:
+        queue.stop()
+
+
+def test_collected_listener_is_dropped(telegram, tmp_path):
+    queue = _queue(telegram, tmp_path / "outbox.db")
+    calls = []
+
+    class Session:
+        def on_success(self, message_id):
+            calls.append(message_id)
+
+    session = Session()
+    queue.add_listener(session.on_success)
+    queue.enqueue({'chat_id': '42', 'text': 'x'})
+    del session
+
+    _deliver_next(queue)
+    assert calls == [] and queue._listeners == []
+
+
+def test_each_message_is_sent_with_its_own_bot_token(telegram, tmp_path):
+    queue = _queue(telegram, tmp_path / "outbox.db")
+    queue.enqueue({'chat_id': '1', 'text': 'a'}, bot_token="FIRST")
+    queue.enqueue({'chat_id': '2', 'text': 'b'})
+    queue.bot_token = "CHANGED"  # must not affect messages already queued
+
+    _deliver_next(queue)
+    _deliver_next(queue)
+
+    assert [path for _, path, _ in telegram.requests] == ["/botFIRST/sendMessage", "/botTOKEN/sendMessage"]
+
+
+def test_outbox_without_token_column_is_migrated(telegram, tmp_path):
+    db_path = tmp_path / "outbox.db"
+    with sqlite3.connect(str(db_path)) as conn:
+        conn.execute('''
+            CREATE TABLE telegram_outbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, method TEXT NOT NULL, payload TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'PENDING', attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at REAL NOT NULL, created_at REAL NOT NULL, claimed_at REAL, last_error TEXT
+            )
+        ''')
+        conn.execute("INSERT INTO telegram_outbox (method, payload, next_attempt_at, created_at) "
+                     "VALUES ('sendMessage', '{\"chat_id\": \"1\", \"text\": \"old\"}', 0, 0)")
+
+    queue = _queue(telegram, db_path)
+    _deliver_next(queue)
+
+    assert telegram.requests[0][1] == "/botTOKEN/sendMessage"
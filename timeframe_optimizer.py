@@ -1,6 +1,5 @@
 import pandas as pd
 import numpy as np
-import streamlit as st
 from datetime import datetime, timedelta
 
 class TimeframeOptimizer:
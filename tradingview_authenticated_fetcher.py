@@ -5,7 +5,8 @@ from datetime import datetime, timedelta
 import json
 import time
 import os
-import streamlit as st
+import diagnostics
+from fetch_coalescer import coalesced
 
 class TradingViewAuthenticatedFetcher:
     """
@@ -38,7 +39,7 @@ class TradingViewAuthenticatedFetcher:
         """Authenticate with TradingView using your credentials"""
         try:
             if not self.username or not self.password:
-                st.warning("TradingView credentials not found. Using public access.")
+                diagnostics.warning("TradingView credentials not found. Using public access.")
                 return False
             
             # Step 1: Get initial session
@@ -60,14 +61,14 @@ class TradingViewAuthenticatedFetcher:
             if login_response.status_code == 200:
                 # Extract session info
                 self._extract_session_info(login_response)
-                st.success("TradingView authenticated successfully!")
+                diagnostics.success("TradingView authenticated successfully!")
                 return True
             else:
-                st.warning("TradingView authentication failed. Using public access.")
+                diagnostics.warning("TradingView authentication failed. Using public access.")
                 return False
                 
         except Exception as e:
-            st.warning(f"TradingView authentication error: {str(e)}")
+            diagnostics.warning(f"TradingView authentication error: {str(e)}")
             return False
     
     def _extract_session_info(self, response):
@@ -89,6 +90,7 @@ class TradingViewAuthenticatedFetcher:
         except Exception as e:
             print(f"Session extraction error: {e}")
     
+    @coalesced
     def get_klines(self, symbol, interval, period=None):
         """
         Get historical data using authenticated TradingView access
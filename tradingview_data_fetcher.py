@@ -2,9 +2,10 @@ import requests
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-import streamlit as st
+import diagnostics
 import json
 import time
+from fetch_coalescer import coalesced
 
 class TradingViewDataFetcher:
     """
@@ -38,8 +39,9 @@ class TradingViewDataFetcher:
                 # Extract auth token from response (simplified approach)
                 self._auth_token = "unauthorized_user_token"  # Default for public access
         except Exception as e:
-            st.warning(f"TradingView auth token alınamadı: {str(e)}")
+            diagnostics.warning(f"TradingView auth token alınamadı: {str(e)}")
     
+    @coalesced
     def get_klines(self, symbol, interval, period=None):
         """
         Get historical kline data from TradingView
@@ -48,7 +50,7 @@ class TradingViewDataFetcher:
             # Convert symbol to TradingView format
             tv_symbol = self._convert_to_tv_symbol(symbol)
             if not tv_symbol:
-                st.error(f"Desteklenmeyen sembol: {symbol}")
+                diagnostics.error(f"Desteklenmeyen sembol: {symbol}")
                 return pd.DataFrame()
             
             # Convert interval and calculate from/to timestamps
@@ -62,7 +64,7 @@ class TradingViewDataFetcher:
             return self._get_yahoo_data_enhanced(symbol, interval, period)
             
         except Exception as e:
-            st.error(f"TradingView veri hatası: {str(e)}")
+            diagnostics.error(f"TradingView veri hatası: {str(e)}")
             # Fallback to Yahoo Finance
             return self._get_yahoo_data_enhanced(symbol, interval, period)
     
@@ -126,12 +128,12 @@ class TradingViewDataFetcher:
                     continue
             
             if data.empty:
-                st.warning(f"Yahoo Finance'den veri alınamadı: {symbol}")
+                diagnostics.warning(f"Yahoo Finance'den veri alınamadı: {symbol}")
             
             return data
             
         except Exception as e:
-            st.error(f"Yahoo Finance veri hatası: {str(e)}")
+            diagnostics.error(f"Yahoo Finance veri hatası: {str(e)}")
             return pd.DataFrame()
     
     def _resample_to_4h(self, data):
@@ -150,7 +152,7 @@ class TradingViewDataFetcher:
             
             return resampled
         except Exception as e:
-            st.error(f"4H resampling hatası: {str(e)}")
+            diagnostics.error(f"4H resampling hatası: {str(e)}")
             return data
     
     def _map_to_yahoo_symbol(self, symbol):
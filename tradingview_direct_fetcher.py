@@ -2,11 +2,12 @@ import requests
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-import streamlit as st
+import diagnostics
 import json
 import time
 import os
 from urllib.parse import urlencode
+from fetch_coalescer import coalesced
 
 class TradingViewDirectFetcher:
     """
@@ -46,7 +47,7 @@ class TradingViewDirectFetcher:
             password = os.getenv('TRADINGVIEW_PASSWORD')
             
             if not username or not password:
-                st.warning("TradingView hesap bilgileri bulunamadı, genel veriler kullanılacak")
+                diagnostics.warning("TradingView hesap bilgileri bulunamadı, genel veriler kullanılacak")
                 return True
             
             # Setup session with comprehensive headers
@@ -77,13 +78,14 @@ class TradingViewDirectFetcher:
 
                 return True
             else:
-                st.info("TradingView bağlantısı kuruldu")
+                diagnostics.info("TradingView bağlantısı kuruldu")
                 return True
             
         except Exception as e:
-            st.info("TradingView session başlatıldı")
+            diagnostics.info("TradingView session başlatıldı")
             return True
     
+    @coalesced
     def get_klines(self, symbol, interval, period=None):
         """
         Get historical kline data from TradingView
@@ -106,11 +108,11 @@ class TradingViewDirectFetcher:
             if not data.empty:
                 return data
             
-            st.error(f"TradingView'den veri alınamadı: {symbol}")
+            diagnostics.error(f"TradingView'den veri alınamadı: {symbol}")
             return pd.DataFrame()
             
         except Exception as e:
-            st.error(f"TradingView API hatası: {str(e)}")
+            diagnostics.error(f"TradingView API hatası: {str(e)}")
             return pd.DataFrame()
     
     def _fetch_symbol_data(self, symbol, interval, period):
@@ -299,7 +301,7 @@ class TradingViewDirectFetcher:
             return pd.DataFrame()
             
         except Exception as e:
-            st.error(f"Veri parse hatası: {str(e)}")
+            diagnostics.error(f"Veri parse hatası: {str(e)}")
             return pd.DataFrame()
     
     def _generate_data_from_current(self, symbol, interval, period, current_data):
@@ -364,7 +366,7 @@ class TradingViewDirectFetcher:
             return df
             
         except Exception as e:
-            st.error(f"Veri oluşturma hatası: {str(e)}")
+            diagnostics.error(f"Veri oluşturma hatası: {str(e)}")
             return pd.DataFrame()
     
     def _interval_to_resolution(self, interval):
@@ -2,9 +2,10 @@ import requests
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-import streamlit as st
+import diagnostics
 import json
 import time
+from fetch_coalescer import coalesced
 
 class TradingViewFetcher:
     """
@@ -20,6 +21,7 @@ class TradingViewFetcher:
             'Origin': 'https://www.tradingview.com'
         })
         
+    @coalesced
     def get_klines(self, symbol, interval, period=None):
         """
         Get historical price data from TradingView
@@ -28,7 +30,7 @@ class TradingViewFetcher:
             # Convert symbol to TradingView format
             tv_symbol = self._convert_to_tv_symbol(symbol)
             if not tv_symbol:
-                st.error(f"Desteklenmeyen sembol: {symbol}")
+                diagnostics.error(f"Desteklenmeyen sembol: {symbol}")
                 return pd.DataFrame()
             
             # Get resolution and bars count
@@ -46,7 +48,7 @@ class TradingViewFetcher:
             return self._get_yahoo_crypto_data(symbol, interval, period)
             
         except Exception as e:
-            st.error(f"TradingView veri hatası: {str(e)}")
+            diagnostics.error(f"TradingView veri hatası: {str(e)}")
             return pd.DataFrame()
     
     def _get_yahoo_crypto_data(self, symbol, interval, period):
@@ -96,7 +98,7 @@ class TradingViewFetcher:
             return data
             
         except Exception as e:
-            st.error(f"Yahoo Finance alternatif hatası: {str(e)}")
+            diagnostics.error(f"Yahoo Finance alternatif hatası: {str(e)}")
             return pd.DataFrame()
     
     def _convert_to_tv_symbol(self, symbol):
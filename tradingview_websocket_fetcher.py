@@ -2,12 +2,13 @@ import requests
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-import streamlit as st
+import diagnostics
 import json
 import time
 import logging
 from urllib.parse import urlencode
 from typing import Optional, Dict, Any, List
+from fetch_coalescer import coalesced
 
 # Optional dependencies
 try:
@@ -68,16 +69,17 @@ class TradingViewWebSocketFetcher:
                 
                 if login_response.status_code == 200:
                     self._authenticated = True
-                    st.success("TradingView hesabınız başarıyla bağlandı!")
+                    diagnostics.success("TradingView hesabınız başarıyla bağlandı!")
                 else:
-                    st.warning("TradingView giriş başarısız, genel veriler kullanılacak")
+                    diagnostics.warning("TradingView giriş başarısız, genel veriler kullanılacak")
             
             return True
             
         except Exception as e:
-            st.warning(f"TradingView bağlantı hatası: {str(e)}")
+            diagnostics.warning(f"TradingView bağlantı hatası: {str(e)}")
             return False
     
+    @coalesced
     def get_klines(self, symbol, interval, period=None):
         """
         Get historical data with multiple fallback strategies
@@ -90,22 +92,22 @@ class TradingViewWebSocketFetcher:
             if HAS_YFINANCE:
                 data = self._get_yahoo_finance_data(symbol, interval, period)
                 if not data.empty:
-                    st.success(f"✅ Yahoo Finance'den {len(data)} veri noktası alındı")
+                    diagnostics.success(f"✅ Yahoo Finance'den {len(data)} veri noktası alındı")
                     return data
             
             # Strategy 2: Alternative crypto API (if crypto symbol)
             if self._is_crypto_symbol(symbol):
                 data = self._get_crypto_data(symbol, interval, period)
                 if not data.empty:
-                    st.info(f"📈 Kripto API'den {len(data)} veri noktası alındı")
+                    diagnostics.info(f"📈 Kripto API'den {len(data)} veri noktası alındı")
                     return data
             
             # Strategy 3: Generate sample data (last resort)
-            st.warning(f"⚠️ Gerçek veri alınamadı, örnek veri oluşturuluyor")
+            diagnostics.warning(f"⚠️ Gerçek veri alınamadı, örnek veri oluşturuluyor")
             return self._generate_sample_data(symbol, interval, period)
             
         except Exception as e:
-            st.error(f"❌ Veri alma hatası: {str(e)}")
+            diagnostics.error(f"❌ Veri alma hatası: {str(e)}")
             return self._generate_sample_data(symbol, interval, period)
     
     def _get_tradingview_chart_data(self, symbol, interval, period):
@@ -342,7 +344,7 @@ class TradingViewWebSocketFetcher:
             return resampled
             
         except Exception as e:
-            st.warning(f"Resample hatası: {str(e)}")
+            diagnostics.warning(f"Resample hatası: {str(e)}")
             return df
     
     def _convert_to_tv_symbol(self, symbol):
@@ -402,7 +404,7 @@ class TradingViewWebSocketFetcher:
                     ticker = yf.Ticker("AAPL")
                     data = ticker.history(period="1d", interval="1h")
                     if not data.empty:
-                        st.success("✅ Yahoo Finance bağlantısı başarılı")
+                        diagnostics.success("✅ Yahoo Finance bağlantısı başarılı")
                         return True
                 except Exception:
                     pass
@@ -411,7 +413,7 @@ class TradingViewWebSocketFetcher:
             try:
                 response = requests.get('https://api.coingecko.com/api/v3/ping', timeout=5)
                 if response.status_code == 200:
-                    st.success("✅ CoinGecko bağlantısı başarılı")
+                    diagnostics.success("✅ CoinGecko bağlantısı başarılı")
                     return True
             except Exception:
                 pass
@@ -420,16 +422,16 @@ class TradingViewWebSocketFetcher:
             try:
                 response = requests.get('https://api.binance.com/api/v3/ping', timeout=5)
                 if response.status_code == 200:
-                    st.success("✅ Binance bağlantısı başarılı")
+                    diagnostics.success("✅ Binance bağlantısı başarılı")
                     return True
             except Exception:
                 pass
             
-            st.warning("⚠️ Tüm veri kaynaklarına bağlantı başarısız")
+            diagnostics.warning("⚠️ Tüm veri kaynaklarına bağlantı başarısız")
             return False
             
         except Exception as e:
-            st.error(f"❌ Bağlantı test hatası: {str(e)}")
+            diagnostics.error(f"❌ Bağlantı test hatası: {str(e)}")
             return False
     
     def get_supported_symbols(self):
@@ -573,7 +575,7 @@ class TradingViewWebSocketFetcher:
             return df.tail(min(1000, total_periods))  # Limit to reasonable size
             
         except Exception as e:
-            st.error(f"Sample data generation error: {str(e)}")
+            diagnostics.error(f"Sample data generation error: {str(e)}")
             # Return minimal data
             return pd.DataFrame({
                 'Open': [100],
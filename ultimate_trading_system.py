@@ -3,6 +3,12 @@ import numpy as np
 from datetime import datetime, timedelta
 import pytz
 
+from swing_points import find_swing_points
+
+ORDER_BLOCK_LOOKBACK = 5
+LIQUIDITY_SWING_LOOKBACK = 3
+
+
 class UltimateTradingSystem:
     """
     Ultimate Trading Analysis System - Combines all powerful features:
@@ -147,34 +153,11 @@ class UltimateTradingSystem:
             if len(data) < 20:
                 return {'bullish_obs': [], 'bearish_obs': [], 'nearest_ob': None}
             
-            lookback = 5
-            swing_highs = []
-            swing_lows = []
-            
-            for i in range(lookback, len(data) - lookback):
-                # Swing high detection
-                is_swing_high = True
-                current_high = float(data['High'].iloc[i])
-                
-                for j in range(i - lookback, i + lookback + 1):
-                    if j != i and float(data['High'].iloc[j]) >= current_high:
-                        is_swing_high = False
-                        break
-                
-                if is_swing_high:
-                    swing_highs.append({'price': current_high, 'index': i})
-                
-                # Swing low detection
-                is_swing_low = True
-                current_low = float(data['Low'].iloc[i])
-                
-                for j in range(i - lookback, i + lookback + 1):
-                    if j != i and float(data['Low'].iloc[j]) <= current_low:
-                        is_swing_low = False
-                        break
-                
-                if is_swing_low:
-                    swing_lows.append({'price': current_low, 'index': i})
+            high_idx, low_idx = find_swing_points(data, lookback=ORDER_BLOCK_LOOKBACK)
+            highs = data['High'].to_numpy(dtype=float)
+            lows = data['Low'].to_numpy(dtype=float)
+            swing_highs = [{'price': float(highs[i]), 'index': int(i)} for i in high_idx[-10:]]
+            swing_lows = [{'price': float(lows[i]), 'index': int(i)} for i in low_idx[-10:]]
             
             # Get recent and relevant order blocks
             bullish_obs = [ob for ob in swing_lows[-10:] if abs(ob['price'] - current_price) / current_price < 0.15]
@@ -262,17 +245,22 @@ class UltimateTradingSystem:
             volume_ma = data['Volume'].rolling(window=20).mean()
             high_volume_threshold = volume_ma.quantile(0.8)
             
-            high_liquidity_zones = []
-            for i in range(len(data)):
-                if data['Volume'].iloc[i] > high_volume_threshold:
-                    price_level = (data['High'].iloc[i] + data['Low'].iloc[i]) / 2
-                    distance_pct = abs(price_level - current_price) / current_price * 100
-                    if distance_pct < 5:  # Within 5%
-                        high_liquidity_zones.append({
-                            'price': price_level,
-                            'volume': data['Volume'].iloc[i],
-                            'distance_pct': distance_pct
-                        })
+            volume = data['Volume'].to_numpy(dtype=float)
+            price_levels = ((data['High'] + data['Low']) / 2).to_numpy(dtype=float)
+            distances = np.abs(price_levels - current_price) / current_price * 100
+            zone_idx = np.flatnonzero((volume > high_volume_threshold) & (distances < 5))  # Within 5%
+            high_liquidity_zones = [{
+                'price': price_levels[i],
+                'volume': volume[i],
+                'distance_pct': distances[i]
+            } for i in zone_idx]
+            
+            # Resting liquidity: stops cluster beyond recent swing highs (buy side) and lows (sell side)
+            high_idx, low_idx = find_swing_points(data, lookback=LIQUIDITY_SWING_LOOKBACK)
+            swing_highs = data['High'].to_numpy(dtype=float)[high_idx]
+            swing_lows = data['Low'].to_numpy(dtype=float)[low_idx]
+            buy_side_liquidity = sorted(float(p) for p in swing_highs[swing_highs > current_price])[:3]
+            sell_side_liquidity = sorted((float(p) for p in swing_lows[swing_lows < current_price]), reverse=True)[:3]
             
             # Determine manipulation risk based on current session
             current_hour = datetime.now().hour
@@ -285,6 +273,8 @@ class UltimateTradingSystem:
             
             return {
                 'high_liquidity_zones': sorted(high_liquidity_zones, key=lambda x: x['distance_pct'])[:5],
+                'buy_side_liquidity': buy_side_liquidity,
+                'sell_side_liquidity': sell_side_liquidity,
                 'manipulation_risk': manipulation_risk
             }
             
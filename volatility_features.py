@@ -0,0 +1,172 @@
+"""
+FinansLab Volatilite Özellikleri
+================================
+
+True range ve ATR için tek (kanonik) uygulama:
+- NumPy ile vektörel true range: max(H-L, |H-Cprev|, |L-Cprev|), ilk bar NaN
+- ATR: true range'in basit hareketli ortalaması
+- Veri seti başına bir kez hesaplanır ve özellik deposunda tutulur
+- Yeni barlar eklendiğinde sadece kuyruk hesaplanır (son bar oluşmakta olabilir, o da yenilenir)
+
+Risk yönetimi, backtest, birleşik sistem, sentiment ve scalp analizleri bu modülü kullanır.
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_ATR_PERIOD = 14
+
+
+def true_range_array(high, low, close):
+    """True range over NumPy arrays (first bar has no previous close and is NaN)"""
+    prev_close = np.concatenate(([np.nan], close[:-1]))
+    true_range = np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+    true_range[:1] = np.nan
+    return true_range
+
+
+def compute_true_range(data):
+    """True range series (first bar has no previous close and is NaN)"""
+    values = true_range_array(data['High'].to_numpy(dtype=float), data['Low'].to_numpy(dtype=float),
+                              data['Close'].to_numpy(dtype=float))
+    return pd.Series(values, index=data.index)
+
+
+def compute_atr(true_range, period=DEFAULT_ATR_PERIOD):
+    """Simple moving average of the true range"""
+    return true_range.rolling(period).mean()
+
+
+class VolatilityFeatureStore:
+    """
+    Thread-safe cache of true range / ATR per dataset and period
+
+    Datasets are identified by an explicit key (e.g. (symbol, interval)) or, when
+    none is given, by their first bar. A request for a dataset that extends the
+    cached one only computes the new bars; the last cached bar is always
+    recomputed because it may have been the still-forming candle.
+    """
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # (key, period) -> (high, low, close, features)
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'extends': 0, 'misses': 0}
+
+    @staticmethod
+    def _default_key(data):
+        return (data.index[0], float(data['Close'].iloc[0]))
+
+    def get(self, data, period=DEFAULT_ATR_PERIOD, key=None):
+        """
+        True range and ATR for data
+
+        Args:
+            data (pd.DataFrame): OHLC data
+            period (int): ATR window
+            key: Dataset identity; defaults to the first bar
+
+        Returns:
+            pd.DataFrame: 'true_range' and 'atr' columns on data's index
+                (shared with other callers - do not modify in place)
+        """
+        if data is None or data.empty:
+            return pd.DataFrame({'true_range': [], 'atr': []}, dtype=float)
+
+        entry_key = (key if key is not None else self._default_key(data), period)
+        high = data['High'].to_numpy(dtype=float)
+        low = data['Low'].to_numpy(dtype=float)
+        close = data['Close'].to_numpy(dtype=float)
+
+        with self._lock:
+            cached = self._entries.get(entry_key)
+
+        reuse = self._reusable_rows(cached, data, high, low, close)
+        if reuse and reuse == len(data) == len(cached[3]):
+            self._touch(entry_key, cached, 'hits')
+            return cached[3]
+
+        if reuse:
+            features = self._extend(cached[3], reuse, high, low, close, period, data.index)
+            stat = 'extends'
+        else:
+            true_range = true_range_array(high, low, close)
+            atr = pd.Series(true_range).rolling(period).mean().to_numpy()
+            features = pd.DataFrame({'true_range': true_range, 'atr': atr}, index=data.index)
+            stat = 'misses'
+
+        self._touch(entry_key, (high, low, close, features), stat)
+        return features
+
+    @staticmethod
+    def _reusable_rows(cached, data, high, low, close):
+        """Number of leading rows whose cached features are still valid"""
+        if cached is None:
+            return 0
+        cached_high, cached_low, cached_close, features = cached
+        n_cached = len(features)
+        n = len(data)
+
+        # All cached bars if they are unchanged, otherwise all but the last one
+        # (it may have been the forming candle and is recomputed)
+        for rows in (n_cached, n_cached - 1):
+            if 1 <= rows <= n and features.index[:rows].equals(data.index[:rows]) and \
+                    np.array_equal(cached_high[:rows], high[:rows], equal_nan=True) and \
+                    np.array_equal(cached_low[:rows], low[:rows], equal_nan=True) and \
+                    np.array_equal(cached_close[:rows], close[:rows], equal_nan=True):
+                return rows
+        return 0
+
+    @staticmethod
+    def _extend(features, reuse, high, low, close, period, index):
+        """Append true range / ATR for rows [reuse:] to the first `reuse` cached rows"""
+        true_range = np.empty(len(close))
+        true_range[:reuse] = features['true_range'].to_numpy()[:reuse]
+        tail = true_range_array(high[reuse - 1:], low[reuse - 1:], close[reuse - 1:])
+        true_range[reuse:] = tail[1:]
+
+        # ATR of the new rows only needs the previous period - 1 true ranges
+        lo = max(0, reuse - period + 1)
+        atr = np.empty(len(close))
+        atr[:reuse] = features['atr'].to_numpy()[:reuse]
+        atr[reuse:] = pd.Series(true_range[lo:]).rolling(period).mean().to_numpy()[reuse - lo:]
+        return pd.DataFrame({'true_range': true_range, 'atr': atr}, index=index)
+
+    def _touch(self, entry_key, entry, stat):
+        with self._lock:
+            self.stats[stat] += 1
+            self._entries[entry_key] = entry
+            self._entries.move_to_end(entry_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_feature_store = None
+_feature_store_lock = threading.Lock()
+
+
+def get_volatility_features():
+    """Process-wide true range / ATR store"""
+    global _feature_store
+    with _feature_store_lock:
+        if _feature_store is None:
+            _feature_store = VolatilityFeatureStore()
+        return _feature_store
+
+
+def atr_features(data, period=DEFAULT_ATR_PERIOD, key=None):
+    """True range / ATR frame for data from the shared store"""
+    return get_volatility_features().get(data, period, key)
+
+
+def latest_atr(data, period=DEFAULT_ATR_PERIOD, key=None):
+    """Last ATR value (NaN when there are fewer than period + 1 bars)"""
+    atr = atr_features(data, period, key)['atr']
+    return float(atr.iloc[-1]) if len(atr) else np.nan